@@ -0,0 +1,72 @@
+# Copyright (c) Facebook, Inc. and its affiliates. All Rights Reserved
+"""
+Config composition: ConfigLoaderImpl.load_configuration and load_sweep_config on generated config trees
+"""
+import itertools
+from typing import Any, List
+
+from hydra._internal.config_loader_impl import ConfigLoaderImpl
+from hydra._internal.core_plugins.file_config_source import FileConfigSource
+from hydra._internal.utils import create_config_search_path
+
+
+def create_config_loader(config_dir: str, cache_size: int = 32) -> ConfigLoaderImpl:
+    return ConfigLoaderImpl(
+        config_search_path=create_config_search_path(config_dir), cache_size=cache_size,
+    )
+
+
+def bench_load_configuration_cold(benchmark: Any, config_tree: Any) -> None:
+    # new loader and no parsed config files, like the first composition of an app
+    def load() -> None:
+        FileConfigSource.parsed_cache.clear()
+        config_loader = create_config_loader(config_tree.path)
+        config_loader.load_configuration(config_name="config", overrides=[])
+
+    benchmark(load)
+    FileConfigSource.parsed_cache.clear()
+
+
+def bench_load_configuration(benchmark: Any, config_tree: Any) -> None:
+    # warm loader, every composition is done from scratch
+    config_loader = create_config_loader(config_tree.path, cache_size=0)
+    overrides = [f"{config_tree.group(0)}=o1", "foo=10"]
+    config_loader.load_configuration(config_name="config", overrides=overrides)
+    benchmark(config_loader.load_configuration, "config", overrides)
+
+
+def bench_load_configuration_cached(benchmark: Any, config_tree: Any) -> None:
+    # same composition again, served from the composition cache
+    config_loader = create_config_loader(config_tree.path)
+    config_loader.load_configuration(config_name="config", overrides=[])
+    benchmark(config_loader.load_configuration, "config", [])
+
+
+def bench_load_sweep_config(benchmark: Any, config_tree: Any) -> None:
+    # a sweep over a value, each job has a different composition
+    config_loader = create_config_loader(config_tree.path)
+    master_config = config_loader.load_configuration(config_name="config", overrides=[])
+    values = itertools.count()
+
+    def load() -> None:
+        config_loader.load_sweep_config(master_config, [f"foo={next(values)}"])
+
+    benchmark(load)
+
+
+def bench_load_sweep_config_groups(benchmark: Any, config_tree: Any) -> None:
+    # a sweep over a value and the options of a group
+    config_loader = create_config_loader(config_tree.path)
+    master_config = config_loader.load_configuration(config_name="config", overrides=[])
+    group = config_tree.group(0)
+    jobs = (
+        [f"{group}=o{option}", f"foo={value}"]
+        for value in itertools.count()
+        for option in range(config_tree.num_options)
+    )
+
+    def load() -> None:
+        overrides: List[str] = next(jobs)
+        config_loader.load_sweep_config(master_config, overrides)
+
+    benchmark(load)
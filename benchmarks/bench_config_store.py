@@ -0,0 +1,64 @@
+# Copyright (c) Facebook, Inc. and its affiliates. All Rights Reserved
+"""
+ConfigStore: storing and loading many structured configs
+"""
+from dataclasses import field, make_dataclass
+from typing import Any, List
+
+from hydra.core.config_store import ConfigStore
+
+NUM_CONFIGS = 200
+
+
+def make_dataclasses(num: int, num_fields: int = 20) -> List[Any]:
+    """
+    :return: num generated dataclasses, each with num_fields fields and a nested dataclass
+    """
+    nested_fields: List[Any] = [
+        (f"n{idx}", int, field(default=idx)) for idx in range(10)
+    ]
+    nested = make_dataclass("Nested", nested_fields)
+    classes = []
+    for cls in range(num):
+        fields: List[Any] = [
+            (f"f{idx}", int, field(default=idx)) for idx in range(num_fields)
+        ]
+        fields.append(("nested", nested, field(default_factory=nested)))
+        classes.append(make_dataclass(f"Config{cls}", fields))
+    return classes
+
+
+def store(classes: List[Any]) -> None:
+    cs = ConfigStore.instance()
+    for idx, cls in enumerate(classes):
+        cs.store(group=f"bench/group{idx % 10}", name=f"config{idx}", node=cls)
+
+
+def bench_store(benchmark: Any) -> None:
+    benchmark(store, make_dataclasses(NUM_CONFIGS))
+
+
+def bench_load(benchmark: Any) -> None:
+    # the first load of a structured config converts it, store again before each round
+    classes = make_dataclasses(NUM_CONFIGS)
+    cs = ConfigStore.instance()
+
+    def load() -> None:
+        for idx in range(len(classes)):
+            cs.load(f"bench/group{idx % 10}/config{idx}.yaml")
+
+    benchmark.pedantic(load, setup=lambda: store(classes), rounds=10)
+
+
+def bench_load_converted(benchmark: Any) -> None:
+    # loads of configs already converted to config nodes
+    classes = make_dataclasses(NUM_CONFIGS)
+    store(classes)
+    cs = ConfigStore.instance()
+
+    def load() -> None:
+        for idx in range(len(classes)):
+            cs.load(f"bench/group{idx % 10}/config{idx}.yaml")
+
+    load()
+    benchmark(load)
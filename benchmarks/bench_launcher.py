@@ -0,0 +1,40 @@
+# Copyright (c) Facebook, Inc. and its affiliates. All Rights Reserved
+"""
+Launch overhead: BasicLauncher running jobs with a no-op task
+"""
+from pathlib import Path
+from typing import Any
+
+import pytest
+from omegaconf import DictConfig
+
+from hydra._internal.config_loader_impl import ConfigLoaderImpl
+from hydra._internal.core_plugins.basic_launcher import BasicLauncher
+from hydra._internal.utils import create_config_search_path
+from hydra.core.hydra_config import HydraConfig
+
+
+def noop_task(cfg: DictConfig) -> None:
+    pass
+
+
+@pytest.mark.parametrize("num_jobs", [1, 20])  # type: ignore
+def bench_basic_launcher(
+    benchmark: Any, small_config_tree: Any, tmp_path: Path, num_jobs: int
+) -> None:
+    # each round launches num_jobs jobs, divide by num_jobs for the overhead of a single job
+    config_loader = ConfigLoaderImpl(
+        config_search_path=create_config_search_path(small_config_tree.path)
+    )
+    config = config_loader.load_configuration(
+        config_name="config",
+        overrides=[f"hydra.sweep.dir={tmp_path / 'sweep'}"],
+        strict=False,
+    )
+    HydraConfig.instance().set_config(config)
+    launcher = BasicLauncher()
+    launcher.setup(config=config, config_loader=config_loader, task_function=noop_task)
+    job_overrides = [[f"foo={idx}"] for idx in range(num_jobs)]
+
+    benchmark(launcher.launch, job_overrides, 0)
+    benchmark.extra_info["num_jobs"] = num_jobs
@@ -0,0 +1,54 @@
+# Copyright (c) Facebook, Inc. and its affiliates. All Rights Reserved
+"""
+Plugins discovery
+"""
+from pathlib import Path
+from typing import Any, Optional, Type
+
+import pytest
+
+from hydra.core.plugins import Plugins
+from hydra.plugins.launcher import Launcher
+from hydra.plugins.plugin import Plugin
+
+
+@pytest.mark.parametrize(  # type: ignore
+    "plugin_type", [None, Launcher], ids=["all", "launcher"]
+)
+def bench_discover_scan(
+    benchmark: Any, monkeypatch: Any, plugin_type: Optional[Type[Plugin]]
+) -> None:
+    # no manifest, the plugin packages are scanned
+    monkeypatch.setenv("HYDRA_PLUGINS_MANIFEST", "")
+
+    def discover() -> None:
+        Plugins._discovered.clear()
+        Plugins.discover(plugin_type)
+
+    benchmark(discover)
+
+
+@pytest.mark.parametrize(  # type: ignore
+    "plugin_type", [None, Launcher], ids=["all", "launcher"]
+)
+def bench_discover_manifest(
+    benchmark: Any,
+    monkeypatch: Any,
+    tmp_path: Path,
+    plugin_type: Optional[Type[Plugin]],
+) -> None:
+    # plugins resolved from an up to date manifest, like a new process
+    monkeypatch.setenv("HYDRA_PLUGINS_MANIFEST", str(tmp_path / "manifest.json"))
+    Plugins.discover(plugin_type)
+
+    def discover() -> None:
+        Plugins._discovered.clear()
+        Plugins.discover(plugin_type)
+
+    benchmark(discover)
+
+
+def bench_discover_cached(benchmark: Any) -> None:
+    # plugins already discovered by this process
+    Plugins.discover(Launcher)
+    benchmark(Plugins.discover, Launcher)
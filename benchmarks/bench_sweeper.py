@@ -0,0 +1,40 @@
+# Copyright (c) Facebook, Inc. and its affiliates. All Rights Reserved
+"""
+Sweep expansion: BasicSweeper.get_job_batch on large cartesian products
+"""
+from typing import Any, List, Optional
+
+import pytest
+
+from hydra._internal.core_plugins.basic_sweeper import BasicSweeper
+
+
+def sweep_arguments(*sizes: int) -> List[str]:
+    """
+    :return: sweep arguments with one key per size, each with size values (e.g. a=0,1,2)
+    """
+    return [
+        "key{}={}".format(key, ",".join(str(value) for value in range(size)))
+        for key, size in enumerate(sizes)
+    ]
+
+
+@pytest.mark.parametrize(  # type: ignore
+    "sizes", [(1000,), (100, 100), (10, 10, 10, 10, 10)], ids=str
+)
+@pytest.mark.parametrize("max_batch_size", [None, 1000])  # type: ignore
+def bench_get_job_batch(
+    benchmark: Any, sizes: List[int], max_batch_size: Optional[int]
+) -> None:
+    arguments = sweep_arguments(*sizes)
+
+    def expand() -> int:
+        sweeper = BasicSweeper(max_batch_size=max_batch_size)
+        sweeper.arguments = arguments
+        num_jobs = 0
+        while not sweeper.is_done():
+            num_jobs += len(sweeper.get_job_batch())
+        return num_jobs
+
+    num_jobs = benchmark(expand)
+    benchmark.extra_info["num_jobs"] = num_jobs
@@ -0,0 +1,107 @@
+# Copyright (c) Facebook, Inc. and its affiliates. All Rights Reserved
+"""
+Fixtures of the benchmarks, generated so that the benchmarks run offline.
+"""
+import copy
+import logging
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, NamedTuple
+
+import pytest
+from omegaconf import OmegaConf
+
+# registers the hydra config in the ConfigStore before the state of the singletons is saved
+import hydra.conf  # noqa: F401
+from hydra.core.singleton import Singleton
+
+pytest.importorskip("pytest_benchmark")
+
+
+def group_name(group: int, depth: int) -> str:
+    """
+    :return: the name of a generated group, nested depth levels deep (e.g. g3/l1/l2 for depth 3)
+    """
+    return "/".join([f"g{group}"] + [f"l{level}" for level in range(1, depth)])
+
+
+def generate_config_tree(
+    root: Path, num_groups: int, num_options: int, depth: int, num_keys: int
+) -> None:
+    """
+    Generates a config dir with a primary config named config, selecting the first option of each group
+    in its defaults.
+    :param root: directory to generate the configs in
+    :param num_groups: number of config groups
+    :param num_options: number of options (configs) in each group
+    :param depth: nesting depth of the groups, and of the nodes in each option
+    :param num_keys: number of values in each option
+    """
+    defaults: List[Any] = []
+    for group in range(num_groups):
+        name = group_name(group, depth)
+        group_dir = root / name
+        group_dir.mkdir(parents=True)
+        for option in range(num_options):
+            node: Dict[str, Any] = {f"key{key}": key for key in range(num_keys)}
+            for level in reversed(range(depth)):
+                node = {f"level{level}": node}
+            OmegaConf.save(
+                OmegaConf.create({f"g{group}": node}),
+                str(group_dir / f"o{option}.yaml"),
+            )
+        defaults.append({name: "o0"})
+    OmegaConf.save(
+        OmegaConf.create({"defaults": defaults, "foo": 0, "bar": 0}),
+        str(root / "config.yaml"),
+    )
+
+
+class ConfigTree(NamedTuple):
+    path: str
+    num_groups: int
+    num_options: int
+    depth: int
+
+    def group(self, group: int) -> str:
+        return group_name(group, self.depth)
+
+
+# name -> (num_groups, num_options, depth, num_keys)
+CONFIG_TREES = {
+    "small": (5, 3, 1, 5),
+    "wide": (50, 10, 1, 10),
+    "deep": (10, 3, 10, 10),
+}
+
+
+def create_config_tree(tmp_path_factory: Any, name: str) -> ConfigTree:
+    root = tmp_path_factory.mktemp(name)
+    num_groups, num_options, depth, num_keys = CONFIG_TREES[name]
+    generate_config_tree(root, num_groups, num_options, depth, num_keys)
+    return ConfigTree(
+        path=str(root), num_groups=num_groups, num_options=num_options, depth=depth
+    )
+
+
+@pytest.fixture(scope="session", params=sorted(CONFIG_TREES.keys()))  # type: ignore
+def config_tree(request: Any, tmp_path_factory: Any) -> ConfigTree:
+    """
+    :return: a generated config tree, see CONFIG_TREES
+    """
+    return create_config_tree(tmp_path_factory, request.param)
+
+
+@pytest.fixture(scope="session")  # type: ignore
+def small_config_tree(tmp_path_factory: Any) -> ConfigTree:
+    return create_config_tree(tmp_path_factory, "small")
+
+
+@pytest.fixture(autouse=True)  # type: ignore
+def restore_state() -> Iterator[None]:
+    """
+    Restores the singletons (ConfigStore, HydraConfig...) and logging after each benchmark
+    """
+    state = copy.deepcopy(Singleton.get_state())
+    yield
+    Singleton.set_state(state)
+    logging.shutdown()
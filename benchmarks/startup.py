@@ -0,0 +1,106 @@
+#!/usr/bin/env python
+# Copyright (c) Facebook, Inc. and its affiliates. All Rights Reserved
+"""
+Measures the startup time of Hydra:
+- the cumulative import time of the hydra package, reported by python -X importtime
+- the end to end latency of running a tutorial app with --help
+
+Usage: python benchmarks/startup.py [--runs N] [--app APP] [--json FILE]
+Each measurement runs in a new Python process, the median over the runs is reported.
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from typing import Dict, List, Optional
+
+BASE = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_APP = os.path.join(BASE, "examples", "tutorial", "5_composition", "my_app.py")
+
+
+def import_time_us(module: str) -> int:
+    """
+    :return: the cumulative import time of the module in microseconds, as reported by -X importtime
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        stderr=subprocess.PIPE,
+        stdout=subprocess.DEVNULL,
+        check=True,
+        universal_newlines=True,
+    )
+    for line in result.stderr.splitlines():
+        # import time: self [us] | cumulative | imported package
+        fields = [field.strip() for field in line.split("|")]
+        if len(fields) == 3 and fields[2] == module:
+            return int(fields[1])
+    raise RuntimeError(f"No import time reported for {module}")
+
+
+def imported_modules(module: str) -> List[str]:
+    """
+    :return: the modules imported by importing the module
+    """
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            f"import sys; before = set(sys.modules); import {module}; "
+            "print('\\n'.join(sorted(set(sys.modules) - before)))",
+        ],
+        stdout=subprocess.PIPE,
+        check=True,
+        universal_newlines=True,
+    )
+    return result.stdout.split()
+
+
+def latency_s(args: List[str], cwd: Optional[str] = None) -> float:
+    """
+    :return: the wall-clock time of running Python with the arguments, in seconds
+    """
+    start = time.perf_counter()
+    subprocess.run(
+        [sys.executable] + args, stdout=subprocess.DEVNULL, check=True, cwd=cwd,
+    )
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Hydra startup benchmark")
+    parser.add_argument("--runs", type=int, default=10, help="number of runs")
+    parser.add_argument("--app", default=DEFAULT_APP, help="app to run with --help")
+    parser.add_argument("--json", help="write the results to this file")
+    args = parser.parse_args()
+
+    results: Dict[str, float] = {
+        "import_hydra_ms": statistics.median(
+            import_time_us("hydra") / 1000 for _ in range(args.runs)
+        ),
+        "import_omegaconf_ms": statistics.median(
+            import_time_us("omegaconf") / 1000 for _ in range(args.runs)
+        ),
+        "help_ms": statistics.median(
+            latency_s([args.app, "--help"], cwd=os.path.dirname(args.app)) * 1000
+            for _ in range(args.runs)
+        ),
+        # baseline, the startup time of the interpreter
+        "python_startup_ms": statistics.median(
+            latency_s(["-c", "pass"]) * 1000 for _ in range(args.runs)
+        ),
+    }
+    hydra_modules = [m for m in imported_modules("hydra") if m.startswith("hydra")]
+
+    for name, value in results.items():
+        print(f"{name:<24}{value:10.1f}")
+    print(f"{'hydra modules imported':<24}{len(hydra_modules):10}")
+    if args.json is not None:
+        with open(args.json, "w") as f:
+            json.dump(dict(results, hydra_modules=hydra_modules), f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
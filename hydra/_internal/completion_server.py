@@ -0,0 +1,134 @@
+# Copyright (c) Facebook, Inc. and its affiliates. All Rights Reserved
+"""
+Completion server, answering shell completion queries from a long running process.
+The process keeps its config loader (and its caches) warm between queries, avoiding the startup of Python
+and Hydra on every TAB press.
+
+Protocol: the client sends the command line to complete, terminated by a newline, and reads the response
+until the server closes the connection. The response is "OK " followed by the space separated completions.
+Any other response (including an empty one) means the query was not answered, and the client should
+fall back to querying the app directly.
+"""
+import logging
+import os
+import socket
+import socketserver
+import stat
+from typing import Callable, List, Optional, Sequence, Tuple
+
+log = logging.getLogger(__name__)
+
+RESPONSE_PREFIX = "OK "
+
+
+def _file_stamps(files: Sequence[str]) -> List[Optional[Tuple[int, int]]]:
+    stamps: List[Optional[Tuple[int, int]]] = []
+    for file in files:
+        try:
+            st = os.stat(file)
+            stamps.append((st.st_mtime_ns, st.st_size))
+        except OSError:
+            stamps.append(None)
+    return stamps
+
+
+def is_private_dir(path: str) -> bool:
+    """
+    :return: True if path is a directory (not a symlink) owned by the current user, that other users cannot
+             access. Only the current user can then create, replace or connect to the sockets in it.
+    """
+    try:
+        st = os.lstat(path)
+    except OSError:
+        return False
+    return (
+        stat.S_ISDIR(st.st_mode)
+        and st.st_uid == os.getuid()
+        and st.st_mode & (stat.S_IRWXG | stat.S_IRWXO) == 0
+    )
+
+
+def is_serving(socket_path: str) -> bool:
+    """
+    :return: True if a server is accepting connections on the socket
+    """
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.connect(socket_path)
+        return True
+    except OSError:
+        return False
+    finally:
+        sock.close()
+
+
+def serve(
+    socket_path: str,
+    query: Callable[[str], List[str]],
+    idle_timeout: float,
+    watched_files: Sequence[str] = (),
+) -> None:
+    """
+    Serves completion queries on a Unix socket, until no query is received for idle_timeout seconds.
+    Returns right away if another server is already serving on the socket.
+    :param socket_path: path of the Unix socket, in a directory only the current user can access (see
+           is_private_dir) so that other users cannot bind it first or connect to it
+    :param query: returns the completions of a command line
+    :param idle_timeout: seconds without queries after which the server stops
+    :param watched_files: files the answers depend on (for example the app), the server stops without
+           answering when any of them changes so that the client falls back to a fresh process
+    """
+    socket_dir = os.path.dirname(os.path.abspath(socket_path))
+    if not is_private_dir(socket_dir):
+        raise ValueError(
+            "The completion server socket must be in a directory owned by the current user and not accessible"
+            " to other users (mode 0700): {}".format(socket_dir)
+        )
+    if is_serving(socket_path):
+        return
+    try:
+        os.unlink(socket_path)
+    except FileNotFoundError:
+        pass
+
+    stamps = _file_stamps(watched_files)
+
+    class Handler(socketserver.StreamRequestHandler):
+        def handle(self) -> None:
+            line = self.rfile.readline().decode("utf-8").rstrip("\n")
+            if _file_stamps(watched_files) != stamps:
+                server.stopped = True
+                return
+            try:
+                completions = query(line)
+            except Exception as e:
+                log.debug(f"Error completing '{line}' : {e}")
+                return
+            response = RESPONSE_PREFIX + " ".join(completions) + "\n"
+            self.wfile.write(response.encode("utf-8"))
+
+    class Server(socketserver.UnixStreamServer):
+        stopped = False
+
+        def handle_timeout(self) -> None:
+            self.stopped = True
+
+    old_umask = os.umask(0o077)
+    try:
+        server = Server(socket_path, Handler)
+    finally:
+        os.umask(old_umask)
+    server.timeout = idle_timeout
+    inode = os.stat(socket_path).st_ino
+    try:
+        with server:
+            # requests are handled one at a time in this thread
+            while not server.stopped:
+                server.handle_request()
+    finally:
+        # a new server may already be serving on the path
+        try:
+            if os.stat(socket_path).st_ino == inode:
+                os.unlink(socket_path)
+        except FileNotFoundError:
+            pass
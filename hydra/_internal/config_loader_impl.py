@@ -3,20 +3,67 @@
 Configuration loader
 """
 import copy
-from typing import List, Optional, Tuple
+import os
+import time
+from collections import OrderedDict
+from dataclasses import astuple, dataclass, field
+from typing import Any, Dict, Hashable, List, Optional, Tuple
 
 from omegaconf import DictConfig, ListConfig, OmegaConf, open_dict
 
 from hydra._internal.config_repository import ConfigRepository
-from hydra.core.config_loader import ConfigLoader, LoadTrace
+from hydra.core.config_loader import ConfigGroupTree, ConfigLoader, LoadTrace
 from hydra.core.config_search_path import ConfigSearchPath
 from hydra.core.config_store import ConfigStore
 from hydra.core.object_type import ObjectType
-from hydra.core.utils import JobRuntime, get_overrides_dirname, split_key_val
+from hydra.core.utils import (
+    JobRuntime,
+    StageTimings,
+    get_overrides_dirname,
+    split_key_val,
+)
 from hydra.errors import MissingConfigException
 from hydra.plugins.config_source import ConfigLoadError, ConfigSource
 
 
+@dataclass
+class CachedComposition:
+    # fingerprint of the config sources after the composition
+    fingerprint: Hashable
+    # composed config, never handed out directly
+    config: DictConfig
+    # load traces recorded during the composition
+    load_trace: List[LoadTrace]
+
+
+@dataclass
+class CompositionPlan:
+    """
+    The parts of a composition that only depend on the primary config: the loaded hydra and job configs
+    and the merged defaults list, before any override is applied.
+    Reused by compositions of the same primary config, for example the jobs of a sweep.
+    Members are never modified, compositions work on copies of them.
+    """
+
+    # fingerprint of the config sources after creating the plan
+    fingerprint: Optional[Hashable]
+    # hydra config promoted to the type of the job config, without the defaults
+    hydra_cfg: DictConfig
+    hydra_cfg_load_trace: Optional[LoadTrace]
+    # job config, without the defaults
+    job_cfg: DictConfig
+    job_cfg_load_trace: Optional[LoadTrace]
+    # merged defaults list, hydra defaults first
+    defaults: ListConfig
+    # number of hydra defaults in the defaults list
+    split_at: int
+    # configs with all defaults merged, before the value overrides are applied.
+    # keyed by the overrides applied to the defaults list.
+    merged: "OrderedDict[Tuple[str, ...], Tuple[DictConfig, List[LoadTrace]]]" = field(
+        default_factory=OrderedDict
+    )
+
+
 class ConfigLoaderImpl(ConfigLoader):
     """
     Configuration loader
@@ -26,13 +73,30 @@ class ConfigLoaderImpl(ConfigLoader):
         self,
         config_search_path: ConfigSearchPath,
         default_strict: Optional[bool] = None,
+        cache_size: int = 32,
+        verify_incremental: Optional[bool] = None,
     ) -> None:
+        """
+        :param config_search_path: config search path
+        :param default_strict: default strict mode
+        :param cache_size: max number of compositions cached, 0 to disable caching
+        :param verify_incremental: compare every composition reusing a merged config with a full composition
+               and raise an AssertionError if they differ. for testing, this is slow.
+               None to enable it if the HYDRA_VERIFY_INCREMENTAL environment variable is set to 1.
+        """
+        if verify_incremental is None:
+            verify_incremental = os.environ.get("HYDRA_VERIFY_INCREMENTAL") == "1"
         self.default_strict = default_strict
         self.all_config_checked: List[LoadTrace] = []
         self.config_search_path = config_search_path
         self.repository: ConfigRepository = ConfigRepository(
             config_search_path=config_search_path
         )
+        self.cache_size = cache_size
+        self.verify_incremental = verify_incremental
+        self.cache: "OrderedDict[Any, CachedComposition]" = OrderedDict()
+        # composition plans by primary config name
+        self.plans: Dict[Optional[str], CompositionPlan] = {}
 
     def load_configuration(
         self,
@@ -47,8 +111,68 @@ class ConfigLoaderImpl(ConfigLoader):
             strict = self.default_strict
 
         assert overrides is None or isinstance(overrides, list)
+        with StageTimings.instance().measure("load_configuration"):
+            return self._load_configuration(config_name, overrides, strict)
+
+    def _load_configuration(
+        self, config_name: Optional[str], overrides: List[str], strict: Optional[bool],
+    ) -> DictConfig:
         overrides = copy.deepcopy(overrides) or []
 
+        # drops the search path resolution index if any config source changed
+        fingerprint = self._get_fingerprint(self.repository.refresh())
+        cache_key = (config_name, tuple(overrides), strict)
+        cached = self._get_cached(cache_key, fingerprint)
+        if cached is not None:
+            cfg = copy.deepcopy(cached.config)
+            self.all_config_checked.extend(cached.load_trace)
+        else:
+            history_len = len(self.all_config_checked)
+            plan = self._get_plan(config_name, fingerprint)
+            cfg = self._compose(plan, overrides, strict)
+            # the composition may have queried the sources about more configs
+            fingerprint = self._get_fingerprint(self.repository.fingerprint())
+            plan.fingerprint = fingerprint
+            self._put_cached(
+                cache_key,
+                cfg,
+                fingerprint=fingerprint,
+                load_trace=self.all_config_checked[history_len:],
+            )
+
+        with open_dict(cfg.hydra.job):
+            if "name" not in cfg.hydra.job:
+                cfg.hydra.job.name = JobRuntime().get("name")
+            cfg.hydra.job.override_dirname = get_overrides_dirname(
+                input_list=cfg.hydra.overrides.task,
+                kv_sep=cfg.hydra.job.config.override_dirname.kv_sep,
+                item_sep=cfg.hydra.job.config.override_dirname.item_sep,
+                exclude_keys=cfg.hydra.job.config.override_dirname.exclude_keys,
+            )
+            cfg.hydra.job.config_name = config_name
+
+        return cfg
+
+    def _get_plan(
+        self, config_name: Optional[str], fingerprint: Optional[Hashable]
+    ) -> CompositionPlan:
+        """
+        :param config_name: primary config name
+        :param fingerprint: current fingerprint of the config sources, None disables reuse of plans
+        :return: the composition plan for the primary config
+        """
+        plan = self.plans.get(config_name)
+        if (
+            plan is not None
+            and fingerprint is not None
+            and plan.fingerprint == fingerprint
+        ):
+            return plan
+        plan = self._create_plan(config_name)
+        self.plans[config_name] = plan
+        return plan
+
+    def _create_plan(self, config_name: Optional[str]) -> CompositionPlan:
         if config_name is not None and not self.exists_in_search_path(config_name):
             raise MissingConfigException(
                 missing_cfg_file=config_name,
@@ -63,8 +187,12 @@ class ConfigLoaderImpl(ConfigLoader):
                 ),
             )
 
-        # Load hydra config
-        hydra_cfg, _load_trace = self._create_cfg(cfg_filename="hydra_config")
+        # Load hydra config, registered in the ConfigStore when hydra.conf is first imported
+        import hydra.conf  # noqa: F401
+
+        hydra_cfg, hydra_cfg_load_trace = self._create_cfg(
+            cfg_filename="hydra_config", record_load=False
+        )
 
         # Load job config
         job_cfg, job_cfg_load_trace = self._create_cfg(
@@ -83,16 +211,49 @@ class ConfigLoaderImpl(ConfigLoader):
         split_at = len(defaults)
 
         ConfigLoaderImpl._merge_default_lists(defaults, job_defaults)
+
+        return CompositionPlan(
+            # set once the first composition using this plan is done
+            fingerprint=None,
+            hydra_cfg=hydra_cfg,
+            hydra_cfg_load_trace=hydra_cfg_load_trace,
+            job_cfg=job_cfg,
+            job_cfg_load_trace=job_cfg_load_trace,
+            defaults=defaults,
+            split_at=split_at,
+        )
+
+    def _compose(
+        self, plan: CompositionPlan, overrides: List[str], strict: Optional[bool]
+    ) -> DictConfig:
+        defaults = copy.deepcopy(plan.defaults)
         consumed = self._apply_defaults_overrides(overrides, defaults)
 
         consumed_free_job_defaults = self._apply_free_defaults(defaults, overrides)
 
         ConfigLoaderImpl._validate_defaults(defaults)
 
-        # Load and defaults and merge them into cfg
-        cfg = self._merge_defaults(
-            hydra_cfg, job_cfg, job_cfg_load_trace, defaults, split_at
-        )
+        # The merged config only depends on the plan and on the overrides applied to the defaults.
+        # Compositions differing only by value overrides (e.g. sweeps over lr=0.1,0.01) reuse it.
+        merged_key = tuple(consumed + consumed_free_job_defaults)
+        merged = plan.merged.get(merged_key)
+        if merged is not None:
+            plan.merged.move_to_end(merged_key)
+            cfg = copy.deepcopy(merged[0])
+            self.all_config_checked.extend(merged[1])
+            if self.verify_incremental:
+                self._verify_merged(plan, defaults, cfg, merged[1])
+        else:
+            history_len = len(self.all_config_checked)
+            cfg = self._merge_plan_defaults(plan, defaults)
+            if self.cache_size > 0:
+                plan.merged[merged_key] = (
+                    copy.deepcopy(cfg),
+                    self.all_config_checked[history_len:],
+                )
+                while len(plan.merged) > self.cache_size:
+                    plan.merged.popitem(last=False)
+
         OmegaConf.set_struct(cfg.hydra, True)
         OmegaConf.set_struct(cfg, strict)
 
@@ -108,19 +269,87 @@ class ConfigLoaderImpl(ConfigLoader):
 
         cfg.hydra.overrides.task = [x for x in remaining if not is_hydra(x)]
         cfg.hydra.overrides.hydra = [x for x in remaining if is_hydra(x)]
+        return cfg
 
-        with open_dict(cfg.hydra.job):
-            if "name" not in cfg.hydra.job:
-                cfg.hydra.job.name = JobRuntime().get("name")
-            cfg.hydra.job.override_dirname = get_overrides_dirname(
-                input_list=cfg.hydra.overrides.task,
-                kv_sep=cfg.hydra.job.config.override_dirname.kv_sep,
-                item_sep=cfg.hydra.job.config.override_dirname.item_sep,
-                exclude_keys=cfg.hydra.job.config.override_dirname.exclude_keys,
+    def _merge_plan_defaults(
+        self, plan: CompositionPlan, defaults: ListConfig
+    ) -> DictConfig:
+        """
+        Load the defaults and merge them into a copy of the hydra config of the plan
+        """
+        if plan.hydra_cfg_load_trace is not None:
+            self.all_config_checked.append(plan.hydra_cfg_load_trace)
+        hydra_cfg = copy.deepcopy(plan.hydra_cfg)
+        return self._merge_defaults(
+            hydra_cfg, plan.job_cfg, plan.job_cfg_load_trace, defaults, plan.split_at
+        )
+
+    def _verify_merged(
+        self,
+        plan: CompositionPlan,
+        defaults: ListConfig,
+        cfg: DictConfig,
+        load_trace: List[LoadTrace],
+    ) -> None:
+        history_len = len(self.all_config_checked)
+        expected = self._merge_plan_defaults(plan, copy.deepcopy(defaults))
+        expected_load_trace = self.all_config_checked[history_len:]
+        del self.all_config_checked[history_len:]
+        if cfg != expected or cfg.pretty() != expected.pretty():
+            raise AssertionError(
+                f"Reused merged config differs from a full composition:\n{cfg.pretty()}\n"
+                f"Expected:\n{expected.pretty()}"
+            )
+        # LoadTrace only compares to tuples, timings are ignored
+        if [astuple(t)[0:4] for t in load_trace] != [
+            astuple(t)[0:4] for t in expected_load_trace
+        ]:
+            raise AssertionError(
+                f"Reused load trace differs from a full composition:\n{load_trace}\n"
+                f"Expected:\n{expected_load_trace}"
             )
-            cfg.hydra.job.config_name = config_name
 
-        return cfg
+    @staticmethod
+    def _get_fingerprint(
+        repository_fingerprint: Optional[Hashable],
+    ) -> Optional[Hashable]:
+        """
+        :param repository_fingerprint: fingerprint of the config sources
+        :return: combined fingerprint of the config sources and of the ConfigStore (used for schemas),
+                 or None if any of the sources cannot provide one
+        """
+        if repository_fingerprint is None:
+            return None
+        return ConfigStore.instance().version, repository_fingerprint
+
+    def _get_cached(
+        self, key: Any, fingerprint: Optional[Hashable]
+    ) -> Optional[CachedComposition]:
+        if self.cache_size <= 0 or key not in self.cache:
+            return None
+        cached = self.cache[key]
+        if fingerprint is None or fingerprint != cached.fingerprint:
+            del self.cache[key]
+            return None
+        self.cache.move_to_end(key)
+        return cached
+
+    def _put_cached(
+        self,
+        key: Any,
+        cfg: DictConfig,
+        fingerprint: Optional[Hashable],
+        load_trace: List[LoadTrace],
+    ) -> None:
+        if self.cache_size <= 0 or fingerprint is None:
+            return
+        # keep a private copy, the composed config is handed out to the caller
+        self.cache[key] = CachedComposition(
+            fingerprint=fingerprint, config=copy.deepcopy(cfg), load_trace=load_trace
+        )
+        self.cache.move_to_end(key)
+        while len(self.cache) > self.cache_size:
+            self.cache.popitem(last=False)
 
     def load_sweep_config(
         self, master_config: DictConfig, sweep_overrides: List[str]
@@ -250,6 +479,9 @@ class ConfigLoaderImpl(ConfigLoader):
                 path=path,
                 provider=provider,
                 schema_provider=schema_provider,
+                lookup_time=lookup_time,
+                load_time=load_time,
+                schema_merge_time=schema_merge_time,
             )
 
             if record_load:
@@ -257,7 +489,13 @@ class ConfigLoaderImpl(ConfigLoader):
 
             return trace
 
-        ret = self.repository.load_config(config_path=input_file)
+        start = time.perf_counter()
+        exists = self.repository.exists(input_file)
+        lookup_end = time.perf_counter()
+        lookup_time = lookup_end - start
+        ret = self.repository.load_config(config_path=input_file) if exists else None
+        load_time = time.perf_counter() - lookup_end
+        schema_merge_time = 0.0
 
         if ret is not None:
             if not isinstance(ret.config, DictConfig):
@@ -266,14 +504,18 @@ class ConfigLoaderImpl(ConfigLoader):
                 )
             if not ret.is_schema_source:
                 try:
+                    schema_start = time.perf_counter()
                     schema = ConfigStore.instance().load(
                         config_path=ConfigSource._normalize_file_name(
                             filename=input_file
                         )
                     )
 
-                    merged = OmegaConf.merge(schema.node, ret.config)
+                    # the stored schema is read-only, merge into a copy of it
+                    merged = ConfigStore.copy_node(schema.node)
                     assert isinstance(merged, DictConfig)
+                    merged.merge_with(ret.config)
+                    schema_merge_time = time.perf_counter() - schema_start
                     return (
                         merged,
                         record_loading(
@@ -315,6 +557,10 @@ class ConfigLoaderImpl(ConfigLoader):
     ) -> List[str]:
         return self.repository.get_group_options(group_name, results_filter)
 
+    def get_group_tree(self) -> ConfigGroupTree:
+        # a single walk of the sources, kept until a source changes
+        return self.repository.get_group_tree()
+
     def _merge_config(
         self, cfg: DictConfig, family: str, name: str, required: bool
     ) -> DictConfig:
@@ -324,7 +570,7 @@ class ConfigLoaderImpl(ConfigLoader):
         else:
             new_cfg = name
 
-        loaded_cfg, _ = self._load_config_impl(new_cfg)
+        loaded_cfg, load_trace = self._load_config_impl(new_cfg)
         if loaded_cfg is None:
             if required:
                 if family == "":
@@ -343,8 +589,11 @@ class ConfigLoaderImpl(ConfigLoader):
                 return cfg
 
         else:
+            start = time.perf_counter()
             ret = OmegaConf.merge(cfg, loaded_cfg)
             assert isinstance(ret, DictConfig)
+            if load_trace is not None:
+                load_trace.merge_time = time.perf_counter() - start
             return ret
 
     def _merge_defaults(
@@ -359,9 +608,13 @@ class ConfigLoaderImpl(ConfigLoader):
             cfg_with_list = OmegaConf.create(dict(defaults=def_list))
             for default1 in cfg_with_list.defaults:
                 if default1 == "__SELF__":
+                    start = time.perf_counter()
                     merged_cfg.merge_with(job_cfg)
                     if job_cfg_load_trace is not None:
-                        self.all_config_checked.append(job_cfg_load_trace)
+                        # the trace of the primary config is shared by the compositions of the plan
+                        trace = copy.copy(job_cfg_load_trace)
+                        trace.merge_time = time.perf_counter() - start
+                        self.all_config_checked.append(trace)
                 elif isinstance(default1, DictConfig):
                     is_optional = False
                     if default1.optional is not None:
@@ -411,6 +664,11 @@ class ConfigLoaderImpl(ConfigLoader):
                 cfg_filename, record_load=record_load
             )
             assert ret is not None
+            if OmegaConf.is_readonly(ret):
+                # nodes loaded from the ConfigStore are shared, this one is going to be modified
+                ret_copy = ConfigStore.copy_node(ret)
+                assert isinstance(ret_copy, DictConfig)
+                ret = ret_copy
             cfg = ret
 
         if "defaults" in cfg and cfg.defaults is not None:
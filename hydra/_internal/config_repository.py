@@ -1,6 +1,7 @@
 # Copyright (c) Facebook, Inc. and its affiliates. All Rights Reserved
-from typing import List, Optional
+from typing import Dict, Hashable, List, Optional, Set, Tuple
 
+from hydra.core.config_loader import ConfigGroupNode, ConfigGroupTree
 from hydra.core.config_search_path import ConfigSearchPath
 from hydra.core.object_type import ObjectType
 from hydra.plugins.config_source import ConfigResult, ConfigSource
@@ -15,6 +16,11 @@ class ConfigRepository:
 
     def __init__(self, config_search_path: ConfigSearchPath) -> None:
         self.sources = []
+        # resolution index, maps config paths to the first source containing them,
+        # and snapshot of the config groups. dropped by refresh() when a source changes.
+        self._resolved: Dict[str, Optional[ConfigSource]] = {}
+        self._group_tree: Optional[ConfigGroupTree] = None
+        self._fingerprint: Optional[Hashable] = None
         for search_path in config_search_path.get_path():
             assert search_path.path is not None
             assert search_path.provider is not None
@@ -40,6 +46,10 @@ class ConfigRepository:
     def get_group_options(
         self, group_name: str, results_filter: Optional[ObjectType] = ObjectType.CONFIG
     ) -> List[str]:
+        if self._group_tree is not None or self._fingerprint is not None:
+            return self.get_group_tree().get_group_options(group_name, results_filter)
+        # without a fingerprint from the last refresh the snapshot could not be kept between refreshes,
+        # only query the requested group.
         options: List[str] = []
         for source in self.sources:
             if source.is_group(config_path=group_name):
@@ -48,16 +58,84 @@ class ConfigRepository:
                 )
         return sorted(list(set(options)))
 
+    def get_group_tree(self) -> ConfigGroupTree:
+        """
+        :return: snapshot of the config groups of all sources, built with one walk per source
+        """
+        if self._group_tree is None:
+            nodes: Dict[str, Tuple[Set[str], Set[str]]] = {}
+            for source in self.sources:
+                self._walk_groups(source, "", nodes)
+            self._group_tree = ConfigGroupTree(
+                nodes={
+                    name: ConfigGroupNode(
+                        configs=sorted(configs), groups=sorted(groups)
+                    )
+                    for name, (configs, groups) in nodes.items()
+                }
+            )
+            if self._fingerprint is not None:
+                # the walk may have queried the sources about more groups
+                self._fingerprint = self.fingerprint()
+        return self._group_tree
+
+    @staticmethod
+    def _walk_groups(
+        source: ConfigSource,
+        group_name: str,
+        nodes: Dict[str, Tuple[Set[str], Set[str]]],
+    ) -> None:
+        if not source.is_group(config_path=group_name):
+            return
+        configs, groups = nodes.setdefault(group_name, (set(), set()))
+        configs.update(
+            source.list(config_path=group_name, results_filter=ObjectType.CONFIG)
+        )
+        children = source.list(config_path=group_name, results_filter=ObjectType.GROUP)
+        groups.update(children)
+        for child in children:
+            child_name = (
+                child if group_name == "" else "{}/{}".format(group_name, child)
+            )
+            ConfigRepository._walk_groups(source, child_name, nodes)
+
     def get_sources(self) -> List[ConfigSource]:
         return self.sources
 
-    def _find_config(self, config_path: str) -> Optional[ConfigSource]:
-        found_source = None
+    def fingerprint(self) -> Optional[Hashable]:
+        """
+        :return: combined fingerprint of all sources, or None if any of the sources cannot provide one
+        """
+        fingerprints: List[Hashable] = []
         for source in self.sources:
-            if source.exists(config_path):
-                found_source = source
-                break
-        return found_source
+            fingerprint = source.fingerprint()
+            if fingerprint is None:
+                return None
+            fingerprints.append(fingerprint)
+        return tuple(fingerprints)
+
+    def refresh(self) -> Optional[Hashable]:
+        """
+        Drops the resolution index if any of the sources changed since the last refresh.
+        The index is always dropped if a source cannot tell if it changed.
+        :return: the current fingerprint of the sources
+        """
+        fingerprint = self.fingerprint()
+        if fingerprint is None or fingerprint != self._fingerprint:
+            self._resolved.clear()
+            self._group_tree = None
+        self._fingerprint = fingerprint
+        return fingerprint
+
+    def _find_config(self, config_path: str) -> Optional[ConfigSource]:
+        if config_path not in self._resolved:
+            found_source = None
+            for source in self.sources:
+                if source.exists(config_path):
+                    found_source = source
+                    break
+            self._resolved[config_path] = found_source
+        return self._resolved[config_path]
 
     @staticmethod
     def _get_scheme(path: str) -> str:
@@ -0,0 +1,119 @@
+# Copyright (c) Facebook, Inc. and its affiliates. All Rights Reserved
+import asyncio
+import logging
+from pathlib import Path
+from typing import List, Optional, Sequence
+
+from omegaconf import DictConfig, open_dict
+
+from hydra.core.config_loader import ConfigLoader
+from hydra.core.hydra_config import HydraConfig
+from hydra.core.utils import (
+    JobReturn,
+    configure_log,
+    filter_overrides,
+    run_coroutine,
+    run_job_async,
+    setup_globals,
+)
+from hydra.plugins.launcher import Launcher
+from hydra.types import TaskFunction
+
+log = logging.getLogger(__name__)
+
+
+class AsyncioLauncher(Launcher):
+    def __init__(self, max_concurrency: Optional[int] = None) -> None:
+        """
+        Launches jobs concurrently on a single event loop, intended for async task functions
+        spending their time waiting on I/O.
+        Synchronous task functions are supported but block the event loop, running one at a time.
+        Jobs run in thread safe mode (see run_job): the working directory is not changed for the jobs,
+        tasks should use the job output directory from the Hydra config instead of relative paths.
+
+        :param max_concurrency: maximum number of jobs running at the same time, None for no limit
+        """
+        self.config: Optional[DictConfig] = None
+        self.config_loader: Optional[ConfigLoader] = None
+        self.task_function: Optional[TaskFunction] = None
+
+        self.max_concurrency = max_concurrency
+
+    def setup(
+        self,
+        config: DictConfig,
+        config_loader: ConfigLoader,
+        task_function: TaskFunction,
+    ) -> None:
+        self.config = config
+        self.config_loader = config_loader
+        self.task_function = task_function
+
+    def launch(
+        self, job_overrides: Sequence[Sequence[str]], initial_job_idx: int = 0
+    ) -> Sequence[JobReturn]:
+        """
+        :param job_overrides: a List of List<String>, where each inner list is the arguments for one job run.
+        :param initial_job_idx: Initial job idx in batch.
+        :return: an array of return values from run_job with indexes corresponding to the input list indexes.
+        """
+        setup_globals()
+        assert self.config is not None
+        assert self.config_loader is not None
+        assert self.task_function is not None
+
+        configure_log(self.config.hydra.hydra_logging, self.config.hydra.verbose)
+        sweep_dir = Path(str(self.config.hydra.sweep.dir))
+        sweep_dir.mkdir(parents=True, exist_ok=True)
+        log.info(
+            "AsyncioLauncher(max_concurrency={}) is launching {} jobs".format(
+                self.max_concurrency, len(job_overrides)
+            )
+        )
+        log.info("Launching jobs, sweep output dir : {}".format(sweep_dir))
+
+        sweep_configs: List[DictConfig] = []
+        for idx, overrides in enumerate(job_overrides, initial_job_idx):
+            log.info("\t#{} : {}".format(idx, " ".join(filter_overrides(overrides))))
+            sweep_config = self.config_loader.load_sweep_config(
+                self.config, list(overrides)
+            )
+            with open_dict(sweep_config):
+                sweep_config.hydra.job.id = "{}_{}".format(
+                    sweep_config.hydra.job.name, idx
+                )
+                sweep_config.hydra.job.num = idx
+            sweep_configs.append(sweep_config)
+
+        runs: List[JobReturn] = run_coroutine(self._launch(sweep_configs))
+        for run in runs:
+            assert isinstance(run, JobReturn)
+        return runs
+
+    async def _launch(self, sweep_configs: List[DictConfig]) -> List[JobReturn]:
+        assert self.task_function is not None
+        task_function: TaskFunction = self.task_function
+        # created here to be bound to the running event loop
+        semaphore = asyncio.Semaphore(self.max_concurrency or len(sweep_configs) or 1)
+
+        async def execute_job(sweep_config: DictConfig) -> JobReturn:
+            async with semaphore:
+                # each asyncio task runs in a copy of the context, isolating its Hydra config
+                HydraConfig.instance().set_config(sweep_config, local=True)
+                return await run_job_async(
+                    config=sweep_config,
+                    task_function=task_function,
+                    job_dir_key="hydra.sweep.dir",
+                    job_subdir_key="hydra.sweep.subdir",
+                    journal=sweep_config.hydra.sweep.journal,
+                )
+
+        tasks = [
+            asyncio.ensure_future(execute_job(sweep_config))
+            for sweep_config in sweep_configs
+        ]
+        # results are collected as the jobs complete
+        for completed in asyncio.as_completed(tasks):
+            ret = await completed
+            log.debug("Job completed : {}".format(ret.working_dir))
+        return [task.result() for task in tasks]
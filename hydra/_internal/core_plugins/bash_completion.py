@@ -3,7 +3,7 @@ import logging
 import os
 import re
 import sys
-from typing import Optional
+from typing import List, Optional
 
 from hydra.plugins.completion_plugin import CompletionPlugin
 
@@ -40,7 +40,35 @@ class BashCompletion(CompletionPlugin):
     fi
 
     if [ $? == 0 ]; then
-        options=$( COMP_POINT=$COMP_POINT COMP_LINE=$COMP_LINE $helper -sc query=bash)
+        local served=1 sock="" reply=""
+        if [ -n "$HYDRA_COMP_SERVER" ] && [ -x "$(command -v socat)" ]; then
+            # the sockets are in a directory only the current user can access, the server is not used otherwise
+            local dir="${XDG_RUNTIME_DIR:-${TMPDIR:-/tmp}}/hydra-completion-$(id -u)"
+            mkdir -m 700 "$dir" 2>/dev/null
+            if [ -d "$dir" ] && [ ! -L "$dir" ] && [ -O "$dir" ] &&
+                [ -n "$(find "$dir" -maxdepth 0 -perm 700 2>/dev/null)" ]; then
+                # one completion server per app and working directory
+                sock=$(printf '%s' "$helper $(pwd)" | cksum | cut -d' ' -f1)
+                sock="$dir/$sock"
+                reply=$(printf '%s\\n' "$COMP_LINE" | socat -t5 - UNIX-CONNECT:"$sock" 2>/dev/null)
+                if [ "${reply:0:3}" == "OK " ]; then
+                    options=${reply:3}
+                    served=0
+                fi
+            fi
+        fi
+        if [ $served != 0 ]; then
+            options=$( COMP_POINT=$COMP_POINT COMP_LINE=$COMP_LINE $helper -sc query=bash)
+            if [ -n "$sock" ]; then
+                # start a single server at a time, the lock is held until the server exits.
+                # locks older than a minute are removed (e.g. left behind by a killed server),
+                # a new server exits right away if one is already serving.
+                find "$sock.lock" -maxdepth 0 -mmin +1 -exec rmdir {} \\; 2>/dev/null
+                if mkdir "$sock.lock" 2>/dev/null; then
+                    ( ($helper -sc serve=bash "socket=$sock" >/dev/null 2>&1; rmdir "$sock.lock") & )
+                fi
+            fi
+        fi
         word=${words[$COMP_CWORD]}
 
         if [ "$HYDRA_COMP_DEBUG" == "1" ]; then
@@ -99,6 +127,24 @@ COMP_WORDBREAKS=$COMP_WORDBREAKS complete -o nospace -o default -F hydra_bash_co
         line = self.strip_python_or_app_name(line)
         print(" ".join(self._query(config_name=config_name, line=line)))
 
+    def serve(
+        self, config_name: Optional[str], socket_path: str, idle_timeout: float
+    ) -> None:
+        from hydra._internal import completion_server
+
+        def query(line: str) -> List[str]:
+            line = self.strip_python_or_app_name(line)
+            return self._query(config_name=config_name, line=line)
+
+        # a modified app may have a different config, let the next query start a new server
+        app = os.path.abspath(sys.argv[0])
+        completion_server.serve(
+            socket_path=socket_path,
+            query=query,
+            idle_timeout=idle_timeout,
+            watched_files=[app] if os.path.isfile(app) else [],
+        )
+
     @staticmethod
     def _get_exec() -> str:
         if sys.argv[0].endswith(".py"):
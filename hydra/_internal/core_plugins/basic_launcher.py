@@ -37,7 +37,9 @@ class BasicLauncher(Launcher):
         self.config_loader = config_loader
         self.task_function = task_function
 
-    def launch(self, job_overrides: Sequence[Sequence[str]]) -> Sequence[JobReturn]:
+    def launch(
+        self, job_overrides: Sequence[Sequence[str]], initial_job_idx: int = 0
+    ) -> Sequence[JobReturn]:
         setup_globals()
         assert self.config is not None
         assert self.task_function is not None
@@ -49,7 +51,7 @@ class BasicLauncher(Launcher):
         log.info("Launching {} jobs locally".format(len(job_overrides)))
         runs: List[JobReturn] = []
 
-        for idx, overrides in enumerate(job_overrides):
+        for idx, overrides in enumerate(job_overrides, initial_job_idx):
             log.info("\t#{} : {}".format(idx, " ".join(filter_overrides(overrides))))
             sweep_config = self.config_loader.load_sweep_config(
                 self.config, list(overrides)
@@ -63,6 +65,7 @@ class BasicLauncher(Launcher):
                 task_function=self.task_function,
                 job_dir_key="hydra.sweep.dir",
                 job_subdir_key="hydra.sweep.subdir",
+                journal=sweep_config.hydra.sweep.journal,
             )
             runs.append(ret)
             configure_log(self.config.hydra.hydra_logging, self.config.hydra.verbose)
@@ -15,7 +15,8 @@ Basic Sweeper would generate 6 jobs:
 """
 import copy
 import itertools
-from typing import Optional, Sequence
+from concurrent.futures import FIRST_COMPLETED, Future, wait
+from typing import Any, Dict, Iterator, List, Optional, Sequence
 
 from hydra.core.utils import JobReturn
 from hydra.plugins.step_sweeper import StepSweeper
@@ -26,30 +27,112 @@ class BasicSweeper(StepSweeper):
     Basic sweeper
     """
 
-    def __init__(self) -> None:
+    def __init__(
+        self, max_batch_size: Optional[int] = None, keep_results: bool = True
+    ) -> None:
         """
         Instantiates
+        :param max_batch_size: maximum number of jobs launched at once, None to launch all the jobs in
+               a single batch. Jobs are generated lazily, one batch at a time.
+               If the launcher supports submitting jobs (see Launcher.submit), it is instead the maximum number
+               of jobs running at the same time, and a new job is launched as soon as a job completes.
+        :param keep_results: return the results of all the jobs from sweep(). With False and a max_batch_size,
+               the memory used by the sweep does not grow with its number of jobs.
         """
         super(BasicSweeper, self).__init__()
+        if max_batch_size is not None and max_batch_size < 1:
+            raise ValueError(
+                "max_batch_size must be a positive integer or None, got {}".format(
+                    max_batch_size
+                )
+            )
+        self.max_batch_size = max_batch_size
+        self.keep_results = keep_results
         self.job_results: Optional[Sequence[JobReturn]] = None
+        self.overrides: Optional[Iterator[Sequence[str]]] = None
+        self.num_jobs = 0
+        self.num_generated = 0
+        self.num_reported = 0
 
     def get_job_batch(self) -> Sequence[Sequence[str]]:
         """
         :return: A list of lists of strings, each inner list is the overrides for a single job
         that should be executed.
         """
+        if self.overrides is None:
+            self.overrides = self._generate_overrides()
 
+        batch_size = self.num_jobs - self.num_generated
+        if self.max_batch_size is not None:
+            batch_size = min(batch_size, self.max_batch_size)
+        batch = list(itertools.islice(self.overrides, batch_size))
+        self.num_generated += len(batch)
+        return batch
+
+    def _generate_overrides(self) -> Iterator[Sequence[str]]:
         assert self.arguments is not None
         lists = []
         for s in self.arguments:
             key, value = s.split("=")
             lists.append(["{}={}".format(key, val) for val in value.split(",")])
 
-        return list(itertools.product(*lists))
+        self.num_jobs = 1
+        for lst in lists:
+            self.num_jobs *= len(lst)
+        return itertools.product(*lists)
+
+    def sweep(self, arguments: List[str]) -> Any:
+        assert self.launcher is not None
+        if (
+            self.max_batch_size is None
+            or self.resume
+            or not self.launcher.supports_submit()
+        ):
+            return super().sweep(arguments)
+
+        self.arguments = arguments
+        self._open_journal()
+        self.overrides = self._generate_overrides()
+        pending: Dict["Future[JobReturn]", int] = {}
+        # results of the completed jobs whose batch is not reported yet
+        completed: Dict[int, JobReturn] = {}
+        returns: List[Sequence[JobReturn]] = []
+        for idx, overrides in enumerate(self.overrides):
+            while len(pending) >= self.max_batch_size:
+                self._wait_for_jobs(pending, completed, returns)
+            pending[self.launcher.submit(overrides, job_idx=idx)] = idx
+            self.num_generated += 1
+        while len(pending) > 0:
+            self._wait_for_jobs(pending, completed, returns)
+        return returns
+
+    def _wait_for_jobs(
+        self,
+        pending: Dict["Future[JobReturn]", int],
+        completed: Dict[int, JobReturn],
+        returns: List[Sequence[JobReturn]],
+    ) -> None:
+        """
+        Waits for at least one job to complete, and reports the results of the batches whose jobs all completed.
+        Results are reported in batches of max_batch_size jobs in the order of the jobs, as if the batches were
+        launched one at a time: a batch is reported as soon as its jobs and the jobs of the previous batches
+        completed.
+        """
+        assert self.max_batch_size is not None
+        done, _ = wait(pending, return_when=FIRST_COMPLETED)
+        for future in done:
+            completed[pending.pop(future)] = future.result()
+        while self.num_reported < self.num_jobs:
+            end = min(self.num_reported + self.max_batch_size, self.num_jobs)
+            if any(idx not in completed for idx in range(self.num_reported, end)):
+                break
+            batch = [completed.pop(idx) for idx in range(self.num_reported, end)]
+            self.num_reported = end
+            self._report_results(batch, returns)
 
     def is_done(self) -> bool:
-        # just one batch
-        return self.job_results is not None
+        return self.overrides is not None and self.num_generated >= self.num_jobs
 
     def update_results(self, job_results: Sequence[JobReturn]) -> None:
+        # results of the last batch
         self.job_results = copy.copy(job_results)
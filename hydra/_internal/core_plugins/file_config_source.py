@@ -1,18 +1,187 @@
 # Copyright (c) Facebook, Inc. and its affiliates. All Rights Reserved
+import copy
 import os
-from typing import List, Optional
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, List, NamedTuple, Optional, Set, Tuple
 
-from omegaconf import OmegaConf
+from omegaconf import Container, OmegaConf
 
 from hydra.core.object_type import ObjectType
 from hydra.plugins.config_source import ConfigLoadError, ConfigResult, ConfigSource
 
 
+def stat_signature(path: str) -> Optional[Tuple[int, int, int]]:
+    """
+    :param path: file or directory path
+    :return: (inode, mtime in ns, size) of the path, or None if it does not exist
+    """
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_ino, st.st_mtime_ns, st.st_size
+
+
+class CacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    size: int
+
+
+class ParsedConfigCache:
+    """
+    Process wide cache of parsed config files.
+    Entries are validated against the (inode, mtime, size) signature of the file and callers
+    always get their own copy of the cached node.
+    """
+
+    def __init__(self, max_size: int = 1024) -> None:
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[str, Tuple[Tuple[int, int, int], Container]]" = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+
+    def load(self, full_path: str) -> Optional[Container]:
+        """
+        :param full_path: real path of the config file
+        :return: a copy of the parsed config, or None if the file does not exist
+        """
+        signature = stat_signature(full_path)
+        if signature is None:
+            return None
+        with self._lock:
+            entry = self._entries.get(full_path)
+            if entry is not None and entry[0] == signature:
+                self.hits += 1
+                self._entries.move_to_end(full_path)
+                return copy.deepcopy(entry[1])
+            self.misses += 1
+
+        node = OmegaConf.load(full_path)
+        with self._lock:
+            self._entries[full_path] = (signature, copy.deepcopy(node))
+            self._entries.move_to_end(full_path)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+        return node
+
+    def info(self) -> CacheInfo:
+        with self._lock:
+            return CacheInfo(
+                hits=self.hits, misses=self.misses, size=len(self._entries)
+            )
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # the cache may be pickled along with FileConfigSource (e.g. when shipped to a launcher worker),
+        # entries and lock are not sent.
+        return {"max_size": self.max_size}
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__init__(max_size=state["max_size"])  # type: ignore
+
+
+class DirectoryIndex:
+    """
+    In memory index of the entries of the directories under a root directory.
+    Each directory is scanned once with os.scandir when first queried and is scanned again
+    only when its mtime changes (adding, removing or renaming an entry updates it).
+    """
+
+    def __init__(self, root: str) -> None:
+        self.root = root
+        # relative directory -> (directory signature, entry name -> type), entries are None if not a directory
+        self._dirs: Dict[
+            str, Tuple[Optional[Tuple[int, int, int]], Optional[Dict[str, ObjectType]]]
+        ] = {}
+
+    def get_type(self, path: str) -> ObjectType:
+        """
+        :param path: path relative to the root
+        :return: GROUP for directories, CONFIG for files and NOT_FOUND otherwise
+        """
+        path = os.path.normpath(path)
+        if path == os.curdir:
+            if self._entries(path) is None:
+                return ObjectType.NOT_FOUND
+            return ObjectType.GROUP
+        parent, name = os.path.split(path)
+        entries = self._entries(parent or os.curdir)
+        if entries is None:
+            return ObjectType.NOT_FOUND
+        return entries.get(name, ObjectType.NOT_FOUND)
+
+    def listdir(self, path: str) -> Optional[List[str]]:
+        """
+        :param path: directory path relative to the root
+        :return: the names of the entries in the directory, or None if it is not a directory
+        """
+        entries = self._entries(os.path.normpath(path))
+        if entries is None:
+            return None
+        return list(entries.keys())
+
+    def fingerprint(self) -> Tuple[Tuple[str, Optional[Tuple[int, int, int]]], ...]:
+        """
+        :return: the current signatures of all indexed directories
+        """
+        return tuple(
+            (path, stat_signature(os.path.join(self.root, path)))
+            for path in sorted(self._dirs.keys())
+        )
+
+    def _entries(self, path: str) -> Optional[Dict[str, ObjectType]]:
+        full_path = os.path.join(self.root, path)
+        signature = stat_signature(full_path)
+        cached = self._dirs.get(path)
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+
+        entries: Optional[Dict[str, ObjectType]] = None
+        if signature is not None:
+            try:
+                with os.scandir(full_path) as it:
+                    entries = {}
+                    for entry in it:
+                        if entry.is_dir():
+                            entries[entry.name] = ObjectType.GROUP
+                        elif entry.is_file():
+                            entries[entry.name] = ObjectType.CONFIG
+            except OSError:
+                entries = None
+        self._dirs[path] = (signature, entries)
+        return entries
+
+
 class FileConfigSource(ConfigSource):
-    def __init__(self, provider: str, path: str) -> None:
+    # parsed configs, shared by all file config sources in the process
+    parsed_cache = ParsedConfigCache()
+
+    def __init__(self, provider: str, path: str, use_index: bool = True) -> None:
+        """
+        :param provider: provider of the source
+        :param path: path of the source, for example file:///path/to/conf
+        :param use_index: answer group, config and list queries from an in memory directory index
+                          instead of querying the file system each time
+        """
         if path.find("://") == -1:
             path = f"{self.scheme()}://{path}"
         super().__init__(provider=provider, path=path)
+        self.index: Optional[DirectoryIndex] = None
+        if use_index:
+            self.index = DirectoryIndex(os.path.realpath(self.path))
+        # every file or directory this source answered a query about, used for fingerprinting.
+        # when the index is used only loaded files are tracked, directories are tracked by the index.
+        self._accessed: Set[str] = set()
 
     @staticmethod
     def scheme() -> str:
@@ -21,27 +190,40 @@ class FileConfigSource(ConfigSource):
     def load_config(self, config_path: str) -> ConfigResult:
         config_path = self._normalize_file_name(config_path)
         full_path = os.path.realpath(os.path.join(self.path, config_path))
-        if not os.path.exists(full_path):
+        self._accessed.add(full_path)
+        config = FileConfigSource.parsed_cache.load(full_path)
+        if config is None:
             raise ConfigLoadError(f"FileConfigSource: Config not found : {full_path}")
         return ConfigResult(
-            config=OmegaConf.load(full_path),
+            config=config,
             path=f"{self.scheme()}://{self.path}",
             provider=self.provider,
         )
 
     def is_group(self, config_path: str) -> bool:
-        full_path = os.path.realpath(os.path.join(self.path, config_path))
+        if self.index is not None:
+            return self.index.get_type(config_path) == ObjectType.GROUP
+        full_path = self._full_path(config_path)
         return os.path.isdir(full_path)
 
     def is_config(self, config_path: str) -> bool:
         config_path = self._normalize_file_name(config_path)
-        full_path = os.path.realpath(os.path.join(self.path, config_path))
+        if self.index is not None:
+            return self.index.get_type(config_path) == ObjectType.CONFIG
+        full_path = self._full_path(config_path)
         return os.path.isfile(full_path)
 
     def list(self, config_path: str, results_filter: Optional[ObjectType]) -> List[str]:
         files: List[str] = []
-        full_path = os.path.realpath(os.path.join(self.path, config_path))
-        for file in os.listdir(full_path):
+        if self.index is not None:
+            names = self.index.listdir(config_path)
+            if names is None:
+                raise NotADirectoryError(
+                    f"FileConfigSource: Not a directory : {os.path.join(self.path, config_path)}"
+                )
+        else:
+            names = os.listdir(self._full_path(config_path))
+        for file in names:
             file_path = os.path.join(config_path, file)
             self._list_add_result(
                 files=files,
@@ -51,3 +233,16 @@ class FileConfigSource(ConfigSource):
             )
 
         return sorted(list(set(files)))
+
+    def fingerprint(self) -> Optional[Hashable]:
+        # Adding or removing a file changes the mtime of the containing directory,
+        # editing a file changes its own signature.
+        files = tuple((path, stat_signature(path)) for path in sorted(self._accessed))
+        if self.index is None:
+            return files
+        return files, self.index.fingerprint()
+
+    def _full_path(self, config_path: str) -> str:
+        full_path = os.path.realpath(os.path.join(self.path, config_path))
+        self._accessed.add(full_path)
+        return full_path
@@ -1,14 +1,15 @@
 # Copyright (c) Facebook, Inc. and its affiliates. All Rights Reserved
-from typing import List, Optional, Tuple
-
-from omegaconf import OmegaConf
-from pkg_resources import (
-    resource_exists,
-    resource_isdir,
-    resource_listdir,
-    resource_stream,
-)
+import importlib.util
+import os
+from typing import Dict, Hashable, List, Optional, Set, Tuple
+
+from omegaconf import Container, OmegaConf
 
+from hydra._internal.core_plugins.file_config_source import (
+    DirectoryIndex,
+    FileConfigSource,
+    stat_signature,
+)
 from hydra.core.object_type import ObjectType
 from hydra.plugins.config_source import ConfigLoadError, ConfigResult, ConfigSource
 
@@ -16,6 +17,10 @@ from hydra.plugins.config_source import ConfigLoadError, ConfigResult, ConfigSou
 class PackageConfigSource(ConfigSource):
     def __init__(self, provider: str, path: str) -> None:
         super().__init__(provider=provider, path=path)
+        # module name -> index of the package directory, None if the package is not on the file system
+        self._indexes: Dict[str, Optional[DirectoryIndex]] = {}
+        # files and directories backing the resources this source was queried about
+        self._accessed: Set[str] = set()
 
     @staticmethod
     def scheme() -> str:
@@ -26,37 +31,39 @@ class PackageConfigSource(ConfigSource):
         module_name, resource_name = PackageConfigSource._split_module_and_resource(
             self.concat(self.path, config_path)
         )
+        index = self._get_index(module_name)
+        if index is not None:
+            full_path = os.path.join(index.root, resource_name)
+            self._accessed.add(full_path)
+            config = FileConfigSource.parsed_cache.load(full_path)
+        else:
+            config = self._load_resource(module_name, resource_name)
 
-        try:
-            with resource_stream(module_name, resource_name) as stream:
-                return ConfigResult(
-                    config=OmegaConf.load(stream),
-                    path=f"{self.scheme()}://{self.path}",
-                    provider=self.provider,
-                )
-        except FileNotFoundError:
+        if config is None:
             raise ConfigLoadError(
                 f"PackageConfigSource: Config not found: module={module_name}, resource_name={resource_name}"
             )
+        return ConfigResult(
+            config=config,
+            path=f"{self.scheme()}://{self.path}",
+            provider=self.provider,
+        )
 
-    @staticmethod
-    def _exists(module_name: str, resource_name: str) -> bool:
-        try:
-            if resource_exists(module_name, resource_name):
-                return True
-        except NotImplementedError:
-            return False
-        except ImportError:
-            return False
-        return False
+    def fingerprint(self) -> Optional[Hashable]:
+        # resources that are not backed by the file system (e.g. zipped eggs) are not tracked
+        files = tuple((path, stat_signature(path)) for path in sorted(self._accessed))
+        dirs = tuple(
+            (module_name, index.fingerprint())
+            for module_name, index in sorted(self._indexes.items())
+            if index is not None
+        )
+        return files, dirs
 
     def is_group(self, config_path: str) -> bool:
         module_name, resource_name = PackageConfigSource._split_module_and_resource(
             self.concat(self.path, config_path)
         )
-        return self._exists(module_name, resource_name) and resource_isdir(
-            module_name, resource_name
-        )
+        return self._get_type(module_name, resource_name) == ObjectType.GROUP
 
     def is_config(self, config_path: str) -> bool:
         config_path = self._normalize_file_name(filename=config_path)
@@ -64,9 +71,7 @@ class PackageConfigSource(ConfigSource):
         module_name, resource_name = PackageConfigSource._split_module_and_resource(
             fname
         )
-        return self._exists(module_name, resource_name) and not resource_isdir(
-            module_name, resource_name
-        )
+        return self._get_type(module_name, resource_name) == ObjectType.CONFIG
 
     def list(self, config_path: str, results_filter: Optional[ObjectType]) -> List[str]:
         files: List[str] = []
@@ -74,7 +79,20 @@ class PackageConfigSource(ConfigSource):
         module_name, resource_name = PackageConfigSource._split_module_and_resource(
             full_path
         )
-        for file in resource_listdir(module_name, resource_name):
+        index = self._get_index(module_name)
+        if index is not None:
+            names = index.listdir(resource_name)
+            if names is None:
+                raise NotADirectoryError(
+                    f"PackageConfigSource: Not a directory: module={module_name}, resource_name={resource_name}"
+                )
+        else:
+            from pkg_resources import resource_listdir
+
+            self._track(module_name, resource_name)
+            names = resource_listdir(module_name, resource_name)
+
+        for file in names:
             file_path = self.concat(config_path, file)
             self._list_add_result(
                 files=files,
@@ -85,6 +103,93 @@ class PackageConfigSource(ConfigSource):
 
         return sorted(list(set(files)))
 
+    def _get_index(self, module_name: str) -> Optional[DirectoryIndex]:
+        """
+        :param module_name: name of the module containing the resources
+        :return: an index of the directory of the module, or None if the module is not
+                 found in a directory on the file system
+        """
+        if module_name not in self._indexes:
+            directory = PackageConfigSource._find_module_dir(module_name)
+            index = None
+            if directory is not None:
+                index = DirectoryIndex(directory)
+            self._indexes[module_name] = index
+        return self._indexes[module_name]
+
+    @staticmethod
+    def _find_module_dir(module_name: str) -> Optional[str]:
+        try:
+            spec = importlib.util.find_spec(module_name)
+        except (ImportError, ValueError):
+            return None
+        if spec is None:
+            return None
+        locations = spec.submodule_search_locations
+        if locations is not None:
+            # namespace packages may span multiple directories
+            locations = list(locations)
+            if len(locations) != 1:
+                return None
+            directory = locations[0]
+        elif spec.has_location and spec.origin is not None:
+            directory = os.path.dirname(spec.origin)
+        else:
+            return None
+        if not os.path.isdir(directory):
+            # for example a package imported from a zip file
+            return None
+        return os.path.realpath(directory)
+
+    def _get_type(self, module_name: str, resource_name: str) -> ObjectType:
+        index = self._get_index(module_name)
+        if index is not None:
+            return index.get_type(resource_name)
+
+        from pkg_resources import resource_isdir
+
+        self._track(module_name, resource_name)
+        if not self._exists(module_name, resource_name):
+            return ObjectType.NOT_FOUND
+        if resource_isdir(module_name, resource_name):
+            return ObjectType.GROUP
+        return ObjectType.CONFIG
+
+    def _load_resource(
+        self, module_name: str, resource_name: str
+    ) -> Optional[Container]:
+        from pkg_resources import resource_stream
+
+        self._track(module_name, resource_name)
+        try:
+            with resource_stream(module_name, resource_name) as stream:
+                return OmegaConf.load(stream)
+        except FileNotFoundError:
+            return None
+
+    def _track(self, module_name: str, resource_name: str) -> None:
+        from pkg_resources import DefaultProvider, get_provider, resource_filename
+
+        try:
+            provider = get_provider(module_name)
+        except ImportError:
+            return
+        if isinstance(provider, DefaultProvider):
+            self._accessed.add(resource_filename(module_name, resource_name))
+
+    @staticmethod
+    def _exists(module_name: str, resource_name: str) -> bool:
+        from pkg_resources import resource_exists
+
+        try:
+            if resource_exists(module_name, resource_name):
+                return True
+        except NotImplementedError:
+            return False
+        except ImportError:
+            return False
+        return False
+
     @staticmethod
     def _split_module_and_resource(filename: str) -> Tuple[str, str]:
         sep = filename.find("/")
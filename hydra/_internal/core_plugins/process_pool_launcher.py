@@ -0,0 +1,188 @@
+# Copyright (c) Facebook, Inc. and its affiliates. All Rights Reserved
+import logging
+import multiprocessing
+import os
+import weakref
+from concurrent.futures import Future
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from omegaconf import DictConfig, open_dict
+
+from hydra.core.config_loader import ConfigLoader
+from hydra.core.hydra_config import HydraConfig
+from hydra.core.singleton import Singleton
+from hydra.core.utils import (
+    JobReturn,
+    configure_log,
+    filter_overrides,
+    run_job,
+    setup_globals,
+)
+from hydra.plugins.launcher import Launcher
+from hydra.types import TaskFunction
+
+log = logging.getLogger(__name__)
+
+# State of a worker process, initialized once when the worker starts
+_worker_state: Dict[str, Any] = {}
+
+
+class ProcessPoolLauncher(Launcher):
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        max_tasks_per_child: Optional[int] = None,
+        start_method: Optional[str] = None,
+    ) -> None:
+        """
+        Launches jobs in a pool of worker processes.
+        The workers are initialized once with the Hydra state and receive only the overrides of each job.
+        The pool is kept for subsequent launches by the same launcher.
+
+        :param max_workers: number of worker processes, None for the number of CPUs
+        :param max_tasks_per_child: number of jobs a worker runs before being replaced, None for no limit
+        :param start_method: multiprocessing start method, None to use fork when available
+        """
+        self.config: Optional[DictConfig] = None
+        self.config_loader: Optional[ConfigLoader] = None
+        self.task_function: Optional[TaskFunction] = None
+
+        self.max_workers = max_workers
+        self.max_tasks_per_child = max_tasks_per_child
+        self.start_method = start_method
+        self.pool: Optional[Any] = None
+
+    def setup(
+        self,
+        config: DictConfig,
+        config_loader: ConfigLoader,
+        task_function: TaskFunction,
+    ) -> None:
+        self.config = config
+        self.config_loader = config_loader
+        self.task_function = task_function
+
+    def launch(
+        self, job_overrides: Sequence[Sequence[str]], initial_job_idx: int = 0
+    ) -> Sequence[JobReturn]:
+        """
+        :param job_overrides: a List of List<String>, where each inner list is the arguments for one job run.
+        :param initial_job_idx: Initial job idx in batch.
+        :return: an array of return values from run_job with indexes corresponding to the input list indexes.
+        """
+        setup_globals()
+        assert self.config is not None
+        assert self.config_loader is not None
+        assert self.task_function is not None
+
+        configure_log(self.config.hydra.hydra_logging, self.config.hydra.verbose)
+        sweep_dir = Path(str(self.config.hydra.sweep.dir))
+        sweep_dir.mkdir(parents=True, exist_ok=True)
+
+        pool = self._get_pool()
+        log.info(
+            "ProcessPoolLauncher(max_workers={}) is launching {} jobs".format(
+                self.max_workers, len(job_overrides)
+            )
+        )
+        log.info("Launching jobs, sweep output dir : {}".format(sweep_dir))
+        jobs: List[Tuple[int, List[str]]] = []
+        for idx, overrides in enumerate(job_overrides, initial_job_idx):
+            log.info("\t#{} : {}".format(idx, " ".join(filter_overrides(overrides))))
+            jobs.append((idx, list(overrides)))
+
+        runs = list(pool.imap(execute_job, jobs))
+
+        for run in runs:
+            assert isinstance(run, JobReturn)
+        return runs
+
+    def submit(self, overrides: Sequence[str], job_idx: int) -> "Future[JobReturn]":
+        """
+        Launches a single job in the pool without waiting for it to complete.
+        :param overrides: job arguments
+        :param job_idx: job idx
+        :return: a future resolved with the JobReturn of the job
+        """
+        setup_globals()
+        assert self.config is not None
+        configure_log(self.config.hydra.hydra_logging, self.config.hydra.verbose)
+        Path(str(self.config.hydra.sweep.dir)).mkdir(parents=True, exist_ok=True)
+
+        log.info("\t#{} : {}".format(job_idx, " ".join(filter_overrides(overrides))))
+        future: "Future[JobReturn]" = Future()
+        future.set_running_or_notify_cancel()
+        # the callbacks are called from the result handler thread of the pool
+        self._get_pool().apply_async(
+            execute_job,
+            ((job_idx, list(overrides)),),
+            callback=future.set_result,
+            error_callback=future.set_exception,
+        )
+        return future
+
+    def _get_pool(self) -> Any:
+        if self.pool is None:
+            start_method = self.start_method
+            if (
+                start_method is None
+                and "fork" in multiprocessing.get_all_start_methods()
+            ):
+                # workers inherit the state of the parent without pickling it
+                start_method = "fork"
+            context = multiprocessing.get_context(start_method)
+            self.pool = context.Pool(
+                processes=self.max_workers or os.cpu_count(),
+                initializer=init_worker,
+                initargs=(
+                    Singleton.get_state(),
+                    self.config_loader,
+                    self.config,
+                    self.task_function,
+                ),
+                maxtasksperchild=self.max_tasks_per_child,
+            )
+            # stop the workers when the launcher is garbage collected or at exit
+            weakref.finalize(self, self.pool.terminate)
+        return self.pool
+
+
+def init_worker(
+    singleton_state: Dict[Any, Any],
+    config_loader: ConfigLoader,
+    config: DictConfig,
+    task_function: TaskFunction,
+) -> None:
+    """
+    Initializes a worker process, called once per worker
+    """
+    setup_globals()
+    Singleton.set_state(singleton_state)
+    _worker_state["config_loader"] = config_loader
+    _worker_state["config"] = config
+    _worker_state["task_function"] = task_function
+
+
+def execute_job(job: Tuple[int, List[str]]) -> JobReturn:
+    """
+    Runs a single job in a worker process
+    """
+    idx, overrides = job
+    config_loader: ConfigLoader = _worker_state["config_loader"]
+    config: DictConfig = _worker_state["config"]
+
+    sweep_config = config_loader.load_sweep_config(config, overrides)
+    with open_dict(sweep_config):
+        sweep_config.hydra.job.id = "{}_{}".format(sweep_config.hydra.job.name, idx)
+        sweep_config.hydra.job.num = idx
+    HydraConfig.instance().set_config(sweep_config)
+
+    ret = run_job(
+        config=sweep_config,
+        task_function=_worker_state["task_function"],
+        job_dir_key="hydra.sweep.dir",
+        job_subdir_key="hydra.sweep.subdir",
+        journal=sweep_config.hydra.sweep.journal,
+    )
+    return ret
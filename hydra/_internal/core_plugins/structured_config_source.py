@@ -1,7 +1,7 @@
 # Copyright (c) Facebook, Inc. and its affiliates. All Rights Reserved
 import importlib
 import warnings
-from typing import List, Optional
+from typing import Hashable, List, Optional
 
 from hydra.core.config_store import ConfigStore
 from hydra.core.object_type import ObjectType
@@ -36,6 +36,9 @@ class StructuredConfigSource(ConfigSource):
             config=ret.node, path=f"{self.scheme()}://{self.path}", provider=provider
         )
 
+    def fingerprint(self) -> Optional[Hashable]:
+        return self.store.version
+
     def is_group(self, config_path: str) -> bool:
         type_ = self.store.get_type(config_path.rstrip("/"))
         return type_ == ObjectType.GROUP
@@ -0,0 +1,140 @@
+# Copyright (c) Facebook, Inc. and its affiliates. All Rights Reserved
+import contextvars
+import logging
+import weakref
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import Optional, Sequence
+
+from omegaconf import DictConfig, open_dict
+
+from hydra.core.config_loader import ConfigLoader
+from hydra.core.hydra_config import HydraConfig
+from hydra.core.utils import (
+    JobReturn,
+    configure_log,
+    filter_overrides,
+    run_job,
+    setup_globals,
+)
+from hydra.plugins.launcher import Launcher
+from hydra.types import TaskFunction
+
+log = logging.getLogger(__name__)
+
+
+class ThreadsLauncher(Launcher):
+    def __init__(self, max_workers: Optional[int] = None) -> None:
+        """
+        Launches jobs in a pool of threads of the current process.
+        Suitable for I/O bound tasks and tasks releasing the GIL, where starting processes would dominate.
+        Jobs run in thread safe mode (see run_job): the working directory is not changed for the jobs,
+        tasks should use the job output directory from the Hydra config instead of relative paths.
+        The pool is kept for subsequent launches by the same launcher.
+
+        :param max_workers: number of threads, None for the ThreadPoolExecutor default
+        """
+        self.config: Optional[DictConfig] = None
+        self.config_loader: Optional[ConfigLoader] = None
+        self.task_function: Optional[TaskFunction] = None
+
+        self.max_workers = max_workers
+        self.executor: Optional[ThreadPoolExecutor] = None
+
+    def setup(
+        self,
+        config: DictConfig,
+        config_loader: ConfigLoader,
+        task_function: TaskFunction,
+    ) -> None:
+        self.config = config
+        self.config_loader = config_loader
+        self.task_function = task_function
+
+    def launch(
+        self, job_overrides: Sequence[Sequence[str]], initial_job_idx: int = 0
+    ) -> Sequence[JobReturn]:
+        """
+        :param job_overrides: a List of List<String>, where each inner list is the arguments for one job run.
+        :param initial_job_idx: Initial job idx in batch.
+        :return: an array of return values from run_job with indexes corresponding to the input list indexes.
+        """
+        setup_globals()
+        sweep_dir = self._prepare()
+        log.info(
+            "ThreadsLauncher(max_workers={}) is launching {} jobs".format(
+                self.max_workers, len(job_overrides)
+            )
+        )
+        log.info("Launching jobs, sweep output dir : {}".format(sweep_dir))
+
+        futures = [
+            self._submit(overrides, idx)
+            for idx, overrides in enumerate(job_overrides, initial_job_idx)
+        ]
+        runs = [future.result() for future in futures]
+
+        for run in runs:
+            assert isinstance(run, JobReturn)
+        return runs
+
+    def submit(self, overrides: Sequence[str], job_idx: int) -> "Future[JobReturn]":
+        """
+        Launches a single job in the pool without waiting for it to complete.
+        :param overrides: job arguments
+        :param job_idx: job idx
+        :return: a future resolved with the JobReturn of the job
+        """
+        setup_globals()
+        self._prepare()
+        return self._submit(overrides, job_idx)
+
+    def _prepare(self) -> Path:
+        assert self.config is not None
+        configure_log(self.config.hydra.hydra_logging, self.config.hydra.verbose)
+        sweep_dir = Path(str(self.config.hydra.sweep.dir))
+        sweep_dir.mkdir(parents=True, exist_ok=True)
+        return sweep_dir
+
+    def _submit(self, overrides: Sequence[str], idx: int) -> "Future[JobReturn]":
+        assert self.config is not None
+        assert self.config_loader is not None
+        assert self.task_function is not None
+        log.info("\t#{} : {}".format(idx, " ".join(filter_overrides(overrides))))
+        # configs are composed in the launching thread, the config loader is not thread safe
+        sweep_config = self.config_loader.load_sweep_config(
+            self.config, list(overrides)
+        )
+        with open_dict(sweep_config):
+            sweep_config.hydra.job.id = "{}_{}".format(sweep_config.hydra.job.name, idx)
+            sweep_config.hydra.job.num = idx
+        return self._get_executor().submit(
+            execute_job, sweep_config, self.task_function
+        )
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self.executor is None:
+            self.executor = ThreadPoolExecutor(max_workers=self.max_workers)
+            # stop the threads once their jobs are done when the launcher is garbage collected or at exit
+            weakref.finalize(self, self.executor.shutdown, wait=False)
+        return self.executor
+
+
+def execute_job(sweep_config: DictConfig, task_function: TaskFunction) -> JobReturn:
+    """
+    Runs a single job in a worker thread.
+    The job runs in its own context, isolating its Hydra config from the other jobs.
+    """
+    return contextvars.Context().run(_run_job, sweep_config, task_function)
+
+
+def _run_job(sweep_config: DictConfig, task_function: TaskFunction) -> JobReturn:
+    HydraConfig.instance().set_config(sweep_config, local=True)
+    return run_job(
+        config=sweep_config,
+        task_function=task_function,
+        job_dir_key="hydra.sweep.dir",
+        job_subdir_key="hydra.sweep.subdir",
+        journal=sweep_config.hydra.sweep.journal,
+        thread_safe=True,
+    )
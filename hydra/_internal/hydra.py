@@ -5,6 +5,7 @@ import os
 import string
 from argparse import ArgumentParser
 from collections import defaultdict
+from pathlib import Path
 from typing import Any, Callable, DefaultDict, List, Optional, Sequence, Type
 
 from omegaconf import DictConfig, OmegaConf, open_dict
@@ -14,9 +15,11 @@ from hydra.core.config_loader import ConfigLoader
 from hydra.core.config_search_path import ConfigSearchPath
 from hydra.core.hydra_config import HydraConfig
 from hydra.core.plugins import Plugins
+from hydra.core.sweep_journal import SweepJournal
 from hydra.core.utils import (
     JobReturn,
     JobRuntime,
+    StageTimings,
     configure_log,
     run_job,
     setup_globals,
@@ -26,6 +29,7 @@ from hydra.plugins.completion_plugin import CompletionPlugin
 from hydra.plugins.config_source import ConfigSource
 from hydra.plugins.launcher import Launcher
 from hydra.plugins.search_path_plugin import SearchPathPlugin
+from hydra.plugins.step_sweeper import StepSweeper
 from hydra.plugins.sweeper import Sweeper
 from hydra.types import TaskFunction
 
@@ -96,19 +100,26 @@ class Hydra:
             config_name=config_name, overrides=overrides, with_log_configuration=True
         )
         HydraConfig.instance().set_config(cfg)
-        return run_job(
-            config=cfg,
-            task_function=task_function,
-            job_dir_key="hydra.run.dir",
-            job_subdir_key=None,
-        )
+        try:
+            return run_job(
+                config=cfg,
+                task_function=task_function,
+                job_dir_key="hydra.run.dir",
+                job_subdir_key=None,
+            )
+        finally:
+            self._dump_timings(cfg)
 
     def multirun(
         self,
         config_name: Optional[str],
         task_function: TaskFunction,
         overrides: List[str],
+        resume: bool = False,
     ) -> Any:
+        """
+        :param resume: skip the jobs the journal of the sweep records as completed
+        """
         # Initial config is loaded without strict (individual job configs may have strict).
         cfg = self.compose_config(
             config_name=config_name,
@@ -120,8 +131,53 @@ class Hydra:
         sweeper = Plugins.instantiate_sweeper(
             config=cfg, config_loader=self.config_loader, task_function=task_function
         )
+        if resume:
+            if not isinstance(sweeper, StepSweeper):
+                raise ValueError(
+                    "{} does not support resuming sweeps".format(type(sweeper).__name__)
+                )
+            sweeper.resume = True
         task_overrides = cfg.hydra.overrides.task
-        return sweeper.sweep(arguments=task_overrides)
+        try:
+            return sweeper.sweep(arguments=task_overrides)
+        finally:
+            self._dump_timings(cfg)
+
+    def resume(
+        self,
+        sweep_dir: str,
+        config_name: Optional[str],
+        task_function: TaskFunction,
+        overrides: List[str],
+    ) -> Any:
+        """
+        Resumes a sweep from its journal, launching only the jobs that did not complete
+        :param sweep_dir: output directory of the sweep
+        :param overrides: additional overrides, replacing the overrides of the sweep for the same keys
+        """
+        overrides = overrides + ["hydra.sweep.dir={}".format(sweep_dir)]
+        cfg = self.compose_config(
+            config_name=config_name, overrides=overrides, strict=False
+        )
+        if cfg.hydra.sweep.journal is None:
+            raise ValueError("Cannot resume a sweep, hydra.sweep.journal is disabled")
+        journal_file = str(cfg.hydra.sweep.journal)
+        sweep_overrides = SweepJournal(journal_file).load().overrides
+        if sweep_overrides is None:
+            raise ValueError("Sweep journal not found : {}".format(journal_file))
+
+        keys = {override.split("=", 1)[0] for override in overrides}
+        overrides = [
+            override
+            for override in sweep_overrides
+            if override.split("=", 1)[0] not in keys
+        ] + overrides
+        return self.multirun(
+            config_name=config_name,
+            task_function=task_function,
+            overrides=overrides,
+            resume=True,
+        )
 
     @staticmethod
     def get_sanitized_hydra_cfg(src_cfg: DictConfig) -> DictConfig:
@@ -169,7 +225,7 @@ class Hydra:
     def shell_completion(
         self, config_name: Optional[str], overrides: List[str]
     ) -> None:
-        subcommands = ["install", "uninstall", "query"]
+        subcommands = ["install", "uninstall", "query", "serve"]
         arguments = OmegaConf.from_dotlist(overrides)
         num_commands = sum(1 for key in subcommands if arguments[key] is not None)
         if num_commands != 1:
@@ -197,6 +253,16 @@ class Hydra:
         elif arguments.query is not None:
             plugin = find_plugin(arguments.query)
             plugin.query(config_name=config_name)
+        elif arguments.serve is not None:
+            if arguments.socket is None:
+                raise ValueError("serve expects the path of the Unix socket in socket")
+            plugin = find_plugin(arguments.serve)
+            idle_timeout = arguments.idle_timeout
+            plugin.serve(
+                config_name=config_name,
+                socket_path=str(arguments.socket),
+                idle_timeout=600.0 if idle_timeout is None else float(idle_timeout),
+            )
 
     @staticmethod
     def format_args_help(args_parser: ArgumentParser) -> str:
@@ -211,29 +277,16 @@ class Hydra:
         return s
 
     def list_all_config_groups(self, parent: str = "") -> Sequence[str]:
-        from hydra.core.object_type import ObjectType
-
-        groups: List[str] = []
-        for group in self.config_loader.list_groups(parent):
-            if parent == "":
-                group_name = group
-            else:
-                group_name = "{}/{}".format(parent, group)
-            files = self.config_loader.get_group_options(group_name, ObjectType.CONFIG)
-            dirs = self.config_loader.get_group_options(group_name, ObjectType.GROUP)
-            if len(files) > 0:
-                groups.append(group_name)
-            if len(dirs) > 0:
-                groups.extend(self.list_all_config_groups(group_name))
-        return groups
+        return self.config_loader.get_group_tree().list_all_config_groups(parent)
 
     def format_config_groups(
         self, predicate: Callable[[str], bool], compact: bool = True
     ) -> str:
-        groups = [x for x in self.list_all_config_groups() if predicate(x)]
+        tree = self.config_loader.get_group_tree()
+        groups = [x for x in tree.list_all_config_groups() if predicate(x)]
         s = ""
         for group in sorted(groups):
-            options = sorted(self.config_loader.get_group_options(group))
+            options = tree.get_group_options(group)
             if compact:
                 items = ", ".join(options)
                 line = "{}: {}".format(group, items)
@@ -348,13 +401,21 @@ class Hydra:
             )
 
     def _print_composition_trace(self) -> None:
-        # Print configurations used to compose the config object
+        # Print configurations used to compose the config object, and the time spent on each
         assert log is not None
         log.debug("")
         self._log_header("Composition trace", filler="*")
-        box: List[List[str]] = [
-            ["Config name", "Search path", "Provider", "Schema provider"]
+        header = [
+            "Config name",
+            "Search path",
+            "Provider",
+            "Schema provider",
+            "Lookup ms",
+            "Load ms",
+            "Schema merge ms",
+            "Merge ms",
         ]
+        box: List[List[str]] = [header]
         for trace in self.config_loader.get_load_history():
             box.append(
                 [
@@ -363,29 +424,47 @@ class Hydra:
                     trace.provider if trace.provider is not None else "",
                     trace.schema_provider if trace.schema_provider is not None else "",
                 ]
+                + [
+                    "{:.2f}".format(duration * 1000)
+                    for duration in (
+                        trace.lookup_time,
+                        trace.load_time,
+                        trace.schema_merge_time,
+                        trace.merge_time,
+                    )
+                ]
+            )
+        self._log_table(box)
+
+    def _print_stage_timings(self) -> None:
+        assert log is not None
+        log.debug("")
+        self._log_header("Stage timings", filler="*")
+        box: List[List[str]] = [["Stage", "Count", "Total ms", "Max ms"]]
+        for stage, stats in sorted(StageTimings.instance().get().items()):
+            box.append(
+                [
+                    stage,
+                    str(int(stats["count"])),
+                    "{:.2f}".format(stats["total"] * 1000),
+                    "{:.2f}".format(stats["max"] * 1000),
+                ]
             )
+        self._log_table(box)
+
+    @staticmethod
+    def _log_table(box: List[List[str]]) -> None:
+        # the first row is the header
+        assert log is not None
         padding = get_column_widths(box)
-        del box[0]
 
-        self._log_header(
-            "| {} | {} | {} | {} |".format(
-                "Config name".ljust(padding[0]),
-                "Search path".ljust(padding[1]),
-                "Provider".ljust(padding[2]),
-                "Schema provider".ljust(padding[3]),
-            ),
-            filler="-",
-        )
+        def format_row(row: List[str]) -> str:
+            cells = [cell.ljust(pad) for cell, pad in zip(row, padding)]
+            return "| {} |".format(" | ".join(cells))
 
-        for row in box:
-            log.debug(
-                "| {} | {} | {} | {} |".format(
-                    row[0].ljust(padding[0]),
-                    row[1].ljust(padding[1]),
-                    row[2].ljust(padding[2]),
-                    row[3].ljust(padding[3]),
-                )
-            )
+        Hydra._log_header(format_row(box[0]), filler="-")
+        for row in box[1:]:
+            log.debug(format_row(row))
 
     def _print_debug_info(self) -> None:
         assert log is not None
@@ -393,6 +472,26 @@ class Hydra:
             self._print_plugins()
             self._print_search_path()
             self._print_composition_trace()
+            self._print_stage_timings()
+
+    def _dump_timings(self, cfg: DictConfig) -> None:
+        """
+        Writes the stage timings of the process and the composition timings of every loaded config
+        to hydra.timings_file as JSON, if set
+        """
+        if cfg.hydra.timings_file is None:
+            return
+        import json
+        from dataclasses import asdict
+
+        timings = dict(
+            stages=StageTimings.instance().get(),
+            configs=[asdict(trace) for trace in self.config_loader.get_load_history()],
+        )
+        timings_file = Path(str(cfg.hydra.timings_file))
+        timings_file.parent.mkdir(parents=True, exist_ok=True)
+        with open(str(timings_file), "w") as file:
+            json.dump(timings, file, indent=2)
 
     def compose_config(
         self,
@@ -0,0 +1,209 @@
+# Copyright (c) Facebook, Inc. and its affiliates. All Rights Reserved
+"""
+On-disk manifest of the discovered plugins.
+The manifest records the module and the plugin types of every plugin class, allowing plugins of a given
+type to be resolved by importing only the modules defining them (and the external plugin modules, which
+may have side effects such as registering configs).
+The manifest is opt-in (see get_manifest_file()). It is keyed by the versions of the installed plugin
+distributions: installing, upgrading or removing a plugin invalidates it. Plugins that are not installed
+from a distribution with a version (e.g. editable installs) are keyed by their files instead, so editing
+them also invalidates it.
+"""
+import hashlib
+import importlib
+import json
+import os
+import sys
+from typing import Any, Dict, List, Optional, Tuple, Type
+
+from hydra.plugins.plugin import Plugin
+
+
+def _qualified_name(clazz: type) -> str:
+    return f"{clazz.__module__}.{clazz.__qualname__}"
+
+
+def get_manifest_file() -> Optional[str]:
+    """
+    The manifest is enabled by HYDRA_PLUGINS_MANIFEST. A value of 1 stores it in the user cache dir, in
+    $XDG_CACHE_HOME/hydra (~/.cache/hydra by default) with one manifest per Python environment.
+    Any other non empty value (except 0) is the path of the manifest file.
+    :return: the manifest file, None if the manifest is disabled.
+    """
+    env = os.environ.get("HYDRA_PLUGINS_MANIFEST", "")
+    if env in ("", "0"):
+        return None
+    if env != "1":
+        return env
+    cache_dir = os.environ.get("XDG_CACHE_HOME") or os.path.join(
+        os.path.expanduser("~"), ".cache"
+    )
+    # one manifest per Python environment
+    env_id = hashlib.sha1(sys.prefix.encode("utf-8")).hexdigest()[:12]
+    return os.path.join(cache_dir, "hydra", f"plugins-{env_id}.json")
+
+
+def _normalize(name: str) -> str:
+    return name.lower().replace("-", "_").replace(".", "_")
+
+
+def _distribution_versions(site_dir: str) -> Dict[str, str]:
+    """
+    :return: the versions of the distributions installed in site_dir, by normalized name.
+             They are read from the names of the .dist-info and .egg-info directories
+             (e.g. hydra_core-1.0.0.dist-info) without reading their metadata.
+    """
+    versions: Dict[str, str] = {}
+    try:
+        entries = os.listdir(site_dir)
+    except OSError:
+        return versions
+    for entry in entries:
+        stem, ext = os.path.splitext(entry)
+        if ext not in (".dist-info", ".egg-info"):
+            continue
+        parts = stem.split("-")
+        # egg-info directories of editable installs have no version
+        if len(parts) >= 2:
+            versions[_normalize(parts[0])] = parts[1]
+    return versions
+
+
+def _file_stamps(path: str) -> List[Tuple[str, int, int]]:
+    """
+    :return: path, mtime and size of the modules in path (a module or a package)
+    """
+    files = []
+    if os.path.isfile(path):
+        candidates = [path]
+    else:
+        candidates = []
+        for root, dirs, names in os.walk(path):
+            dirs[:] = sorted(d for d in dirs if d != "__pycache__")
+            candidates.extend(os.path.join(root, name) for name in sorted(names))
+    for file in candidates:
+        if not file.endswith(".py"):
+            continue
+        try:
+            st = os.stat(file)
+        except OSError:
+            continue
+        files.append((file, st.st_mtime_ns, st.st_size))
+    return files
+
+
+def compute_key(paths: List[str]) -> str:
+    """
+    :param paths: directories of the top level plugin packages
+    :return: a key that changes whenever a plugin distribution is installed, upgraded or removed, or a module
+             of a plugin without a distribution version is added, removed or modified
+    """
+    from hydra import __version__
+    from hydra._internal import core_plugins
+
+    core_paths = list(core_plugins.__path__)  # type: ignore
+    entries: List[Any] = []
+    for path in paths:
+        if path in core_paths:
+            # site_dir/hydra/_internal/core_plugins
+            site_dir = os.path.dirname(os.path.dirname(os.path.dirname(path)))
+            version = _distribution_versions(site_dir).get("hydra_core")
+            entries.append([path, version or _file_stamps(path)])
+            continue
+        # site_dir/hydra_plugins, each plugin is a package (or a module) in it
+        versions = _distribution_versions(os.path.dirname(path))
+        try:
+            names = sorted(os.listdir(path))
+        except OSError:
+            continue
+        for name in names:
+            if name == "__pycache__" or name.startswith("."):
+                continue
+            module_name = name[: -len(".py")] if name.endswith(".py") else name
+            version = versions.get(_normalize(module_name))
+            entries.append(
+                [path, name, version or _file_stamps(os.path.join(path, name))]
+            )
+
+    content = json.dumps([__version__, sys.version, paths, entries])
+    return hashlib.sha1(content.encode("utf-8")).hexdigest()
+
+
+def load(manifest_file: str, key: str) -> Optional[Dict[str, Any]]:
+    """
+    :return: the manifest, or None if it does not exist or does not match the key
+    """
+    try:
+        with open(manifest_file, "r") as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(manifest, dict) or manifest.get("key") != key:
+        return None
+    if not isinstance(manifest.get("plugins"), list) or not isinstance(
+        manifest.get("modules"), list
+    ):
+        return None
+    return manifest
+
+
+def save(
+    manifest_file: str, key: str, plugins: List[Type[Plugin]], modules: List[str]
+) -> None:
+    """
+    Writes the manifest, failures are ignored (the manifest is only an optimization)
+    :param manifest_file: manifest file
+    :param key: manifest key, see compute_key()
+    :param plugins: all discovered plugin classes
+    :param modules: modules to import whenever plugins are resolved from the manifest
+    """
+    entries = []
+    for plugin in plugins:
+        entries.append(
+            dict(
+                module=plugin.__module__,
+                name=plugin.__qualname__,
+                types=[
+                    _qualified_name(base)
+                    for base in plugin.__mro__
+                    if issubclass(base, Plugin)
+                ],
+            )
+        )
+    tmp_file = f"{manifest_file}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(os.path.dirname(manifest_file), exist_ok=True)
+        with open(tmp_file, "w") as f:
+            json.dump(dict(key=key, plugins=entries, modules=modules), f)
+        os.replace(tmp_file, manifest_file)
+    except OSError:
+        try:
+            os.remove(tmp_file)
+        except OSError:
+            pass
+
+
+def resolve(
+    manifest: Dict[str, Any], plugin_type: Type[Plugin]
+) -> Optional[List[Type[Plugin]]]:
+    """
+    Imports the plugins of the given type listed in the manifest
+    :return: the plugin classes, or None if any of them cannot be resolved
+    """
+    type_name = _qualified_name(plugin_type)
+    ret: List[Type[Plugin]] = []
+    try:
+        for module in manifest["modules"]:
+            importlib.import_module(module)
+        for entry in manifest["plugins"]:
+            if type_name not in entry["types"]:
+                continue
+            obj: Any = importlib.import_module(entry["module"])
+            for attr in entry["name"].split("."):
+                obj = getattr(obj, attr)
+            if not isinstance(obj, type) or not issubclass(obj, plugin_type):
+                return None
+            ret.append(obj)
+    except (ImportError, AttributeError, KeyError, TypeError):
+        return None
+    return ret
@@ -1,6 +1,5 @@
 # Copyright (c) Facebook, Inc. and its affiliates. All Rights Reserved
 import argparse
-import inspect
 import os
 import sys
 from os.path import dirname, join, normpath, realpath
@@ -18,15 +17,15 @@ def detect_calling_file_or_module(
     calling_file = None
     calling_module = None
 
-    stack = inspect.stack()
-    frame = stack[stack_depth]
+    # sys._getframe does not read the source files of the frames, unlike inspect.stack
+    frame = sys._getframe(stack_depth)
     if is_notebook():
-        pynb_dir = frame[0].f_globals["_dh"][0]
+        pynb_dir = frame.f_globals["_dh"][0]
         calling_file = join(pynb_dir, "notebook.ipynb")
         return calling_file, None
 
     try:
-        calling_file = frame[0].f_locals["__file__"]
+        calling_file = frame.f_locals["__file__"]
     except KeyError:
         pass
     try:
@@ -37,10 +36,10 @@ def detect_calling_file_or_module(
                 break
 
         if calling_module is None:
-            calling_module = frame[0].f_globals[frame[3]].__module__
+            calling_module = frame.f_globals[frame.f_code.co_name].__module__
     except KeyError:
         try:
-            calling_module = frame[0].f_locals["self"].__module__
+            calling_module = frame.f_locals["self"].__module__
         except KeyError:
             pass
 
@@ -183,10 +182,13 @@ def run_hydra(
             sys.exit(0)
 
         has_show_cfg = args.cfg is not None
-        num_commands = args.run + has_show_cfg + args.multirun + args.shell_completion
+        has_resume = args.resume is not None
+        num_commands = (
+            args.run + has_show_cfg + args.multirun + has_resume + args.shell_completion
+        )
         if num_commands > 1:
             raise ValueError(
-                "Only one of --run, --multirun,  -cfg and --shell_completion can be specified"
+                "Only one of --run, --multirun, --resume, -cfg and --shell_completion can be specified"
             )
         if num_commands == 0:
             args.run = True
@@ -202,6 +204,13 @@ def run_hydra(
                 task_function=task_function,
                 overrides=args.overrides,
             )
+        elif has_resume:
+            hydra.resume(
+                sweep_dir=args.resume,
+                config_name=config_name,
+                task_function=task_function,
+                overrides=args.overrides,
+            )
         elif args.cfg:
             hydra.show_cfg(
                 config_name=config_name, overrides=args.overrides, cfg_type=args.cfg
@@ -255,6 +264,12 @@ def get_args_parser() -> argparse.ArgumentParser:
         help="Run multiple jobs with the configured launcher",
     )
 
+    parser.add_argument(
+        "--resume",
+        metavar="SWEEP_DIR",
+        help="Resume the multirun in SWEEP_DIR, launching only the jobs that did not complete",
+    )
+
     shell = "SHELL_NAME"
     install_cmd = 'eval "$({} -sc install={})"'.format(_get_exec_command(), shell)
     uninstall_cmd = 'eval "$({} -sc uninstall={})"'.format(_get_exec_command(), shell)
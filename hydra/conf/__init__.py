@@ -56,6 +56,8 @@ class RunDir:
 class SweepDir:
     dir: str = MISSING
     subdir: str = MISSING
+    # journal recording the outcome of the jobs, used to resume the sweep. null to disable
+    journal: Optional[str] = "${hydra.sweep.dir}/journal.jsonl"
 
 
 @dataclass
@@ -107,6 +109,30 @@ class RuntimeConf:
     cwd: str = MISSING
 
 
+@dataclass
+class JobCacheConf:
+    # reuse the results of previous jobs with an identical task config instead of running them
+    enabled: bool = False
+    # cache directory
+    dir: str = "${hydra.runtime.cwd}/.hydra_job_cache"
+    # version of the task code, part of the cache key. change it to invalidate cached results
+    code_version: Optional[str] = None
+
+
+@dataclass
+class JobExecutionConf:
+    # end failed jobs with a failed JobReturn instead of raising, allowing the other jobs of a sweep to run
+    catch_failures: bool = False
+    # number of times a failed job is retried
+    retries: int = 0
+    # delay in seconds before the first retry, multiplied by retry_backoff after each retry
+    retry_delay: float = 1.0
+    retry_backoff: float = 2.0
+    # wall-clock timeout of a job attempt in seconds, enforced by running the job in a child process.
+    # null for no timeout
+    timeout: Optional[float] = None
+
+
 @dataclass
 class HydraConf:
     # Normal run output configuration
@@ -138,6 +164,12 @@ class HydraConf:
 
     job: JobConf = JobConf()
 
+    # Cache of the job results
+    job_cache: JobCacheConf = JobCacheConf()
+
+    # Failure handling and timeout of the jobs
+    job_execution: JobExecutionConf = JobExecutionConf()
+
     # populated at runtime
     runtime: RuntimeConf = RuntimeConf()
 
@@ -151,6 +183,10 @@ class HydraConf:
     # TODO: good use case for Union support in OmegaConf
     verbose: Any = False
 
+    # JSON file to write the stage timings of Hydra and the composition timings of each config to,
+    # once the run or multirun is done. relative to the original working directory, null to disable
+    timings_file: Optional[str] = None
+
 
 ConfigStore.instance().store(
     name="hydra_config",
@@ -1,7 +1,7 @@
 # Copyright (c) Facebook, Inc. and its affiliates. All Rights Reserved
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
-from typing import Any, List, Optional
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
 
 from omegaconf import DictConfig
 
@@ -16,6 +16,13 @@ class LoadTrace:
     path: Optional[str]
     provider: Optional[str]
     schema_provider: Optional[str] = None
+    # durations in seconds: finding the source of the config, loading it from the source,
+    # merging it into its schema and merging it into the composed config.
+    # compositions reusing cached results report the timings of the composition that loaded the config.
+    lookup_time: float = 0.0
+    load_time: float = 0.0
+    schema_merge_time: float = 0.0
+    merge_time: float = 0.0
 
     def __eq__(self, other: Any) -> bool:
         if isinstance(other, tuple):
@@ -32,6 +39,53 @@ class LoadTrace:
         return str((self.filename, self.path, self.provider, self.schema_provider))
 
 
+@dataclass
+class ConfigGroupNode:
+    # options of the group (configs) and its child groups, sorted
+    configs: List[str] = field(default_factory=list)
+    groups: List[str] = field(default_factory=list)
+
+
+@dataclass
+class ConfigGroupTree:
+    """
+    Snapshot of the config groups of all the config sources, merged.
+    The root group is named "".
+    """
+
+    nodes: Dict[str, ConfigGroupNode] = field(default_factory=dict)
+
+    def get_group_options(
+        self, group_name: str, results_filter: Optional[ObjectType] = ObjectType.CONFIG
+    ) -> List[str]:
+        node = self.nodes.get(group_name)
+        if node is None:
+            return []
+        if results_filter == ObjectType.CONFIG:
+            return list(node.configs)
+        elif results_filter == ObjectType.GROUP:
+            return list(node.groups)
+        else:
+            return sorted(set(node.configs + node.groups))
+
+    def list_all_config_groups(self, parent: str = "") -> List[str]:
+        """
+        :param parent: group to list the descendants of
+        :return: the groups under parent with at least one option, depth first
+        """
+        groups: List[str] = []
+        node = self.nodes.get(parent)
+        if node is None:
+            return groups
+        for group in node.groups:
+            group_name = group if parent == "" else "{}/{}".format(parent, group)
+            child = self.nodes[group_name]
+            if len(child.configs) > 0:
+                groups.append(group_name)
+            groups.extend(self.list_all_config_groups(group_name))
+        return groups
+
+
 class ConfigLoader(ABC):
     """
     Config loader interface
@@ -77,3 +131,26 @@ class ConfigLoader(ABC):
         self, group_name: str, results_filter: Optional[ObjectType] = ObjectType.CONFIG
     ) -> List[str]:
         ...
+
+    def get_group_tree(self) -> ConfigGroupTree:
+        """
+        :return: snapshot of the config groups, built from list_groups() and get_group_options().
+                 implementations that can keep it until a config source changes should override this.
+        """
+        tree = ConfigGroupTree()
+
+        def add_group(group_name: str) -> None:
+            node = ConfigGroupNode(
+                configs=sorted(
+                    self.get_group_options(group_name, results_filter=ObjectType.CONFIG)
+                ),
+                groups=sorted(self.list_groups(group_name)),
+            )
+            tree.nodes[group_name] = node
+            for group in node.groups:
+                add_group(
+                    group if group_name == "" else "{}/{}".format(group_name, group)
+                )
+
+        add_group("")
+        return tree
@@ -1,14 +1,18 @@
 # Copyright (c) Facebook, Inc. and its affiliates. All Rights Reserved
 import copy
-from dataclasses import dataclass
+import itertools
+from dataclasses import dataclass, is_dataclass
 from typing import Any, Dict, List, Optional
 
-from omegaconf import OmegaConf
+from omegaconf import Container, OmegaConf
 
 from hydra.core.object_type import ObjectType
 from hydra.core.singleton import Singleton
 from hydra.plugins.config_source import ConfigLoadError
 
+# Process wide version counter, versions stay unique even if the ConfigStore state is restored.
+_versions = itertools.count(1)
+
 
 class ConfigStoreWithProvider:
     def __init__(self, provider: str) -> None:
@@ -47,9 +51,12 @@ class ConfigStore(metaclass=Singleton):
         return Singleton.instance(ConfigStore, *args, **kwargs)  # type: ignore
 
     repo: Dict[str, Any]
+    # changes whenever a node is stored
+    version: int
 
     def __init__(self) -> None:
         self.repo = {}
+        self.version = 0
 
     def store(
         self,
@@ -74,28 +81,64 @@ class ConfigStore(metaclass=Singleton):
                     cur[d] = {}
                 cur = cur[d]
 
-        if path is not None and path != "":
-            cfg = OmegaConf.create()
-            cfg.update_node(path, OmegaConf.structured(node))
+        stored: Any
+        if isinstance(node, type) and is_dataclass(node):
+            # Structured config classes are converted to a config node the first time they are loaded.
+            # (instances are converted right away as they may be modified by the caller)
+            stored = node
         else:
-            cfg = OmegaConf.structured(node)
+            stored = ConfigStore._create_node(node, path)
 
         if not name.endswith(".yaml"):
             name = f"{name}.yaml"
         assert isinstance(cur, dict)
-        cfg_copy = copy.deepcopy(cfg)
         cur[name] = ConfigNode(
-            name=name, node=cfg_copy, group=group, path=path, provider=provider
+            name=name, node=stored, group=group, path=path, provider=provider
         )
+        self.version = next(_versions)
 
     def load(self, config_path: str) -> ConfigNode:
+        """
+        Loads a config node from the repository.
+        The returned node is shared and read-only, it can be merged into other configs as is.
+        Use copy_node() to get a copy that can be modified.
+        :param config_path: config path, for example hydra/launcher/basic.yaml
+        :return: the config node
+        """
         ret = self._load(config_path)
+        if not isinstance(ret.node, Container):
+            # lazily registered structured config, cache the created node
+            ret.node = ConfigStore._create_node(ret.node, ret.path)
 
         # shallow copy to avoid changing the original stored ConfigNode
         ret = copy.copy(ret)
         assert isinstance(ret, ConfigNode)
-        # copy to avoid mutations to config effecting subsequent calls
-        ret.node = copy.deepcopy(ret.node)
+        return ret
+
+    @staticmethod
+    def _create_node(node: Any, path: Optional[str]) -> Container:
+        # Structured configs are converted to new nodes, other nodes may share children with the input
+        if isinstance(node, (dict, list, Container)):
+            node = copy.deepcopy(node)
+
+        if path is not None and path != "":
+            cfg = OmegaConf.create()
+            cfg.update_node(path, OmegaConf.structured(node))
+        else:
+            cfg = OmegaConf.structured(node)
+
+        # stored nodes are handed out without copying by load(), make sure they are not modified
+        OmegaConf.set_readonly(cfg, True)
+        return cfg
+
+    @staticmethod
+    def copy_node(node: Container) -> Container:
+        """
+        :param node: a node returned by load()
+        :return: a modifiable copy of the node
+        """
+        ret = copy.deepcopy(node)
+        OmegaConf.set_readonly(ret, None)
         return ret
 
     def _load(self, config_path: str) -> ConfigNode:
@@ -1,23 +1,50 @@
 # Copyright (c) Facebook, Inc. and its affiliates. All Rights Reserved
 import copy
-from typing import Any
+from contextvars import ContextVar
+from typing import TYPE_CHECKING, Any, Optional, cast
 
 from omegaconf import DictConfig, OmegaConf
 
-from hydra.conf import HydraConf
 from hydra.core.singleton import Singleton
 
+if TYPE_CHECKING:
+    from hydra.conf import HydraConf
+
+# Hydra config of the job running in the current thread (or asyncio task), overrides the process wide config
+_local_hydra: ContextVar[Optional[Any]] = ContextVar("hydra_config", default=None)
 
-class HydraConfig(metaclass=Singleton):
-    hydra: HydraConf
 
+class HydraConfig(metaclass=Singleton):
     def __init__(self) -> None:
+        from hydra.conf import HydraConf
+
         ret = OmegaConf.structured(HydraConf)
-        self.hydra = ret
+        self._hydra: Any = ret
+
+    @property
+    def hydra(self) -> "HydraConf":
+        local = _local_hydra.get()
+        if local is not None:
+            return cast("HydraConf", local)
+        return cast("HydraConf", self._hydra)
+
+    @hydra.setter
+    def hydra(self, value: "HydraConf") -> None:
+        # sets the process wide config
+        self._hydra = value
 
-    def set_config(self, cfg: DictConfig) -> None:
-        self.hydra = copy.deepcopy(cfg.hydra)
-        OmegaConf.set_readonly(self.hydra, True)  # type: ignore
+    def set_config(self, cfg: DictConfig, local: bool = False) -> None:
+        """
+        :param cfg: config containing the hydra node
+        :param local: set the config only for the current thread (or asyncio task), leaving the process
+               wide config untouched. Used to run multiple jobs concurrently in the same process.
+        """
+        hydra = copy.deepcopy(cfg.hydra)
+        OmegaConf.set_readonly(hydra, True)
+        if local:
+            _local_hydra.set(hydra)
+        else:
+            self._hydra = hydra
 
     @staticmethod
     def instance(*args: Any, **kwargs: Any) -> "HydraConfig":
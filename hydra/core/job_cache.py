@@ -0,0 +1,111 @@
+# Copyright (c) Facebook, Inc. and its affiliates. All Rights Reserved
+"""
+Content addressed cache of job results.
+Jobs are keyed by a hash of their resolved task config, their job name and a user provided code version.
+"""
+import hashlib
+import json
+import logging
+import os
+import pickle
+import threading
+from typing import Any, NamedTuple, Optional
+
+from omegaconf import DictConfig, OmegaConf
+
+log = logging.getLogger(__name__)
+
+
+class CachedJob(NamedTuple):
+    return_value: Any
+    # output directory of the job that computed the result
+    working_dir: str
+
+
+class JobCache:
+    def __init__(self, directory: str, code_version: Optional[str] = None) -> None:
+        """
+        :param directory: cache directory
+        :param code_version: version of the task code, results of other versions are not used
+        """
+        self.directory = directory
+        self.code_version = code_version
+
+    @staticmethod
+    def from_config(config: DictConfig) -> Optional["JobCache"]:
+        """
+        :param config: job config
+        :return: the job cache configured in hydra.job_cache, None if it is not enabled
+        """
+        cache_cfg = config.hydra.job_cache
+        if not cache_cfg.enabled:
+            return None
+        return JobCache(
+            directory=str(cache_cfg.dir), code_version=cache_cfg.code_version
+        )
+
+    def compute_key(self, config: DictConfig) -> str:
+        """
+        :param config: job config
+        :return: the cache key of the job
+        """
+        task_cfg = {}
+        for key in config.keys():
+            if key == "hydra":
+                continue
+            # interpolations are resolved against the full config, including the hydra node
+            node = config[key]
+            if OmegaConf.is_config(node):
+                node = OmegaConf.to_container(node, resolve=True)
+            task_cfg[key] = node
+        content = json.dumps(
+            [config.hydra.job.name, self.code_version, task_cfg],
+            sort_keys=True,
+            default=str,
+        )
+        return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+    def get(self, config: DictConfig) -> Optional[CachedJob]:
+        """
+        :param config: job config
+        :return: the cached result of the job, None if it is not cached
+        """
+        try:
+            with open(self._path(self.compute_key(config)), "rb") as f:
+                cached = pickle.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            log.warning(f"Ignoring unreadable job cache entry : {e}")
+            return None
+        assert isinstance(cached, CachedJob)
+        return cached
+
+    def put(self, config: DictConfig, return_value: Any, working_dir: str) -> bool:
+        """
+        Caches the result of a job
+        :param config: job config
+        :param return_value: return value of the task function
+        :param working_dir: output directory of the job
+        :return: True if cached, False if the return value cannot be pickled
+        """
+        try:
+            data = pickle.dumps(
+                CachedJob(
+                    return_value=return_value, working_dir=os.path.abspath(working_dir)
+                ),
+                protocol=pickle.HIGHEST_PROTOCOL,
+            )
+        except Exception as e:
+            log.warning(f"Not caching the job result, it cannot be pickled : {e}")
+            return False
+        path = self._path(self.compute_key(config))
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+        return True
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, key[:2], f"{key}.pkl")
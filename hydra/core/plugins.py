@@ -3,10 +3,12 @@ import importlib
 import inspect
 import pkgutil
 import warnings
-from typing import Any, List, Optional, Type
+from types import ModuleType
+from typing import Any, Dict, List, Optional, Tuple, Type
 
 from omegaconf import DictConfig
 
+from hydra._internal import plugins_manifest
 from hydra._internal.sources_registry import SourcesRegistry
 from hydra.conf import PluginConf
 from hydra.core.config_loader import ConfigLoader
@@ -18,6 +20,9 @@ from hydra.types import TaskFunction
 
 
 class Plugins:
+    # discovered plugins by plugin type and plugin package paths, discovery is done once per process
+    _discovered: Dict[Tuple[Type[Plugin], Tuple[str, ...]], List[Type[Plugin]]] = {}
+
     def __init__(self) -> None:
         raise NotImplementedError("Plugins is a static class, do not instantiate")
 
@@ -86,11 +91,14 @@ class Plugins:
 
     @staticmethod
     def _get_all_subclasses_in(
-        modules: List[Any], supertype: Optional[type] = None
+        modules: List[Any],
+        supertype: Optional[type] = None,
+        imported: Optional[List[str]] = None,
     ) -> List[Type[Plugin]]:
         """
         :param modules: a list of top level modules to look in
         :param supertype: look for subclasses of this type, if None return all classes
+        :param imported: if not None, the names of the successfully imported modules are added to it
         :return: a set of all classes found
         """
         ret = {}
@@ -98,8 +106,9 @@ class Plugins:
             for importer, modname, ispkg in pkgutil.walk_packages(
                 path=mdl.__path__, prefix=mdl.__name__ + ".", onerror=lambda x: None
             ):
+                loaded_mod: Optional[ModuleType]
                 try:
-                    loaded_mod = importer.find_module(modname).load_module(modname)
+                    loaded_mod = importlib.import_module(modname)
                 except ImportError as e:
                     warnings.warn(
                         message=f"\n"
@@ -111,6 +120,9 @@ class Plugins:
                     )
                     loaded_mod = None
 
+                if loaded_mod is not None and imported is not None:
+                    imported.append(modname)
+
                 if loaded_mod is not None:
                     for name, obj in inspect.getmembers(loaded_mod):
                         if inspect.isclass(obj):
@@ -146,7 +158,43 @@ class Plugins:
         except ImportError:
             # If no plugins are installed the hydra_plugins package does not exist.
             pass
-        return Plugins._get_all_subclasses_in(top_level, plugin_type)
+
+        paths = tuple(path for mdl in top_level for path in mdl.__path__)
+        key = (plugin_type, paths)
+        if key not in Plugins._discovered:
+            Plugins._discovered[key] = Plugins._discover(top_level, plugin_type)
+        return list(Plugins._discovered[key])
+
+    @staticmethod
+    def _discover(
+        top_level: List[Any], plugin_type: Type[Plugin]
+    ) -> List[Type[Plugin]]:
+        paths = [path for mdl in top_level for path in mdl.__path__]
+        manifest_file = plugins_manifest.get_manifest_file()
+        if manifest_file is None:
+            return Plugins._get_all_subclasses_in(top_level, plugin_type)
+
+        # Resolve the plugins from the manifest, this skips scanning the plugin packages and
+        # only imports the modules with plugins of the requested type and the external plugin modules.
+        manifest_key = plugins_manifest.compute_key(paths)
+        manifest = plugins_manifest.load(manifest_file, manifest_key)
+        if manifest is not None:
+            plugins = plugins_manifest.resolve(manifest, plugin_type)
+            if plugins is not None:
+                return plugins
+
+        imported: List[str] = []
+        all_plugins = Plugins._get_all_subclasses_in(top_level, Plugin, imported)
+        # external plugins may register configs when imported, they are always imported
+        external_modules = [m for m in imported if not Plugins.is_core_module(m)]
+        plugins_manifest.save(
+            manifest_file, manifest_key, all_plugins, external_modules
+        )
+        return [p for p in all_plugins if issubclass(p, plugin_type)]
+
+    @staticmethod
+    def is_core_module(module_name: str) -> bool:
+        return module_name.startswith("hydra._internal.core_plugins.")
 
     @staticmethod
     def register_config_sources() -> None:
@@ -0,0 +1,128 @@
+# Copyright (c) Facebook, Inc. and its affiliates. All Rights Reserved
+"""
+Append-only journal of a sweep, stored as a JSON lines file in the sweep directory.
+The first entry records the overrides of the sweep, each following entry records the outcome of a job.
+Jobs are identified by a hash of their overrides, the last entry of a job is its current state.
+"""
+import hashlib
+import json
+import logging
+import os
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Sequence
+
+COMPLETED = "completed"
+FAILED = "failed"
+
+log = logging.getLogger(__name__)
+
+
+def job_key(overrides: Sequence[str]) -> str:
+    """
+    :param overrides: overrides of the job
+    :return: the key identifying the job in the journal
+    """
+    return hashlib.sha1(json.dumps(list(overrides)).encode("utf-8")).hexdigest()
+
+
+@dataclass
+class JournalState:
+    # overrides of the sweep, None if not recorded
+    overrides: Optional[List[str]] = None
+    # job key -> last entry of the job
+    jobs: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+
+    def completed(self, overrides: Sequence[str]) -> Optional[Dict[str, Any]]:
+        """
+        :return: the entry of the job if it completed, None if it is pending or failed
+        """
+        entry = self.jobs.get(job_key(overrides))
+        if entry is None or entry["status"] != COMPLETED:
+            return None
+        return entry
+
+
+class SweepJournal:
+    def __init__(self, path: str) -> None:
+        """
+        :param path: journal file
+        """
+        self.path = path
+
+    def load(self) -> JournalState:
+        """
+        :return: the state of the sweep, empty if the journal does not exist.
+                 Incomplete lines (written while the sweep was killed) are ignored.
+        """
+        state = JournalState()
+        try:
+            with open(self.path, "r") as f:
+                lines = f.readlines()
+        except FileNotFoundError:
+            return state
+        for line in lines:
+            try:
+                entry = json.loads(line)
+            except ValueError:
+                continue
+            if not isinstance(entry, dict):
+                continue
+            if entry.get("type") == "sweep":
+                if state.overrides is None:
+                    state.overrides = entry["overrides"]
+            elif entry.get("type") == "job":
+                state.jobs[entry["key"]] = entry
+        return state
+
+    def record_sweep(self, overrides: Sequence[str]) -> None:
+        """
+        Records the overrides of the sweep, used to resume it
+        """
+        self._append(dict(type="sweep", overrides=list(overrides)))
+
+    def record_job(
+        self,
+        overrides: Sequence[str],
+        num: Any,
+        status: str,
+        working_dir: Optional[str],
+        return_value: Any = None,
+    ) -> None:
+        """
+        Records the outcome of a job.
+        The return value is recorded only if it can be serialized to JSON.
+        """
+        entry = dict(
+            type="job",
+            key=job_key(overrides),
+            overrides=list(overrides),
+            num=num,
+            status=status,
+            working_dir=working_dir,
+            time=time.time(),
+        )
+        if status == COMPLETED:
+            try:
+                json.dumps(return_value)
+                entry["return_value"] = return_value
+            except (TypeError, ValueError):
+                # common (models, tensors...), a resumed sweep warns about the missing values once
+                log.debug(
+                    "The return value of job #{} ({}) cannot be serialized to JSON, it is not recorded".format(
+                        num, type(return_value).__name__
+                    )
+                )
+        self._append(entry)
+
+    def _append(self, entry: Dict[str, Any]) -> None:
+        # a single write to a file opened in append mode, entries of concurrent jobs are not interleaved
+        data = (json.dumps(entry) + "\n").encode("utf-8")
+        directory = os.path.dirname(self.path)
+        if directory != "":
+            os.makedirs(directory, exist_ok=True)
+        fd = os.open(self.path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        try:
+            os.write(fd, data)
+        finally:
+            os.close(fd)
@@ -1,18 +1,29 @@
 # Copyright (c) Facebook, Inc. and its affiliates. All Rights Reserved
 import copy
+import inspect
 import logging
+import logging.config
 import os
 import re
 import sys
+import threading
+import time
+import traceback
+from contextlib import contextmanager
+from contextvars import ContextVar, Token
+from enum import Enum
 from os.path import basename, dirname, splitext
 from pathlib import Path
 from time import localtime, strftime
-from typing import Any, Dict, Optional, Sequence, Tuple, Union
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple, Union
 
 from omegaconf import DictConfig, OmegaConf
 
 from hydra.core.hydra_config import HydraConfig
+from hydra.core.job_cache import JobCache
 from hydra.core.singleton import Singleton
+from hydra.core.sweep_journal import COMPLETED, FAILED, SweepJournal
+from hydra.errors import JobTimeoutError
 from hydra.types import TaskFunction
 
 log = logging.getLogger(__name__)
@@ -91,13 +102,61 @@ def split_key_val(s: str) -> Tuple[str, str]:
     return s[0:idx], s[idx + 1 :]
 
 
-def run_job(
-    config: DictConfig,
-    task_function: TaskFunction,
-    job_dir_key: str,
-    job_subdir_key: Optional[str],
-) -> "JobReturn":
-    old_cwd = os.getcwd()
+# identifies the job running in the current thread (or asyncio task) in thread safe mode
+_current_job: ContextVar[Optional[object]] = ContextVar("hydra_job", default=None)
+
+
+def _add_job_log_handlers(
+    config: DictConfig, output_dir: Path, job: object
+) -> List[logging.Handler]:
+    """
+    Adds a handler for each file handler in the job logging config, logging only the records emitted by the
+    given job to a file in the output directory of the job.
+    The handlers are built from their config (class, mode, encoding, filters...) like logging.config.dictConfig.
+    :param config: job config
+    :param output_dir: output directory of the job
+    :param job: identity of the job, see _current_job
+    :return: the handlers, to be removed once the job is done
+    """
+    handlers: List[logging.Handler] = []
+    if config.hydra.job_logging is None:
+        return handlers
+    log_config = OmegaConf.to_container(config.hydra.job_logging, resolve=True)
+    assert isinstance(log_config, dict)
+    configurator = logging.config.DictConfigurator(log_config)  # type: ignore
+    # handlers refer to formatters and filters by name, they are configured first as in dictConfig
+    for section, configure in [
+        ("formatters", configurator.configure_formatter),
+        ("filters", configurator.configure_filter),
+    ]:
+        configs = configurator.config.get(section) or {}
+        for name in list(configs.keys()):
+            configs[name] = configure(configs[name])
+    for handler_config in (log_config.get("handlers") or {}).values():
+        if "filename" not in handler_config:
+            continue
+        handler_config = dict(handler_config)
+        handler_config["filename"] = str(output_dir / handler_config["filename"])
+        handler = configurator.configure_handler(configurator.convert(handler_config))
+        handler.addFilter(_JobFilter(job))
+        logging.getLogger().addHandler(handler)
+        handlers.append(handler)
+    return handlers
+
+
+class _JobFilter(logging.Filter):
+    def __init__(self, job: object) -> None:
+        super().__init__()
+        self.job = job
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        # filters are called in the context of the code emitting the record
+        return _current_job.get() is self.job
+
+
+def _get_working_dir(
+    config: DictConfig, job_dir_key: str, job_subdir_key: Optional[str]
+) -> str:
     working_dir = str(config.select(job_dir_key))
     if job_subdir_key is not None:
         # evaluate job_subdir_key lazily.
@@ -105,39 +164,474 @@ def run_job(
         # are only available there.
         subdir = str(config.select(job_subdir_key))
         working_dir = os.path.join(working_dir, subdir)
+    return working_dir
+
+
+def _new_job_return(config: DictConfig, working_dir: str) -> "JobReturn":
+    ret = JobReturn()
+    ret.working_dir = working_dir
+    task_cfg = copy.deepcopy(config)
+    del task_cfg["hydra"]
+    ret.cfg = task_cfg
+    ret.hydra_cfg = OmegaConf.create({"hydra": HydraConfig.instance().hydra})
+    overrides = OmegaConf.to_container(config.hydra.overrides.task)
+    assert isinstance(overrides, list)
+    ret.overrides = overrides
+    return ret
+
+
+@contextmanager
+def _job(
+    config: DictConfig,
+    job_dir_key: str,
+    job_subdir_key: Optional[str],
+    thread_safe: bool,
+    journal: Optional[str],
+) -> Iterator[Tuple["JobReturn", DictConfig]]:
+    """
+    Prepares the output directory, the logging and the JobReturn of a job, and cleans up once the job is done.
+    :return: the JobReturn and the config to call the task function with
+    """
+    setup_start = time.perf_counter()
+    old_cwd = os.getcwd()
+    working_dir = _get_working_dir(config, job_dir_key, job_subdir_key)
+    log_handlers: List[logging.Handler] = []
+    job_token: Optional[Token[Optional[object]]] = None
     try:
-        ret = JobReturn()
-        ret.working_dir = working_dir
-        task_cfg = copy.deepcopy(config)
-        del task_cfg["hydra"]
-        ret.cfg = task_cfg
-        ret.hydra_cfg = OmegaConf.create({"hydra": HydraConfig.instance().hydra})
-        overrides = OmegaConf.to_container(config.hydra.overrides.task)
-        assert isinstance(overrides, list)
-        ret.overrides = overrides
+        ret = _new_job_return(config, working_dir)
+        task_cfg = ret.cfg
+        assert task_cfg is not None
+        overrides = ret.overrides
+        assert overrides is not None
         # handle output directories here
         Path(str(working_dir)).mkdir(parents=True, exist_ok=True)
-        os.chdir(working_dir)
-        hydra_output = Path(config.hydra.output_subdir)
+        if thread_safe:
+            hydra_output = Path(working_dir) / config.hydra.output_subdir
+            job = object()
+            job_token = _current_job.set(job)
+            log_handlers = _add_job_log_handlers(config, Path(working_dir), job)
+        else:
+            os.chdir(working_dir)
+            hydra_output = Path(config.hydra.output_subdir)
 
-        configure_log(config.hydra.job_logging, config.hydra.verbose)
+            configure_log(config.hydra.job_logging, config.hydra.verbose)
 
         hydra_cfg = OmegaConf.masked_copy(config, "hydra")
         assert isinstance(hydra_cfg, DictConfig)
 
+        save_start = time.perf_counter()
         _save_config(task_cfg, "config.yaml", hydra_output)
         _save_config(hydra_cfg, "hydra.yaml", hydra_output)
         _save_config(config.hydra.overrides.task, "overrides.yaml", hydra_output)
-        ret.return_value = task_function(task_cfg)
+        setup_end = time.perf_counter()
+        _record_job_timings(
+            ret, setup=setup_end - setup_start, save_config=setup_end - save_start,
+        )
+        try:
+            yield ret, task_cfg
+        except BaseException:
+            if journal is not None:
+                SweepJournal(journal).record_job(
+                    overrides, config.hydra.job.num, FAILED, working_dir
+                )
+            raise
+        if journal is not None:
+            SweepJournal(journal).record_job(
+                overrides,
+                config.hydra.job.num,
+                COMPLETED,
+                working_dir,
+                ret.return_value,
+            )
+        ret.status = JobStatus.COMPLETED
         ret.task_name = JobRuntime.instance().get("name")
 
-        # shut down logging to ensure job log files are closed.
-        # If logging is still required after run_job caller is responsible to re-initialize it.
-        logging.shutdown()
+        if not thread_safe:
+            # shut down logging to ensure job log files are closed.
+            # If logging is still required after run_job caller is responsible to re-initialize it.
+            logging.shutdown()
+    finally:
+        if thread_safe:
+            for handler in log_handlers:
+                logging.getLogger().removeHandler(handler)
+                handler.close()
+            if job_token is not None:
+                _current_job.reset(job_token)
+        else:
+            os.chdir(old_cwd)
+
 
+def _record_job_timings(ret: "JobReturn", **timings: float) -> None:
+    """
+    Records the durations of stages of a job in its JobReturn and in the StageTimings of the process
+    """
+    stage_timings = StageTimings.instance()
+    for stage, duration in timings.items():
+        ret.timings[stage] = duration
+        stage_timings.record("run_job.{}".format(stage), duration)
+    log.debug(
+        "Job stage timings : {}".format(
+            ", ".join(
+                "{}={:.1f}ms".format(stage, duration * 1000)
+                for stage, duration in timings.items()
+            )
+        )
+    )
+
+
+class _Attempts:
+    """
+    Tracks the failed attempts of a job, according to hydra.job_execution
+    """
+
+    def __init__(
+        self, config: DictConfig, job_dir_key: str, job_subdir_key: Optional[str],
+    ) -> None:
+        self.config = config
+        self.job_dir_key = job_dir_key
+        self.job_subdir_key = job_subdir_key
+        self.execution = config.hydra.job_execution
+        self.attempt = 0
+        self.delay = float(self.execution.retry_delay)
+        self.start = time.time()
+
+    def failed(self, exception: BaseException, tb: str) -> Optional[float]:
+        """
+        :return: the delay before retrying the job, None if it should not be retried
+        """
+        if self.attempt >= self.execution.retries:
+            return None
+        self.attempt += 1
+        delay = self.delay
+        self.delay *= self.execution.retry_backoff
+        log.warning(
+            f"Job failed with {exception!r}, retrying in {delay} seconds "
+            f"(retry {self.attempt} of {self.execution.retries})"
+        )
+        return delay
+
+    def give_up(self, exception: BaseException, tb: str) -> "JobReturn":
+        """
+        :return: the JobReturn of the failed job if failures are caught, otherwise raises the exception
+        """
+        if not self.execution.catch_failures:
+            raise exception
+        log.error(f"Job failed with {exception!r}\n{tb}")
+        working_dir = _get_working_dir(
+            self.config, self.job_dir_key, self.job_subdir_key
+        )
+        ret = _new_job_return(self.config, working_dir)
+        ret.task_name = JobRuntime.instance().get("name")
+        ret.status = JobStatus.FAILED
+        ret.exception = exception
+        ret.traceback = tb
+        return self.done(ret)
+
+    def done(self, ret: "JobReturn") -> "JobReturn":
+        ret.duration = time.time() - self.start
         return ret
+
+
+def _timeout_error(
+    config: DictConfig, job_dir_key: str, job_subdir_key: Optional[str], timeout: float
+) -> JobTimeoutError:
+    working_dir = _get_working_dir(config, job_dir_key, job_subdir_key)
+    return JobTimeoutError(
+        f"Job did not complete within {timeout} seconds : {working_dir}"
+    )
+
+
+class _ChildJobError(Exception):
+    # exception raised by a job running in a child process, with its formatted traceback
+    def __init__(self, exception: BaseException, tb: str) -> None:
+        super().__init__(exception)
+        self.exception = exception
+        self.traceback = tb
+
+
+def run_job(
+    config: DictConfig,
+    task_function: TaskFunction,
+    job_dir_key: str,
+    job_subdir_key: Optional[str],
+    thread_safe: bool = False,
+    journal: Optional[str] = None,
+) -> "JobReturn":
+    """
+    Runs a job. Async task functions are run to completion in a new event loop.
+    Failures are retried and caught, and timeouts are enforced according to hydra.job_execution.
+    :param config: config of the job
+    :param task_function: task function
+    :param job_dir_key: key of the output directory of the job in the config
+    :param job_subdir_key: key of the output subdirectory of the job in the config, None if there is none
+    :param thread_safe: run the job without changing process wide state, allowing multiple jobs to run
+           concurrently in the same process: the working directory is not changed (the job output directory is
+           in JobReturn.working_dir and in the hydra config), the job logs to its log files through handlers
+           filtering the records of the job instead of configuring logging, and the caller is
+           expected to set the hydra config with HydraConfig.set_config(cfg, local=True).
+    :param journal: journal file of the sweep to record the outcome of the job in, see SweepJournal
+    """
+    cache = JobCache.from_config(config)
+    if cache is not None:
+        cached = _restore_cached_job(cache, config, journal)
+        if cached is not None:
+            return cached
+
+    attempts = _Attempts(config, job_dir_key, job_subdir_key)
+    timeout = config.hydra.job_execution.timeout
+    while True:
+        try:
+            if timeout is None:
+                ret = _run_job(
+                    config,
+                    task_function,
+                    job_dir_key,
+                    job_subdir_key,
+                    thread_safe,
+                    journal,
+                )
+            else:
+                ret = _run_job_in_child_process(
+                    config,
+                    task_function,
+                    job_dir_key,
+                    job_subdir_key,
+                    thread_safe,
+                    journal,
+                    timeout,
+                )
+            break
+        except _ChildJobError as e:
+            failure, tb = e.exception, e.traceback
+        except Exception as e:
+            failure, tb = e, traceback.format_exc()
+        delay = attempts.failed(failure, tb)
+        if delay is None:
+            return attempts.give_up(failure, tb)
+        time.sleep(delay)
+
+    if cache is not None:
+        assert ret.working_dir is not None
+        cache.put(config, ret.return_value, working_dir=ret.working_dir)
+    return attempts.done(ret)
+
+
+def _run_job(
+    config: DictConfig,
+    task_function: TaskFunction,
+    job_dir_key: str,
+    job_subdir_key: Optional[str],
+    thread_safe: bool,
+    journal: Optional[str],
+) -> "JobReturn":
+    with _job(config, job_dir_key, job_subdir_key, thread_safe, journal) as (
+        ret,
+        task_cfg,
+    ):
+        return_value = task_function(task_cfg)
+        if inspect.isawaitable(return_value):
+            return_value = run_coroutine(return_value)
+        ret.return_value = return_value
+    return ret
+
+
+def _run_job_in_child_process(
+    config: DictConfig,
+    task_function: TaskFunction,
+    job_dir_key: str,
+    job_subdir_key: Optional[str],
+    thread_safe: bool,
+    journal: Optional[str],
+    timeout: float,
+) -> "JobReturn":
+    """
+    Runs the job in a child process, killed if it does not complete within the timeout.
+    The child process is forked when possible, otherwise the task function must be picklable.
+    """
+    import multiprocessing
+
+    start_method = "fork" if "fork" in multiprocessing.get_all_start_methods() else None
+    context = multiprocessing.get_context(start_method)
+    receiver, sender = context.Pipe(duplex=False)
+    process = context.Process(
+        target=_child_process_main,
+        args=(
+            sender,
+            Singleton.get_state(),
+            config,
+            task_function,
+            job_dir_key,
+            job_subdir_key,
+            thread_safe,
+            journal,
+        ),
+    )
+    process.start()
+    sender.close()
+    try:
+        if not receiver.poll(timeout):
+            process.terminate()
+            process.join(1)
+            # Process.kill is not available before Python 3.7
+            kill = getattr(process, "kill", None)
+            if process.is_alive() and kill is not None:
+                kill()
+            raise _timeout_error(config, job_dir_key, job_subdir_key, timeout)
+        try:
+            ret, exception, tb = receiver.recv()
+        except EOFError:
+            process.join()
+            raise RuntimeError(
+                f"Job process exited unexpectedly with exit code {process.exitcode}"
+            )
+    finally:
+        receiver.close()
+        process.join()
+    if exception is not None:
+        raise _ChildJobError(exception, tb)
+    assert isinstance(ret, JobReturn)
+    return ret
+
+
+def _child_process_main(
+    conn: Any,
+    singleton_state: Dict[Any, Any],
+    config: DictConfig,
+    task_function: TaskFunction,
+    job_dir_key: str,
+    job_subdir_key: Optional[str],
+    thread_safe: bool,
+    journal: Optional[str],
+) -> None:
+    setup_globals()
+    Singleton.set_state(singleton_state)
+    try:
+        try:
+            ret = _run_job(
+                config, task_function, job_dir_key, job_subdir_key, thread_safe, journal
+            )
+            conn.send((ret, None, None))
+        except Exception as e:
+            tb = traceback.format_exc()
+            try:
+                conn.send((None, e, tb))
+            except Exception:
+                # the exception cannot be pickled
+                conn.send((None, RuntimeError(repr(e)), tb))
+    finally:
+        conn.close()
+
+
+def run_coroutine(coroutine: Any) -> Any:
+    """
+    Runs a coroutine to completion in a new event loop, used to run async task functions (and
+    run_job_async) from synchronous code
+    :param coroutine: the coroutine to run
+    :return: the value returned by the coroutine
+    """
+    import asyncio
+
+    if sys.version_info >= (3, 7):
+        return asyncio.run(coroutine)
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coroutine)
     finally:
-        os.chdir(old_cwd)
+        loop.close()
+
+
+async def run_job_async(
+    config: DictConfig,
+    task_function: TaskFunction,
+    job_dir_key: str,
+    job_subdir_key: Optional[str],
+    journal: Optional[str] = None,
+) -> "JobReturn":
+    """
+    Runs a job in the running event loop, awaiting the result of async task functions.
+    Jobs run in thread safe mode (see run_job), allowing multiple jobs to run concurrently on the
+    same event loop. Each job should run in its own asyncio task.
+    Failures are retried and caught according to hydra.job_execution. Timeouts cancel the job,
+    which requires the task function to be async.
+    """
+    import asyncio
+
+    cache = JobCache.from_config(config)
+    if cache is not None:
+        cached = _restore_cached_job(cache, config, journal)
+        if cached is not None:
+            return cached
+
+    attempts = _Attempts(config, job_dir_key, job_subdir_key)
+    timeout = config.hydra.job_execution.timeout
+    while True:
+        try:
+            try:
+                ret = await asyncio.wait_for(
+                    _run_job_async(
+                        config, task_function, job_dir_key, job_subdir_key, journal
+                    ),
+                    timeout,
+                )
+            except asyncio.TimeoutError:
+                raise _timeout_error(config, job_dir_key, job_subdir_key, timeout)
+            break
+        except Exception as e:
+            failure, tb = e, traceback.format_exc()
+        delay = attempts.failed(failure, tb)
+        if delay is None:
+            return attempts.give_up(failure, tb)
+        await asyncio.sleep(delay)
+
+    if cache is not None:
+        assert ret.working_dir is not None
+        cache.put(config, ret.return_value, working_dir=ret.working_dir)
+    return attempts.done(ret)
+
+
+async def _run_job_async(
+    config: DictConfig,
+    task_function: TaskFunction,
+    job_dir_key: str,
+    job_subdir_key: Optional[str],
+    journal: Optional[str],
+) -> "JobReturn":
+    with _job(config, job_dir_key, job_subdir_key, True, journal) as (
+        ret,
+        task_cfg,
+    ):
+        return_value = task_function(task_cfg)
+        if inspect.isawaitable(return_value):
+            return_value = await return_value
+        ret.return_value = return_value
+    return ret
+
+
+def _restore_cached_job(
+    cache: JobCache, config: DictConfig, journal: Optional[str]
+) -> Optional["JobReturn"]:
+    """
+    :return: the JobReturn of the job restored from the job cache, None if the job is not cached.
+             The working dir of the JobReturn is the output directory of the job that computed the result.
+    """
+    cached = cache.get(config)
+    if cached is None:
+        return None
+    log.info(f"Job result found in the job cache, computed in : {cached.working_dir}")
+    ret = _new_job_return(config, cached.working_dir)
+    ret.return_value = cached.return_value
+    ret.task_name = JobRuntime.instance().get("name")
+    ret.status = JobStatus.COMPLETED
+    if journal is not None:
+        assert ret.overrides is not None
+        SweepJournal(journal).record_job(
+            ret.overrides,
+            config.hydra.job.num,
+            COMPLETED,
+            cached.working_dir,
+            cached.return_value,
+        )
+    return ret
 
 
 def get_valid_filename(s: str) -> str:
@@ -155,6 +649,12 @@ def setup_globals() -> None:
         pass
 
 
+class JobStatus(Enum):
+    UNKNOWN = 0
+    COMPLETED = 1
+    FAILED = 2
+
+
 class JobReturn:
     def __init__(self) -> None:
         self.overrides: Optional[Sequence[str]] = None
@@ -163,6 +663,64 @@ class JobReturn:
         self.hydra_cfg: Optional[DictConfig] = None
         self.working_dir: Optional[str] = None
         self.task_name: Optional[str] = None
+        self.status: JobStatus = JobStatus.UNKNOWN
+        # exception raised by the job and its formatted traceback, if the job failed
+        self.exception: Optional[BaseException] = None
+        self.traceback: Optional[str] = None
+        # wall-clock duration of the job in seconds, including retries
+        self.duration: Optional[float] = None
+        # wall-clock durations of the stages of the job in seconds, e.g. setup and save_config
+        self.timings: Dict[str, float] = {}
+
+
+class StageTimings(metaclass=Singleton):
+    """
+    Wall-clock durations of the stages of Hydra in this process (e.g. load_configuration), in seconds.
+    Stages running multiple times (e.g. once per job of a sweep) are aggregated.
+    """
+
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        # stage -> [count, total, max]
+        self.stages: Dict[str, List[float]] = {}
+
+    def record(self, stage: str, duration: float) -> None:
+        with self.lock:
+            stats = self.stages.setdefault(stage, [0, 0.0, 0.0])
+            stats[0] += 1
+            stats[1] += duration
+            stats[2] = max(stats[2], duration)
+
+    @contextmanager
+    def measure(self, stage: str) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(stage, time.perf_counter() - start)
+
+    def get(self) -> Dict[str, Dict[str, float]]:
+        """
+        :return: stage -> count, total and max duration
+        """
+        with self.lock:
+            return {
+                stage: dict(count=count, total=total, max=max_)
+                for stage, (count, total, max_) in self.stages.items()
+            }
+
+    def __getstate__(self) -> Dict[str, Any]:
+        state = self.__dict__.copy()
+        del state["lock"]
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self.lock = threading.Lock()
+
+    @staticmethod
+    def instance(*args: Any, **kwargs: Any) -> "StageTimings":
+        return Singleton.instance(StageTimings, *args, **kwargs)  # type: ignore
 
 
 class JobRuntime(metaclass=Singleton):
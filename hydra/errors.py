@@ -12,3 +12,9 @@ class MissingConfigException(IOError):
         super(MissingConfigException, self).__init__(message)
         self.missing_cfg_file = missing_cfg_file
         self.options = options
+
+
+class JobTimeoutError(Exception):
+    """
+    Raised when a job does not complete within hydra.job_execution.timeout
+    """
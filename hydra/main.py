@@ -2,7 +2,6 @@
 import functools
 from typing import Callable, Optional
 
-from ._internal.utils import get_args_parser, run_hydra
 from .types import TaskFunction
 
 
@@ -12,6 +11,7 @@ def main(
     strict: Optional[bool] = None,
 ) -> Callable[[TaskFunction], Callable[[], None]]:
     """
+    Decorates the task function, which can be a regular or an async function.
     :param config_path: the config path, can be a directory in which it's used as the config root
     or a file to load
     :param config_name: the name of the config (usually file name without extension)
@@ -23,6 +23,9 @@ def main(
     def main_decorator(task_function: TaskFunction) -> Callable[[], None]:
         @functools.wraps(task_function)
         def decorated_main() -> None:
+            # imported when the app runs, keeping the import of hydra fast
+            from ._internal.utils import get_args_parser, run_hydra
+
             run_hydra(
                 args_parser=get_args_parser(),
                 task_function=task_function,
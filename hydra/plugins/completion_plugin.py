@@ -34,6 +34,20 @@ class CompletionPlugin(Plugin):
     def query(self, config_name: Optional[str]) -> None:
         ...
 
+    def serve(
+        self, config_name: Optional[str], socket_path: str, idle_timeout: float
+    ) -> None:
+        """
+        Answers completion queries from a long running process, keeping the config loader warm.
+        Optional, the shell integration falls back to query when the plugin does not support it.
+        :param config_name: config name of the app
+        :param socket_path: path of the Unix socket to serve on
+        :param idle_timeout: seconds without queries after which the server stops
+        """
+        raise NotImplementedError(
+            "{} does not support serving completion queries".format(type(self).__name__)
+        )
+
     @staticmethod
     def _get_filename(filename: str) -> Tuple[Optional[str], Optional[str]]:
         last = filename.rfind("=")
@@ -141,7 +155,8 @@ class CompletionPlugin(Plugin):
             else:
                 parent_group = word[0:last_slash_index]
 
-        all_matched_groups = self.config_loader.get_group_options(
+        tree = self.config_loader.get_group_tree()
+        all_matched_groups = tree.get_group_options(
             group_name=parent_group, results_filter=results_filter
         )
         matched_groups: List[str] = []
@@ -159,10 +174,10 @@ class CompletionPlugin(Plugin):
                     "{}/{}".format(parent_group, match) if parent_group != "" else match
                 )
                 if name.startswith(word):
-                    files = self.config_loader.get_group_options(
+                    files = tree.get_group_options(
                         group_name=name, results_filter=ObjectType.CONFIG
                     )
-                    dirs = self.config_loader.get_group_options(
+                    dirs = tree.get_group_options(
                         group_name=name, results_filter=ObjectType.GROUP
                     )
                     if len(dirs) == 0 and len(files) > 0:
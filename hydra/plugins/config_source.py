@@ -1,7 +1,7 @@
 # Copyright (c) Facebook, Inc. and its affiliates. All Rights Reserved
 from abc import abstractmethod
 from dataclasses import dataclass
-from typing import List, Optional
+from typing import Hashable, List, Optional
 
 from omegaconf import Container
 
@@ -47,6 +47,14 @@ class ConfigSource(Plugin):
     def exists(self, config_path: str) -> bool:
         return self.is_group(config_path) or self.is_config(config_path)
 
+    # subclasses may override to allow caching of compositions using this source
+    def fingerprint(self) -> Optional[Hashable]:
+        """
+        :return: a hashable value that changes whenever the configs provided by this source may have changed,
+                 or None if this source cannot tell (caching of compositions using it is disabled)
+        """
+        return None
+
     @abstractmethod
     def is_group(self, config_path: str) -> bool:
         ...
@@ -3,6 +3,7 @@
 Launcher plugin interface
 """
 from abc import abstractmethod
+from concurrent.futures import Future
 from typing import Sequence
 
 from omegaconf import DictConfig
@@ -28,8 +29,37 @@ class Launcher(Plugin):
         raise NotImplementedError()
 
     @abstractmethod
-    def launch(self, job_overrides: Sequence[Sequence[str]]) -> Sequence[JobReturn]:
+    def launch(
+        self, job_overrides: Sequence[Sequence[str]], initial_job_idx: int = 0
+    ) -> Sequence[JobReturn]:
         """
         :param job_overrides: a batch of job arguments
+        :param initial_job_idx: Initial job idx in batch.
+        :return: the results of the jobs, in the order of job_overrides
         """
         raise NotImplementedError()
+
+    def submit(self, overrides: Sequence[str], job_idx: int) -> "Future[JobReturn]":
+        """
+        Launches a single job without waiting for it to complete, allowing sweepers to launch a new job
+        as soon as any running job completes (see concurrent.futures.wait and concurrent.futures.as_completed).
+        The default implementation runs the job with launch() before returning, launchers running jobs
+        concurrently override it.
+        :param overrides: job arguments
+        :param job_idx: job idx
+        :return: a future resolved with the JobReturn of the job, or with the exception it raised
+        """
+        future: "Future[JobReturn]" = Future()
+        try:
+            (ret,) = self.launch([overrides], initial_job_idx=job_idx)
+        except Exception as e:
+            future.set_exception(e)
+        else:
+            future.set_result(ret)
+        return future
+
+    def supports_submit(self) -> bool:
+        """
+        :return: True if submit() returns before the job completes
+        """
+        return type(self).submit is not Launcher.submit
@@ -2,18 +2,23 @@
 """
 A sweeper that operates on generational batches of jobs
 """
+import inspect
+import logging
 from abc import abstractmethod
 from typing import Any, List, Optional, Sequence
 
-from omegaconf import DictConfig
+from omegaconf import DictConfig, OmegaConf
 
 from hydra.core.config_loader import ConfigLoader
-from hydra.core.utils import JobReturn
+from hydra.core.sweep_journal import JournalState, SweepJournal
+from hydra.core.utils import JobReturn, JobRuntime, JobStatus
 from hydra.types import TaskFunction
 
 from .launcher import Launcher
 from .sweeper import Sweeper
 
+log = logging.getLogger(__name__)
+
 
 class StepSweeper(Sweeper):
     """
@@ -21,6 +26,11 @@ class StepSweeper(Sweeper):
     of jobs for every generation. This may not be flexible enough for all use cases, but probably
     covers 90% of the sweeping algorithms.
     It's using an internal launcher instance to launch each batch.
+    The sweep is recorded in the journal of the sweep (hydra.sweep.journal). When resuming, the jobs the
+    journal records as completed are not launched again.
+    The results of each batch are passed to update_results as soon as the batch completes. sweep() also
+    returns the results of all the batches, unless keep_results is False: every JobReturn holds the configs
+    of its job, so keeping them makes the memory of the sweep grow with its number of jobs.
     """
 
     def __init__(self) -> None:
@@ -28,6 +38,10 @@ class StepSweeper(Sweeper):
         self.arguments: Optional[List[str]] = None
         self.launcher: Optional[Launcher] = None
         self.config: Optional[DictConfig] = None
+        # skip the jobs already completed according to the journal
+        self.resume = False
+        # return the results of all the batches from sweep()
+        self.keep_results = True
 
     def setup(
         self,
@@ -72,10 +86,107 @@ class StepSweeper(Sweeper):
         assert self.config is not None
         assert self.launcher is not None
         self.arguments = arguments
+        journal_state = self._open_journal()
         returns: List[Sequence[JobReturn]] = []
+        initial_job_idx = 0
         while not self.is_done():
             batch = self.get_job_batch()
-            results = self.launcher.launch(batch)
-            returns.append(results)
-            self.update_results(results)
+            if journal_state is not None and self.resume:
+                results = self._launch_pending(batch, initial_job_idx, journal_state)
+            else:
+                results = self._launch(batch, initial_job_idx)
+            initial_job_idx += len(batch)
+            self._report_results(results, returns)
         return returns
+
+    def _launch(
+        self, batch: Sequence[Sequence[str]], initial_job_idx: int
+    ) -> Sequence[JobReturn]:
+        assert self.launcher is not None
+        if "initial_job_idx" in inspect.signature(self.launcher.launch).parameters:
+            return self.launcher.launch(batch, initial_job_idx=initial_job_idx)
+        # launchers implemented before initial_job_idx was added number the jobs of every batch from 0
+        return self.launcher.launch(batch)
+
+    def _report_results(
+        self, results: Sequence[JobReturn], returns: List[Sequence[JobReturn]]
+    ) -> None:
+        """
+        Passes the results of a completed batch to update_results, and adds them to the returns of the sweep
+        if keep_results is True
+        """
+        self.update_results(results)
+        if self.keep_results:
+            returns.append(results)
+
+    def _open_journal(self) -> Optional[JournalState]:
+        """
+        Records the overrides of the sweep in its journal, unless they are already recorded
+        :return: the current state of the journal, None if the journal is disabled
+        """
+        assert self.config is not None
+        if self.config.hydra.sweep.journal is None:
+            return None
+        journal = SweepJournal(str(self.config.hydra.sweep.journal))
+        state = journal.load()
+        if state.overrides is None:
+            overrides = OmegaConf.to_container(self.config.hydra.overrides.hydra)
+            assert isinstance(overrides, list)
+            overrides.extend(self.arguments or [])
+            journal.record_sweep(overrides)
+        return state
+
+    def _launch_pending(
+        self,
+        batch: Sequence[Sequence[str]],
+        initial_job_idx: int,
+        journal_state: JournalState,
+    ) -> Sequence[JobReturn]:
+        """
+        Launches the jobs of the batch that are not completed according to the journal.
+        Consecutive pending jobs are launched together, keeping the job numbers of the original sweep.
+        :return: the results of the batch, results of completed jobs are restored from the journal
+        """
+        assert self.launcher is not None
+        results: List[Optional[JobReturn]] = [None] * len(batch)
+        not_recorded = 0
+        for idx, overrides in enumerate(batch):
+            entry = journal_state.completed(overrides)
+            if entry is not None:
+                completed = JobReturn()
+                completed.overrides = list(overrides)
+                completed.working_dir = entry["working_dir"]
+                if "return_value" not in entry:
+                    not_recorded += 1
+                completed.return_value = entry.get("return_value")
+                completed.task_name = JobRuntime.instance().get("name")
+                completed.status = JobStatus.COMPLETED
+                results[idx] = completed
+        log.info(
+            "Resuming sweep: {} of {} jobs already completed".format(
+                len([ret for ret in results if ret is not None]), len(batch)
+            )
+        )
+        if not_recorded > 0:
+            log.warning(
+                "The return values of {} completed jobs were not recorded in the sweep journal"
+                " (not serializable to JSON), using None".format(not_recorded)
+            )
+
+        start = 0
+        while start < len(batch):
+            if results[start] is not None:
+                start += 1
+                continue
+            end = start
+            while end < len(batch) and results[end] is None:
+                end += 1
+            launched = self._launch(batch[start:end], initial_job_idx + start)
+            results[start:end] = launched
+            start = end
+
+        ret_list: List[JobReturn] = []
+        for result in results:
+            assert result is not None
+            ret_list.append(result)
+        return ret_list
@@ -1,14 +1,16 @@
 # Copyright (c) Facebook, Inc. and its affiliates. All Rights Reserved
-import logging.config
+import logging
 import warnings
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from omegaconf import DictConfig, OmegaConf, _utils
 
-from hydra.conf import PluginConf
 from hydra.core.hydra_config import HydraConfig
 
+if TYPE_CHECKING:
+    from hydra.conf import PluginConf
+
 log = logging.getLogger(__name__)
 
 
@@ -47,7 +49,7 @@ def get_static_method(full_method_name: str) -> type:
         raise e
 
 
-def instantiate(config: PluginConf, *args: Any, **kwargs: Any) -> Any:
+def instantiate(config: "PluginConf", *args: Any, **kwargs: Any) -> Any:
     import copy
 
     # copy config to avoid mutating it when merging with kwargs
@@ -110,7 +112,7 @@ def to_absolute_path(path: str) -> str:
     return str(ret)
 
 
-def _get_class_name(config: PluginConf) -> str:
+def _get_class_name(config: "PluginConf") -> str:
     if "class" in config:
         warnings.warn(
             "\n"
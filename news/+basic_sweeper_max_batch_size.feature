@@ -0,0 +1 @@
+BasicSweeper generates its jobs lazily, and can launch them in batches of hydra.sweeper.params.max_batch_size jobs. With hydra.sweeper.params.keep_results=false, the memory of the sweep does not grow with its number of jobs
\ No newline at end of file
@@ -0,0 +1 @@
+Add an opt-in manifest of the discovered plugins, enabled by the HYDRA_PLUGINS_MANIFEST environment variable and stored in ~/.cache/hydra with HYDRA_PLUGINS_MANIFEST=1
\ No newline at end of file
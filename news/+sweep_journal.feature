@@ -0,0 +1 @@
+Multirun records the outcome of each job in the journal of the sweep, ${hydra.sweep.dir}/journal.jsonl by default (hydra.sweep.journal=null disables it). Interrupted sweeps can be resumed with --resume
\ No newline at end of file
@@ -191,6 +191,19 @@ def test_core(session, install_cmd):
     run_pytest(session, "examples/advanced/hydra_app_example")
 
 
+@nox.session(python="3.8")
+def test_core_verify_incremental(session):
+    # every composition reusing a merged config is compared with a full composition
+    session.install("--upgrade", "setuptools", "pip")
+    install_hydra(session, ["pip", "install", "-e"])
+    session.install("pytest")
+    session.run(
+        *pytest_args(session, "tests"),
+        env={"HYDRA_VERIFY_INCREMENTAL": "1"},
+        silent=SILENT,
+    )
+
+
 @nox.session(python=PYTHON_VERSIONS)
 @nox.parametrize(
     "install_cmd",
@@ -227,6 +240,17 @@ def test_plugins(session, install_cmd):
         run_pytest(session)
 
 
+@nox.session(python="3.8")
+def benchmark(session):
+    # pytest-benchmark options can be passed after --, for example:
+    # nox -s benchmark -- --benchmark-save=1.0.0
+    # nox -s benchmark -- --benchmark-compare --benchmark-compare-fail=median:10%
+    session.install("--upgrade", "setuptools", "pip")
+    session.install("pytest", "pytest-benchmark")
+    install_hydra(session, ["pip", "install", "-e"])
+    session.run(*pytest_args(session, "benchmarks"))
+
+
 @nox.session(python="3.8")
 def coverage(session):
     coverage_env = {
@@ -55,9 +55,12 @@ class ExampleLauncher(Launcher):
         self.config_loader = config_loader
         self.task_function = task_function
 
-    def launch(self, job_overrides: Sequence[Sequence[str]]) -> Sequence[JobReturn]:
+    def launch(
+        self, job_overrides: Sequence[Sequence[str]], initial_job_idx: int = 0
+    ) -> Sequence[JobReturn]:
         """
         :param job_overrides: a List of List<String>, where each inner list is the arguments for one job run.
+        :param initial_job_idx: Initial job idx in batch.
         :return: an array of return values from run_job with indexes corresponding to the input list indexes.
         """
         setup_globals()
@@ -76,7 +79,7 @@ class ExampleLauncher(Launcher):
         log.info("Sweep output dir : {}".format(sweep_dir))
         runs = []
 
-        for idx, overrides in enumerate(job_overrides):
+        for idx, overrides in enumerate(job_overrides, initial_job_idx):
             log.info("\t#{} : {}".format(idx, " ".join(filter_overrides(overrides))))
             sweep_config = self.config_loader.load_sweep_config(
                 self.config, list(overrides)
@@ -94,6 +97,7 @@ class ExampleLauncher(Launcher):
                 task_function=self.task_function,
                 job_dir_key="hydra.sweep.dir",
                 job_subdir_key="hydra.sweep.subdir",
+                journal=sweep_config.hydra.sweep.journal,
             )
             runs.append(ret)
             # reconfigure the logging subsystem for Hydra as the run_job call configured it for the Job.
@@ -63,6 +63,6 @@ class ExampleSweeper(Sweeper):
 
         batch = list(itertools.product(*src_lists))
 
-        returns = [self.launcher.launch(batch)]
+        returns = [self.launcher.launch(batch, initial_job_idx=0)]
         # returns are not acted on right now.
         return returns
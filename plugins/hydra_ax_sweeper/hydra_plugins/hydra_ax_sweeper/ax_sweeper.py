@@ -1,16 +1,22 @@
 # Copyright (c) Facebook, Inc. and its affiliates. All Rights Reserved
 import logging
+import numbers
+from concurrent.futures import FIRST_COMPLETED, Future, wait
 from dataclasses import dataclass
 from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple, Union
 
+import numpy as np  # type: ignore
 from ax import ParameterType  # type: ignore
 from ax.core import types as ax_types  # type: ignore
+from ax.core.data import Data  # type: ignore
+from ax.core.generator_run import GeneratorRun  # type: ignore
 from ax.service.ax_client import AxClient  # type: ignore
 from omegaconf import DictConfig, OmegaConf
 
 from hydra.core.config_loader import ConfigLoader
 from hydra.core.config_search_path import ConfigSearchPath
 from hydra.core.plugins import Plugins
+from hydra.core.utils import JobReturn
 from hydra.plugins.launcher import Launcher
 from hydra.plugins.search_path_plugin import SearchPathPlugin
 from hydra.plugins.sweeper import Sweeper
@@ -115,6 +121,7 @@ def get_one_batch_of_trials(
     parallelism: Tuple[int, int],
     num_trials_so_far: int,
     num_max_trials_to_do: int,
+    batch_generation: bool = False,
 ) -> BatchOfTrialType:
     """Produce a batch of trials that can be run in parallel"""
     (num_trials, max_parallelism_setting) = parallelism
@@ -126,6 +133,11 @@ def get_one_batch_of_trials(
             # This is a special case where we can run as many trials in parallel as we want.
             # Given that num_trials is also -1, we can run all the trials in parallel.
             max_parallelism_setting = num_max_trials_to_do
+    # trials beyond the maximum number of trials would never be launched
+    max_parallelism_setting = min(max_parallelism_setting, num_max_trials_to_do)
+
+    if batch_generation:
+        return generate_trials(ax_client, max_parallelism_setting)
 
     batch_of_trials = []
     for _ in range(max_parallelism_setting):
@@ -139,6 +151,86 @@ def get_one_batch_of_trials(
     return batch_of_trials
 
 
+def generate_trials(ax_client: AxClient, num_trials: int) -> BatchOfTrialType:
+    """Produce a batch of trials with a single call to the generation strategy, fitting its model once
+    instead of once per trial. Each arm gets its own trial, as with AxClient.get_next_trial"""
+    experiment = ax_client.experiment
+    generator_run = ax_client.generation_strategy.gen(
+        experiment=experiment, n=num_trials
+    )
+    batch_of_trials = []
+    for arm, weight in zip(generator_run.arms, generator_run.weights):
+        arm_generator_run = GeneratorRun(
+            arms=[arm],
+            weights=[weight],
+            optimization_config=generator_run.optimization_config,
+            search_space=generator_run.search_space,
+            model_predictions=generator_run.model_predictions,
+            best_arm_predictions=generator_run.best_arm_predictions,
+        )
+        trial = experiment.new_trial(generator_run=arm_generator_run)
+        trial.mark_running(no_runner_required=True)
+        batch_of_trials.append(
+            Trial(
+                overrides=map_params_to_arg_list(params=arm.parameters),
+                trial_index=trial.index,
+            )
+        )
+    return batch_of_trials
+
+
+def _is_number(value: Any) -> bool:
+    return isinstance(value, (numbers.Real, np.number))
+
+
+def _to_mean_sem(value: Any) -> Optional[Tuple[float, Optional[float]]]:
+    """Convert a number or a (mean, sem) tuple to a (mean, sem) tuple of floats, None if it is neither"""
+    if _is_number(value):
+        return float(value), None
+    if (
+        isinstance(value, tuple)
+        and len(value) == 2
+        and _is_number(value[0])
+        and (value[1] is None or _is_number(value[1]))
+    ):
+        mean, sem = value
+        return float(mean), None if sem is None else float(sem)
+    return None
+
+
+def raw_data_to_evaluation(raw_data: Any, objective_name: str) -> Dict[str, Any]:
+    """Convert the return value of a job to the evaluation of its arm, mapping metric names to
+    (mean, sem) tuples. Numbers can be any real number, including numpy scalars"""
+    if isinstance(raw_data, dict):
+        evaluation = {name: _to_mean_sem(value) for name, value in raw_data.items()}
+    else:
+        evaluation = {objective_name: _to_mean_sem(raw_data)}
+    if any(value is None for value in evaluation.values()):
+        raise ValueError(
+            f"Unsupported return value for trials, expected a number, a (mean, sem) tuple or a dict: {raw_data!r}"
+        )
+    return evaluation
+
+
+def complete_trials(
+    ax_client: AxClient, trials: BatchOfTrialType, raw_data: Sequence[Any]
+) -> None:
+    """Complete a batch of trials, attaching the data of all the trials to the experiment at once"""
+    experiment = ax_client.experiment
+    data = []
+    for trial, trial_raw_data in zip(trials, raw_data):
+        ax_trial = experiment.trials[trial.trial_index]
+        evaluation = raw_data_to_evaluation(trial_raw_data, ax_client.objective_name)
+        data.append(
+            Data.from_evaluations(
+                evaluations={ax_trial.arm.name: evaluation},
+                trial_index=trial.trial_index,
+            )
+        )
+        ax_trial.mark_completed()
+    experiment.attach_data(Data.from_multiple_data(data))
+
+
 class AxSweeper(Sweeper):
     """Class to interface with the Ax Platform"""
 
@@ -151,10 +243,16 @@ class AxSweeper(Sweeper):
         self.early_stopper = EarlyStopper(**ax_config.early_stop)
         self.ax_client_config = ax_config.client
         self.max_trials = ax_config.max_trials
+        self.asynchronous = ax_config.asynchronous
+        self.batch_trials = ax_config.batch_trials
         self.ax_params: DictConfig = OmegaConf.create({})
         if hasattr(ax_config, "params"):
             self.ax_params.update(ax_config.params)
         self.sweep_dir: str
+        self.job_idx: int = 0
+        self.best_parameters: Any = None
+        # best observed objective value and its parameters, used for early stopping from observed data
+        self.best_observation: Optional[Tuple[float, Dict[str, Any]]] = None
 
     def setup(
         self,
@@ -170,6 +268,17 @@ class AxSweeper(Sweeper):
     def sweep(self, arguments: List[str]) -> None:
         ax_client = self.setup_ax_client(arguments)
 
+        assert self.launcher is not None
+        if self.asynchronous:
+            if self.launcher.supports_submit():
+                best_parameters = self.sweep_asynchronously(ax_client)
+                self.save_results(best_parameters)
+                return
+            log.warning(
+                f"{type(self.launcher).__name__} does not support asynchronous launches,"
+                " launching trials in batches"
+            )
+
         num_trials_left = self.max_trials
         recommended_max_parallelism = ax_client.get_recommended_max_parallelism()
         current_parallelism_index = 0
@@ -187,6 +296,7 @@ class AxSweeper(Sweeper):
                     parallelism=current_parallelism,
                     num_trials_so_far=num_trials_so_far,
                     num_max_trials_to_do=num_trials_left,
+                    batch_generation=self.batch_trials,
                 )
                 batch_of_trials_to_launch = batch_of_trials[:num_trials_left]
 
@@ -206,15 +316,67 @@ class AxSweeper(Sweeper):
                 num_trials_so_far += len(batch_of_trials_to_launch)
                 num_trials_left -= len(batch_of_trials_to_launch)
 
-                best_parameters, predictions = ax_client.get_best_parameters()
-                metric = predictions[0][ax_client.objective_name]
-
-                if self.early_stopper.should_stop(metric, best_parameters):
+                if self.should_stop(ax_client):
                     num_trials_left = -1
                     break
 
             current_parallelism_index += 1
 
+        if self.best_parameters is None or self.early_stopper.use_observed_data:
+            self.best_parameters, _ = ax_client.get_best_parameters()
+        self.save_results(self.best_parameters)
+
+    def sweep_asynchronously(self, ax_client: AxClient) -> Any:
+        """
+        Launches a new trial as soon as a trial completes, keeping as many trials running as
+        the current generation step allows. All the trials of a generation step complete before the trials
+        of the next step are generated, as the next step may require their data.
+        Early stopping is evaluated each time a number of trials equal to the parallelism of the
+        current step completes.
+        :return: the best parameters
+        """
+        assert self.launcher is not None
+        num_trials_left = self.max_trials
+        for num_trials, max_parallelism in ax_client.get_recommended_max_parallelism():
+            if num_trials == -1 or num_trials > num_trials_left:
+                num_trials = num_trials_left
+            if max_parallelism == -1:
+                max_parallelism = num_trials
+            num_trials_left -= num_trials
+            pending: Dict["Future[JobReturn]", int] = {}
+            num_completed = 0
+            should_stop = False
+            while True:
+                while (
+                    not should_stop
+                    and num_trials > 0
+                    and len(pending) < max_parallelism
+                ):
+                    parameters, trial_index = ax_client.get_next_trial()
+                    overrides = map_params_to_arg_list(params=parameters)
+                    pending[
+                        self.launcher.submit(overrides, job_idx=self.job_idx)
+                    ] = trial_index
+                    self.job_idx += 1
+                    num_trials -= 1
+                if len(pending) == 0:
+                    break
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    trial_index = pending.pop(future)
+                    raw_data = future.result().return_value
+                    ax_client.complete_trial(trial_index=trial_index, raw_data=raw_data)
+                    self.observe(ax_client, trial_index, raw_data)
+                    num_completed += 1
+                    if not should_stop and num_completed % max_parallelism == 0:
+                        should_stop = self.should_stop(ax_client)
+            if should_stop or num_trials_left <= 0:
+                break
+
+        best_parameters, _ = ax_client.get_best_parameters()
+        return best_parameters
+
+    def save_results(self, best_parameters: Any) -> None:
         results_to_serialize = {"optimizer": "ax", "ax": best_parameters}
         OmegaConf.save(
             OmegaConf.create(results_to_serialize),
@@ -228,12 +390,52 @@ class AxSweeper(Sweeper):
         overrides: Sequence[Sequence[str]],
         batch_of_trials_to_launch: BatchOfTrialType,
     ) -> None:
-        rets = self.launcher.launch(overrides)  # type: ignore
+        rets = self.launcher.launch(  # type: ignore
+            overrides, initial_job_idx=self.job_idx
+        )
+        self.job_idx += len(rets)
+        if self.batch_trials:
+            complete_trials(
+                ax_client,
+                batch_of_trials_to_launch,
+                [ret.return_value for ret in rets],
+            )
         for idx in range(len(batch_of_trials_to_launch)):
             val = rets[idx].return_value
-            ax_client.complete_trial(
-                trial_index=batch_of_trials_to_launch[idx].trial_index, raw_data=val,
-            )
+            if not self.batch_trials:
+                ax_client.complete_trial(
+                    trial_index=batch_of_trials_to_launch[idx].trial_index,
+                    raw_data=val,
+                )
+            self.observe(ax_client, batch_of_trials_to_launch[idx].trial_index, val)
+
+    def observe(self, ax_client: AxClient, trial_index: int, raw_data: Any) -> None:
+        """Record the objective value observed for a completed trial"""
+        if not self.early_stopper.use_observed_data:
+            return
+        evaluation = raw_data_to_evaluation(raw_data, ax_client.objective_name)
+        value = evaluation[ax_client.objective_name][0]
+        if self.best_observation is not None:
+            best_value = self.best_observation[0]
+            if self.experiment.minimize:
+                improved = value < best_value
+            else:
+                improved = value > best_value
+            if not improved:
+                return
+        parameters = ax_client.experiment.trials[trial_index].arm.parameters
+        self.best_observation = (value, parameters)
+
+    def should_stop(self, ax_client: AxClient) -> bool:
+        """Check if the optimization should stop early, according to the best observed objective value
+        or to the best objective value predicted by the model"""
+        if self.early_stopper.use_observed_data:
+            assert self.best_observation is not None
+            value, parameters = self.best_observation
+            return self.early_stopper.should_stop(value, parameters)
+        self.best_parameters, predictions = ax_client.get_best_parameters()
+        metric = predictions[0][ax_client.objective_name]
+        return self.early_stopper.should_stop(metric, self.best_parameters)
 
     def setup_ax_client(self, arguments: List[str]) -> AxClient:
         """Method to setup the Ax Client"""
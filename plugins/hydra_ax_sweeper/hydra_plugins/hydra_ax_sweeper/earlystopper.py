@@ -12,14 +12,22 @@ class EarlyStopper:
     The optimization process is stopped when the performance does not
     improve for a threshold number of consecutive epochs. The performance
     is considered to have improved when the change is more than a given
-    threshold (epsilon)."""
+    threshold (epsilon).
+    The performance is the best objective value predicted by the model, or
+    the best observed objective value if use_observed_data is set, which does
+    not require fitting the model."""
 
     def __init__(
-        self, max_epochs_without_improvement: int, epsilon: float, minimize: bool
+        self,
+        max_epochs_without_improvement: int,
+        epsilon: float,
+        minimize: bool,
+        use_observed_data: bool = False,
     ):
         self.max_epochs_without_improvement = max_epochs_without_improvement
         self.epsilon = epsilon
         self.minimize = minimize
+        self.use_observed_data = use_observed_data
         self.current_best_value: Optional[float] = None
         self.current_epochs_without_improvement = 0
 
@@ -6,6 +6,8 @@ import sys
 from pathlib import Path
 from typing import Any
 
+import numpy as np  # type: ignore
+import pytest
 from omegaconf import DictConfig, OmegaConf
 
 from hydra.core.hydra_config import HydraConfig
@@ -19,6 +21,7 @@ from hydra.test_utils.test_utils import (  # noqa: F401
     sweep_runner,
 )
 from hydra_plugins.hydra_ax_sweeper import AxSweeper
+from hydra_plugins.hydra_ax_sweeper.ax_sweeper import raw_data_to_evaluation
 
 chdir_plugin_root()
 
@@ -158,6 +161,99 @@ def test_configuration_set_via_cmd_and_default_config(
         assert "quadratic.y" in best_parameters
 
 
+def test_asynchronous_sweep(sweep_runner: TSweepRunner,) -> None:  # noqa: F811
+    sweep = sweep_runner(
+        calling_file=os.path.dirname(os.path.abspath(__file__)),
+        calling_module=None,
+        task_function=quadratic,
+        config_path="tests/config",
+        config_name="quadratic.yaml",
+        overrides=[
+            "hydra/sweeper=ax",
+            "hydra/launcher=threads",
+            "hydra.sweeper.params.ax_config.asynchronous=true",
+            "hydra.sweeper.params.ax_config.client.random_seed=1",
+            "hydra.sweeper.params.ax_config.max_trials=3",
+            "quadratic.x=-5:-2",
+            "quadratic.y=-2:2",
+        ],
+        strict=True,
+    )
+    with sweep:
+        assert sweep.returns is None
+        returns = OmegaConf.load(f"{sweep.temp_dir}/optimization_results.yaml")
+        assert isinstance(returns, DictConfig)
+        assert returns["optimizer"] == "ax"
+        best_parameters = returns["ax"]
+        assert "quadratic.x" in best_parameters
+        assert "quadratic.y" in best_parameters
+        job_dirs = [d for d in Path(sweep.temp_dir).iterdir() if d.is_dir()]
+        assert len(job_dirs) == 3
+
+
+def test_batched_trials(sweep_runner: TSweepRunner,) -> None:  # noqa: F811
+    sweep = sweep_runner(
+        calling_file=os.path.dirname(os.path.abspath(__file__)),
+        calling_module=None,
+        task_function=quadratic,
+        config_path="tests/config",
+        config_name="quadratic.yaml",
+        overrides=[
+            "hydra/sweeper=ax",
+            "hydra/launcher=basic",
+            "hydra.sweeper.params.ax_config.batch_trials=true",
+            "hydra.sweeper.params.ax_config.early_stop.use_observed_data=true",
+            "hydra.sweeper.params.ax_config.client.random_seed=1",
+            "hydra.sweeper.params.ax_config.max_trials=4",
+            "quadratic.x=-5:-2",
+            "quadratic.y=-2:2",
+        ],
+        strict=True,
+    )
+    with sweep:
+        assert sweep.returns is None
+        returns = OmegaConf.load(f"{sweep.temp_dir}/optimization_results.yaml")
+        assert isinstance(returns, DictConfig)
+        assert returns["optimizer"] == "ax"
+        best_parameters = returns["ax"]
+        assert -5 <= best_parameters["quadratic.x"] <= -2
+        assert -2 <= best_parameters["quadratic.y"] <= 2
+        job_dirs = [d for d in Path(sweep.temp_dir).iterdir() if d.is_dir()]
+        assert len(job_dirs) == 4
+
+
+def test_raw_data_to_evaluation() -> None:
+    assert raw_data_to_evaluation(1.5, "objective") == {"objective": (1.5, None)}
+    assert raw_data_to_evaluation((1.5, 0.1), "objective") == {"objective": (1.5, 0.1)}
+    assert raw_data_to_evaluation({"objective": 1.5, "other": (2, 0.1)}, "x") == {
+        "objective": (1.5, None),
+        "other": (2, 0.1),
+    }
+
+
+def test_raw_data_to_evaluation_numpy() -> None:
+    assert raw_data_to_evaluation(np.float32(1.5), "objective") == {
+        "objective": (1.5, None)
+    }
+    assert raw_data_to_evaluation(3, "objective") == {"objective": (3.0, None)}
+    assert raw_data_to_evaluation((np.float64(1.5), np.float32(0.25)), "x") == {
+        "x": (1.5, 0.25)
+    }
+    evaluation = raw_data_to_evaluation(
+        {"a": np.int64(2), "b": (np.int32(1), None)}, "x"
+    )
+    assert evaluation == {"a": (2.0, None), "b": (1.0, None)}
+    assert all(isinstance(mean, float) for mean, _ in evaluation.values())
+
+
+@pytest.mark.parametrize(  # type: ignore
+    "raw_data", ["1.5", (1.5, 0.1, 0.2), {"objective": "1.5"}, None]
+)
+def test_raw_data_to_evaluation_unsupported(raw_data: Any) -> None:
+    with pytest.raises(ValueError, match="Unsupported return value for trials"):
+        raw_data_to_evaluation(raw_data, "objective")
+
+
 def test_ax_logging(tmpdir: Path) -> None:
     cmd = [
         sys.executable,
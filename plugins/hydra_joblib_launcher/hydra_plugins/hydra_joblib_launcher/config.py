@@ -8,6 +8,11 @@ from hydra.core.config_store import ConfigStore
 
 @dataclass
 class JobLibConf:
+    # compose the job configs in the launching process and send each worker its serialized config,
+    # instead of sending the config loader and the Hydra state to recompose it in the worker.
+    # not passed to Joblib.Parallel
+    compose_in_parent: bool = False
+
     # maximum number of concurrently running jobs. if -1, all CPUs are used
     n_jobs: int = -1
 
@@ -1,9 +1,9 @@
 # Copyright (c) Facebook, Inc. and its affiliates. All Rights Reserved
 import logging
+import pickle
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Sequence
+from typing import Any, Dict, Iterator, List, Optional, Sequence
 
-from joblib import Parallel, delayed  # type: ignore
 from omegaconf import DictConfig, open_dict
 
 from hydra.core.config_loader import ConfigLoader
@@ -12,6 +12,7 @@ from hydra.core.hydra_config import HydraConfig
 from hydra.core.singleton import Singleton
 from hydra.core.utils import (
     JobReturn,
+    JobRuntime,
     configure_log,
     filter_overrides,
     run_job,
@@ -38,12 +39,17 @@ class JoblibLauncherSearchPathPlugin(SearchPathPlugin):
 
 
 class JoblibLauncher(Launcher):
-    def __init__(self, **kwargs: Any) -> None:
+    def __init__(self, compose_in_parent: bool = False, **kwargs: Any) -> None:
         """Joblib Launcher
 
         Launches parallel jobs using Joblib.Parallel. For details, refer to:
         https://joblib.readthedocs.io/en/latest/generated/joblib.Parallel.html
 
+        :param compose_in_parent: compose the job configs in the launching process, reusing the caches of
+               the config loader across the jobs, and send each worker only its serialized config.
+               Otherwise each worker receives the config loader and the Hydra state and composes its config.
+        :param kwargs: Joblib.Parallel parameters
+
         This plugin is based on the idea and inital implementation of @emilemathieutmp:
         https://github.com/facebookresearch/hydra/issues/357
         """
@@ -51,6 +57,7 @@ class JoblibLauncher(Launcher):
         self.config_loader: Optional[ConfigLoader] = None
         self.task_function: Optional[TaskFunction] = None
 
+        self.compose_in_parent = compose_in_parent
         self.joblib = kwargs
 
     def setup(
@@ -63,11 +70,18 @@ class JoblibLauncher(Launcher):
         self.config_loader = config_loader
         self.task_function = task_function
 
-    def launch(self, job_overrides: Sequence[Sequence[str]]) -> Sequence[JobReturn]:
+    def launch(
+        self, job_overrides: Sequence[Sequence[str]], initial_job_idx: int = 0
+    ) -> Sequence[JobReturn]:
         """
         :param job_overrides: a List of List<String>, where each inner list is the arguments for one job run.
+        :param initial_job_idx: Initial job idx in batch.
         :return: an array of return values from run_job with indexes corresponding to the input list indexes.
         """
+        # joblib is imported when launching, this module is imported on every run to discover its
+        # search path plugin
+        from joblib import Parallel, delayed  # type: ignore
+
         setup_globals()
         assert self.config is not None
         assert self.config_loader is not None
@@ -89,28 +103,58 @@ class JoblibLauncher(Launcher):
             )
         )
         log.info("Launching jobs, sweep output dir : {}".format(sweep_dir))
-        for idx, overrides in enumerate(job_overrides):
+        for idx, overrides in enumerate(job_overrides, initial_job_idx):
             log.info("\t#{} : {}".format(idx, " ".join(filter_overrides(overrides))))
 
-        singleton_state = Singleton.get_state()
-
-        runs = Parallel(**joblib_cfg)(
-            delayed(execute_job)(
-                idx,
-                overrides,
-                self.config_loader,
-                self.config,
-                self.task_function,
-                singleton_state,
+        if self.compose_in_parent:
+            task_name = JobRuntime.instance().get("name")
+            runs = Parallel(**joblib_cfg)(
+                delayed(execute_composed_job)(
+                    serialized_config, task_name, self.task_function,
+                )
+                for serialized_config in self._compose_jobs(
+                    job_overrides, initial_job_idx
+                )
+            )
+        else:
+            singleton_state = Singleton.get_state()
+
+            runs = Parallel(**joblib_cfg)(
+                delayed(execute_job)(
+                    idx,
+                    overrides,
+                    self.config_loader,
+                    self.config,
+                    self.task_function,
+                    singleton_state,
+                )
+                for idx, overrides in enumerate(job_overrides, initial_job_idx)
             )
-            for idx, overrides in enumerate(job_overrides)
-        )
 
         assert isinstance(runs, List)
         for run in runs:
             assert isinstance(run, JobReturn)
         return runs
 
+    def _compose_jobs(
+        self, job_overrides: Sequence[Sequence[str]], initial_job_idx: int = 0
+    ) -> Iterator[bytes]:
+        """
+        :return: the serialized configs of the jobs, composed lazily as joblib dispatches them
+        """
+        assert self.config is not None
+        assert self.config_loader is not None
+        for idx, overrides in enumerate(job_overrides, initial_job_idx):
+            sweep_config = self.config_loader.load_sweep_config(
+                self.config, list(overrides)
+            )
+            with open_dict(sweep_config):
+                sweep_config.hydra.job.id = "{}_{}".format(
+                    sweep_config.hydra.job.name, idx
+                )
+                sweep_config.hydra.job.num = idx
+            yield pickle.dumps(sweep_config, protocol=pickle.HIGHEST_PROTOCOL)
+
 
 def execute_job(
     idx: int,
@@ -136,6 +180,28 @@ def execute_job(
         task_function=task_function,
         job_dir_key="hydra.sweep.dir",
         job_subdir_key="hydra.sweep.subdir",
+        journal=sweep_config.hydra.sweep.journal,
+    )
+
+    return ret
+
+
+def execute_composed_job(
+    serialized_config: bytes, task_name: str, task_function: TaskFunction,
+) -> JobReturn:
+    """Calls `run_job` in parallel with a config composed by the launcher
+    """
+    setup_globals()
+    sweep_config = pickle.loads(serialized_config)
+    JobRuntime.instance().set("name", task_name)
+    HydraConfig.instance().set_config(sweep_config)
+
+    ret = run_job(
+        config=sweep_config,
+        task_function=task_function,
+        job_dir_key="hydra.sweep.dir",
+        job_subdir_key="hydra.sweep.subdir",
+        journal=sweep_config.hydra.sweep.journal,
     )
 
     return ret
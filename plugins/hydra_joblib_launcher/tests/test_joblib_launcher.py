@@ -32,7 +32,10 @@ def test_discovery() -> None:
 
 
 @pytest.mark.skipif(sys.platform.startswith("win"), reason=win_msg)
-@pytest.mark.parametrize("launcher_name, overrides", [("joblib", [])])
+@pytest.mark.parametrize(
+    "launcher_name, overrides",
+    [("joblib", []), ("joblib", ["hydra.launcher.params.compose_in_parent=true"])],
+)
 class TestJoblibLauncher(LauncherTestSuite):
     """
     Run the Launcher test suite on this launcher.
@@ -57,7 +60,20 @@ class TestJoblibLauncher(LauncherTestSuite):
             },
             ["-m"],
             "hydra_plugins.joblib_launcher",
-        )
+        ),
+        # joblib with the job configs composed in the launching process
+        (
+            {
+                "defaults": [
+                    {"hydra/launcher": "joblib"},
+                    {"hydra/hydra_logging": "hydra_debug"},
+                    {"hydra/job_logging": "disabled"},
+                ],
+                "hydra": {"launcher": {"params": {"compose_in_parent": True}}},
+            },
+            ["-m"],
+            "hydra_plugins.joblib_launcher",
+        ),
     ],
 )
 class TestJoblibLauncherIntegration(IntegrationTestSuite):
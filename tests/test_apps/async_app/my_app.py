@@ -0,0 +1,16 @@
+# Copyright (c) Facebook, Inc. and its affiliates. All Rights Reserved
+import asyncio
+
+from omegaconf import DictConfig
+
+import hydra
+
+
+@hydra.main()
+async def my_app(cfg: DictConfig) -> None:
+    await asyncio.sleep(0)
+    print(cfg.pretty())
+
+
+if __name__ == "__main__":
+    my_app()
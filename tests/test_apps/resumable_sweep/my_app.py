@@ -0,0 +1,20 @@
+# Copyright (c) Facebook, Inc. and its affiliates. All Rights Reserved
+import os
+
+from omegaconf import DictConfig
+
+import hydra
+from hydra.utils import get_original_cwd
+
+
+@hydra.main()
+def my_app(cfg: DictConfig) -> int:
+    with open(os.path.join(get_original_cwd(), "runs.txt"), "a") as f:
+        f.write(f"{cfg.x}\n")
+    if str(cfg.x) == os.environ.get("FAIL_AT"):
+        raise ValueError(f"Failing at {cfg.x}")
+    return int(cfg.x) * 10
+
+
+if __name__ == "__main__":
+    my_app()
@@ -0,0 +1,127 @@
+# Copyright (c) Facebook, Inc. and its affiliates. All Rights Reserved
+import asyncio
+import logging
+from pathlib import Path
+from typing import Any, List
+
+import pytest
+from omegaconf import DictConfig
+
+from hydra.core.hydra_config import HydraConfig
+from hydra.test_utils.launcher_common_tests import (
+    IntegrationTestSuite,
+    LauncherTestSuite,
+)
+
+# noinspection PyUnresolvedReferences
+from hydra.test_utils.test_utils import TSweepRunner, sweep_runner  # noqa: F401
+
+log = logging.getLogger(__name__)
+
+
+@pytest.mark.parametrize(
+    "launcher_name, overrides",
+    [("asyncio", []), ("asyncio", ["hydra.launcher.params.max_concurrency=1"])],
+)
+class TestAsyncioLauncher(LauncherTestSuite):
+    pass
+
+
+@pytest.mark.parametrize(
+    "task_launcher_cfg, extra_flags, plugin_module",
+    [
+        (
+            {
+                "defaults": [
+                    {"hydra/launcher": "asyncio"},
+                    {"hydra/hydra_logging": "hydra_debug"},
+                    {"hydra/job_logging": "disabled"},
+                ]
+            },
+            ["-m"],
+            "hydra._internal.core_plugins.asyncio_launcher",
+        )
+    ],
+)
+class TestAsyncioLauncherIntegration(IntegrationTestSuite):
+    """
+    Run this launcher through the integration test suite.
+    """
+
+    @pytest.mark.skip(  # type: ignore
+        reason="The asyncio launcher does not change the working directory of jobs"
+    )
+    def test_custom_sweeper_run_workdir(
+        self, task_launcher_cfg: DictConfig, extra_flags: List[str], plugin_module: str,
+    ) -> None:
+        ...
+
+
+@pytest.mark.parametrize(  # type: ignore
+    "max_concurrency, expected", [(2, 2), (None, 4), (1, 1)]
+)
+def test_concurrent_async_jobs(
+    sweep_runner: TSweepRunner, max_concurrency: Any, expected: int,  # noqa: F811
+) -> None:
+    running: List[int] = []
+    max_running: List[int] = []
+
+    async def task(cfg: DictConfig) -> Any:
+        running.append(1)
+        max_running.append(len(running))
+        num = HydraConfig.instance().hydra.job.num
+        log.info(f"message from job {num}")
+        # later jobs complete first
+        await asyncio.sleep(0.1 * (4 - int(num)))
+        running.pop()
+        return num, HydraConfig.instance().hydra.job.num
+
+    sweep = sweep_runner(
+        calling_file=None,
+        calling_module="hydra.test_utils.a_module",
+        task_function=task,
+        config_path="configs",
+        config_name="compose",
+        overrides=[
+            "hydra/launcher=asyncio",
+            f"hydra.launcher.params.max_concurrency={max_concurrency or 'null'}",
+            "bar=1,2,3,4",
+        ],
+    )
+    with sweep:
+        assert sweep.returns is not None
+        job_returns = sweep.returns[0]
+        assert [ret.return_value for ret in job_returns] == [
+            (str(i), str(i)) for i in range(4)
+        ]
+        assert max(max_running) == expected
+        for ret in job_returns:
+            num = ret.hydra_cfg.hydra.job.num
+            assert ret.working_dir is not None
+            lines = (
+                (Path(ret.working_dir) / f"{ret.hydra_cfg.hydra.job.name}.log")
+                .read_text()
+                .splitlines()
+            )
+            assert len(lines) == 1
+            assert lines[0].endswith(f"message from job {num}")
+
+
+def test_async_task_function_with_basic_launcher(
+    sweep_runner: TSweepRunner,  # noqa: F811
+) -> None:
+    async def task(cfg: DictConfig) -> Any:
+        await asyncio.sleep(0)
+        return cfg.bar
+
+    sweep = sweep_runner(
+        calling_file=None,
+        calling_module="hydra.test_utils.a_module",
+        task_function=task,
+        config_path="configs",
+        config_name="compose",
+        overrides=["hydra/launcher=basic", "bar=1,2"],
+    )
+    with sweep:
+        assert sweep.returns is not None
+        assert [ret.return_value for ret in sweep.returns[0]] == [1, 2]
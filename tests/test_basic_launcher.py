@@ -1,13 +1,22 @@
 # Copyright (c) Facebook, Inc. and its affiliates. All Rights Reserved
+from concurrent.futures import Future
+from typing import List, Sequence
+
 import pytest
+from omegaconf import DictConfig, OmegaConf
 
+from hydra._internal.core_plugins.basic_sweeper import BasicSweeper
+from hydra.core.config_loader import ConfigLoader
+from hydra.core.utils import JobReturn
+from hydra.plugins.launcher import Launcher
 from hydra.test_utils.launcher_common_tests import (
     IntegrationTestSuite,
     LauncherTestSuite,
 )
+from hydra.types import TaskFunction
 
 # noinspection PyUnresolvedReferences
-from hydra.test_utils.test_utils import sweep_runner  # noqa: F401
+from hydra.test_utils.test_utils import TSweepRunner, sweep_runner  # noqa: F401
 
 
 @pytest.mark.parametrize("launcher_name, overrides", [("basic", [])])
@@ -37,3 +46,129 @@ class TestExampleLauncherIntegration(IntegrationTestSuite):
     """
 
     pass
+
+
+def test_basic_sweeper_max_batch_size(sweep_runner: TSweepRunner) -> None:  # noqa: F811
+    sweep = sweep_runner(
+        calling_file=None,
+        calling_module="hydra.test_utils.a_module",
+        task_function=None,
+        config_path="configs",
+        config_name="compose",
+        overrides=[
+            "hydra/launcher=basic",
+            "hydra.sweeper.params.max_batch_size=4",
+            "group1=file1,file2",
+            "bar=1,2,3",
+        ],
+    )
+    with sweep:
+        assert sweep.returns is not None
+        assert [len(batch) for batch in sweep.returns] == [4, 2]
+        job_returns = [ret for batch in sweep.returns for ret in batch]
+        assert [ret.hydra_cfg.hydra.job.num for ret in job_returns] == [
+            str(i) for i in range(6)
+        ]
+        assert [ret.overrides for ret in job_returns] == [
+            [f"group1={group1}", f"bar={bar}"]
+            for group1 in ["file1", "file2"]
+            for bar in [1, 2, 3]
+        ]
+
+
+@pytest.mark.parametrize("max_batch_size", [0, -1])  # type: ignore
+def test_basic_sweeper_invalid_max_batch_size(max_batch_size: int) -> None:
+    with pytest.raises(ValueError, match="max_batch_size must be a positive integer"):
+        BasicSweeper(max_batch_size=max_batch_size)
+
+
+def test_basic_sweeper_keep_results(sweep_runner: TSweepRunner) -> None:  # noqa: F811
+    sweep = sweep_runner(
+        calling_file=None,
+        calling_module="hydra.test_utils.a_module",
+        task_function=None,
+        config_path="configs",
+        config_name="compose",
+        overrides=[
+            "hydra/launcher=basic",
+            "hydra.sweeper.params.max_batch_size=2",
+            "hydra.sweeper.params.keep_results=false",
+            "bar=1,2,3",
+        ],
+    )
+    with sweep:
+        assert sweep.returns == []
+
+
+class LegacyLauncher(Launcher):
+    """
+    Launcher implementing launch() without initial_job_idx
+    """
+
+    def __init__(self) -> None:
+        self.jobs: List[List[str]] = []
+
+    def setup(
+        self,
+        config: DictConfig,
+        config_loader: ConfigLoader,
+        task_function: TaskFunction,
+    ) -> None:
+        pass
+
+    def launch(self, job_overrides: Sequence[Sequence[str]]) -> Sequence[JobReturn]:  # type: ignore
+        rets = []
+        for overrides in job_overrides:
+            self.jobs.append(list(overrides))
+            ret = JobReturn()
+            ret.overrides = list(overrides)
+            rets.append(ret)
+        return rets
+
+
+def test_basic_sweeper_legacy_launcher() -> None:
+    sweeper = BasicSweeper(max_batch_size=2)
+    sweeper.config = OmegaConf.create({"hydra": {"sweep": {"journal": None}}})
+    launcher = LegacyLauncher()
+    sweeper.launcher = launcher
+    returns = sweeper.sweep(arguments=["a=1,2,3"])
+    assert [len(batch) for batch in returns] == [2, 1]
+    assert launcher.jobs == [["a=1"], ["a=2"], ["a=3"]]
+
+
+class SubmitLauncher(LegacyLauncher):
+    """
+    Launcher completing each job as soon as it is submitted
+    """
+
+    def __init__(self, events: List[str]) -> None:
+        super().__init__()
+        self.events = events
+
+    def submit(self, overrides: Sequence[str], job_idx: int) -> "Future[JobReturn]":
+        self.events.append(f"submit {job_idx}")
+        future: "Future[JobReturn]" = Future()
+        ret = JobReturn()
+        ret.overrides = list(overrides)
+        future.set_result(ret)
+        return future
+
+
+def test_basic_sweeper_reports_batches_as_they_complete() -> None:
+    events: List[str] = []
+
+    class RecordingSweeper(BasicSweeper):
+        def update_results(self, job_results: Sequence[JobReturn]) -> None:
+            events.append(f"report {[ret.overrides for ret in job_results]}")
+
+    sweeper = RecordingSweeper(max_batch_size=2, keep_results=False)
+    sweeper.config = OmegaConf.create({"hydra": {"sweep": {"journal": None}}})
+    sweeper.launcher = SubmitLauncher(events)
+    assert sweeper.sweep(arguments=["a=1,2,3"]) == []
+    assert events == [
+        "submit 0",
+        "submit 1",
+        "report [['a=1'], ['a=2']]",
+        "submit 2",
+        "report [['a=3']]",
+    ]
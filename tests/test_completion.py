@@ -1,13 +1,17 @@
 # Copyright (c) Facebook, Inc. and its affiliates. All Rights Reserved
 import distutils.spawn
 import os
+import socket
 import subprocess
 import sys
+import threading
+import time
 from pathlib import Path
-from typing import List
+from typing import Any, List
 
 import pytest
 
+from hydra._internal import completion_server
 from hydra._internal.config_loader_impl import ConfigLoaderImpl
 from hydra._internal.core_plugins.bash_completion import BashCompletion
 from hydra._internal.utils import create_config_search_path
@@ -248,3 +252,115 @@ def test_strip(
     line = "{}{}".format(app_prefix, args_line)
     result_line = BashCompletion.strip_python_or_app_name(line)
     assert result_line == args_line
+
+
+def _query_server(socket_path: str, line: str) -> str:
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.connect(socket_path)
+        sock.sendall((line + "\n").encode("utf-8"))
+        data = b""
+        while True:
+            chunk = sock.recv(4096)
+            if not chunk:
+                return data.decode("utf-8")
+            data += chunk
+
+
+@pytest.mark.skipif(  # type: ignore
+    not hasattr(socket, "AF_UNIX"), reason="Unix sockets not supported"
+)
+def test_completion_server(tmpdir: Path) -> None:
+    socket_path = str(Path(tmpdir) / "completion.sock")
+    bc = BashCompletion(create_config_loader())
+    thread = threading.Thread(
+        target=bc.serve,
+        kwargs=dict(config_name="config.yaml", socket_path=socket_path, idle_timeout=1),
+    )
+    thread.start()
+    try:
+        deadline = time.time() + 10
+        while not completion_server.is_serving(socket_path):
+            assert time.time() < deadline
+            time.sleep(0.01)
+        for line in ["", "dict.", "-c job"]:
+            expected = bc._query(config_name="config.yaml", line=line)
+            reply = _query_server(socket_path, "python foo.py " + line)
+            assert reply == "OK " + " ".join(expected) + "\n"
+    finally:
+        # stops after idle_timeout seconds without queries
+        thread.join(10)
+    assert not thread.is_alive()
+    assert not os.path.exists(socket_path)
+
+
+@pytest.mark.skipif(  # type: ignore
+    not hasattr(socket, "AF_UNIX"), reason="Unix sockets not supported"
+)
+def test_completion_server_stops_when_watched_file_changes(tmpdir: Path) -> None:
+    socket_path = str(Path(tmpdir) / "completion.sock")
+    app = Path(tmpdir) / "app.py"
+    app.write_text("v1")
+    thread = threading.Thread(
+        target=completion_server.serve,
+        kwargs=dict(
+            socket_path=socket_path,
+            query=lambda line: [line],
+            idle_timeout=10,
+            watched_files=[str(app)],
+        ),
+    )
+    thread.start()
+    try:
+        deadline = time.time() + 10
+        while not completion_server.is_serving(socket_path):
+            assert time.time() < deadline
+            time.sleep(0.01)
+        assert _query_server(socket_path, "abc") == "OK abc\n"
+        app.write_text("version 2")
+        # no answer, the client falls back to querying the app
+        assert _query_server(socket_path, "abc") == ""
+    finally:
+        thread.join(10)
+    assert not thread.is_alive()
+
+
+def test_install_script_uses_completion_server(capsys: Any) -> None:
+    BashCompletion(create_config_loader()).install()
+    script = capsys.readouterr().out
+    assert "HYDRA_COMP_SERVER" in script
+    assert "-sc serve=bash" in script
+    assert "-sc query=bash" in script
+
+
+@pytest.mark.skipif(  # type: ignore
+    not hasattr(socket, "AF_UNIX"), reason="Unix sockets not supported"
+)
+def test_completion_server_requires_private_dir(tmpdir: Path) -> None:
+    socket_dir = Path(tmpdir) / "sockets"
+    socket_dir.mkdir(mode=0o700)
+    assert completion_server.is_private_dir(str(socket_dir))
+    assert not completion_server.is_private_dir(str(socket_dir / "missing"))
+
+    socket_dir.chmod(0o755)
+    assert not completion_server.is_private_dir(str(socket_dir))
+    with pytest.raises(ValueError, match="not accessible to other users"):
+        completion_server.serve(
+            socket_path=str(socket_dir / "completion.sock"),
+            query=lambda line: [line],
+            idle_timeout=1,
+        )
+    assert not (socket_dir / "completion.sock").exists()
+
+    link = Path(tmpdir) / "link"
+    socket_dir.chmod(0o700)
+    link.symlink_to(socket_dir)
+    assert not completion_server.is_private_dir(str(link))
+
+
+def test_install_script_secures_completion_server(capsys: Any) -> None:
+    BashCompletion(create_config_loader()).install()
+    script = capsys.readouterr().out
+    # sockets are in a private directory, a single server is started at a time
+    assert 'mkdir -m 700 "$dir"' in script
+    assert '[ -O "$dir" ]' in script
+    assert 'mkdir "$sock.lock"' in script
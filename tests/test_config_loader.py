@@ -1,14 +1,24 @@
 # Copyright (c) Facebook, Inc. and its affiliates. All Rights Reserved
 from dataclasses import dataclass
+from pathlib import Path
 from typing import Any, List, Optional, Tuple
 
 import pkg_resources
 import pytest
-from omegaconf import MISSING, ListConfig, OmegaConf, ValidationError
+from omegaconf import (
+    MISSING,
+    DictConfig,
+    ListConfig,
+    OmegaConf,
+    ReadonlyConfigError,
+    ValidationError,
+)
 
 from hydra._internal.config_loader_impl import ConfigLoaderImpl
 from hydra._internal.utils import create_config_search_path
+from hydra.core.config_loader import ConfigLoader
 from hydra.core.config_store import ConfigStore, ConfigStoreWithProvider
+from hydra.core.object_type import ObjectType
 from hydra.errors import MissingConfigException
 
 # noinspection PyUnresolvedReferences
@@ -570,3 +580,211 @@ def test_invalid_plugin_merge(restore_singletons: Any) -> Any:  # noqa: F811
     cl = ConfigLoaderImpl(config_search_path=create_config_search_path(None))
     with pytest.raises(ValidationError):
         cl.load_configuration(config_name="config", overrides=["plugin=invalid"])
+
+
+def test_load_configuration_from_cache() -> None:
+    config_loader = ConfigLoaderImpl(
+        config_search_path=create_config_search_path("hydra/test_utils/configs")
+    )
+    cfg1 = config_loader.load_configuration(
+        config_name="compose.yaml", overrides=["foo=20"], strict=False
+    )
+    assert len(config_loader.cache) == 1
+    cfg1.foo = 30
+    cfg2 = config_loader.load_configuration(
+        config_name="compose.yaml", overrides=["foo=20"], strict=False
+    )
+    assert cfg2 is not cfg1
+    del cfg2["hydra"]
+    assert cfg2 == {"foo": 20, "bar": 100}
+
+    # load history is recorded for compositions served from the cache as well
+    history = config_loader.get_load_history()
+    assert history[: len(history) // 2] == history[len(history) // 2 :]
+
+
+def test_load_configuration_cache_invalidation(
+    tmpdir: Path, restore_singletons: Any  # noqa: F811
+) -> None:
+    OmegaConf.save(OmegaConf.create({"foo": 10}), str(tmpdir / "config.yaml"))
+    config_loader = ConfigLoaderImpl(
+        config_search_path=create_config_search_path(str(tmpdir))
+    )
+    cfg = config_loader.load_configuration(config_name="config", overrides=[])
+    assert cfg.foo == 10
+
+    # modified file
+    OmegaConf.save(OmegaConf.create({"foo": 200}), str(tmpdir / "config.yaml"))
+    cfg = config_loader.load_configuration(config_name="config", overrides=[])
+    assert cfg.foo == 200
+
+    # new schema in the ConfigStore
+    ConfigStore.instance().store(name="config", node={"foo": 0, "bar": 1})
+    cfg = config_loader.load_configuration(config_name="config", overrides=[])
+    assert cfg.foo == 200 and cfg.bar == 1
+
+
+def test_load_configuration_cache_eviction() -> None:
+    config_loader = ConfigLoaderImpl(
+        config_search_path=create_config_search_path("hydra/test_utils/configs"),
+        cache_size=1,
+    )
+    for overrides in [["foo=1"], ["foo=2"], ["foo=1"]]:
+        config_loader.load_configuration(
+            config_name="compose.yaml", overrides=overrides, strict=False
+        )
+    assert list(config_loader.cache.keys()) == [("compose.yaml", ("foo=1",), False)]
+
+
+def test_config_store_load_is_not_copied(restore_singletons: Any) -> None:  # noqa: F811
+    node = {"foo": {"bar": 10}}
+    cs = ConfigStore.instance()
+    cs.store(name="config", node=node)
+    # the input is not shared with the store
+    node["foo"]["bar"] = 20
+
+    loaded = cs.load("config.yaml").node
+    assert isinstance(loaded, DictConfig)
+    assert loaded == {"foo": {"bar": 10}}
+    assert cs.load("config.yaml").node is loaded
+    with pytest.raises(ReadonlyConfigError):
+        loaded.foo.bar = 30
+
+    copied = ConfigStore.copy_node(loaded)
+    assert isinstance(copied, DictConfig)
+    copied.foo.bar = 30
+    assert copied == {"foo": {"bar": 30}}
+    assert loaded == {"foo": {"bar": 10}}
+
+    config_loader = ConfigLoaderImpl(config_search_path=create_config_search_path(None))
+    cfg = config_loader.load_configuration(config_name="config", overrides=[])
+    cfg.foo.bar = 30
+    assert cs.load("config.yaml").node == {"foo": {"bar": 10}}
+
+
+def test_config_store_lazy_structured_config(
+    restore_singletons: Any,  # noqa: F811
+) -> None:
+    cs = ConfigStore.instance()
+    cs.store(group="plugin", name="concrete", node=ConcretePlugin, path="plugin")
+    assert cs.get_type("plugin/concrete.yaml") == ObjectType.CONFIG
+    # classes are converted on first load
+    assert cs.repo["plugin"]["concrete.yaml"].node is ConcretePlugin
+    node = cs.load("plugin/concrete.yaml").node
+    assert node == {"plugin": {"name": "foobar_plugin", "params": {"foo": 10}}}
+    assert node.plugin._type == ConcretePlugin
+    assert cs.load("plugin/concrete.yaml").node is node
+
+
+def test_load_configuration_reuses_plan() -> None:
+    config_loader = ConfigLoaderImpl(
+        config_search_path=create_config_search_path("hydra/test_utils/configs")
+    )
+    cfg = config_loader.load_configuration(
+        config_name="optional-default.yaml", overrides=[], strict=False
+    )
+    plan = config_loader.plans["optional-default.yaml"]
+    assert plan.fingerprint is not None
+    del cfg["hydra"]
+    assert cfg == {"foo": 10}
+
+    cfg = config_loader.load_configuration(
+        config_name="optional-default.yaml", overrides=["group1=file2"], strict=False
+    )
+    assert config_loader.plans["optional-default.yaml"] is plan
+    del cfg["hydra"]
+    assert cfg == {"foo": 20}
+
+    # the plan is not modified by the compositions using it
+    cfg = config_loader.load_configuration(
+        config_name="optional-default.yaml", overrides=["foo=30"], strict=False
+    )
+    assert config_loader.plans["optional-default.yaml"] is plan
+    del cfg["hydra"]
+    assert cfg == {"foo": 30}
+    assert plan.defaults[-1] == {"group1": "file1", "optional": True}
+
+
+def test_load_sweep_config_incremental() -> None:
+    config_loader = ConfigLoaderImpl(
+        config_search_path=create_config_search_path("hydra/test_utils/configs"),
+        verify_incremental=True,
+    )
+    master_config = config_loader.load_configuration(
+        config_name="optional-default.yaml",
+        overrides=["group1=file1,file2", "bar=1,2"],
+        strict=False,
+    )
+    for group1, foo in [("file1", 10), ("file2", 20)]:
+        for bar in [1, 2]:
+            sweep_config = config_loader.load_sweep_config(
+                master_config, [f"group1={group1}", f"bar={bar}"]
+            )
+            assert sweep_config.foo == foo
+            assert sweep_config.bar == bar
+            assert sweep_config.hydra.overrides.task == [
+                f"group1={group1}",
+                f"bar={bar}",
+            ]
+
+    # one merged config per value of group1, plus the master one
+    assert len(config_loader.plans["optional-default.yaml"].merged) == 3
+
+
+@pytest.mark.parametrize(  # type: ignore
+    "env, expected", [(None, False), ("0", False), ("1", True)]
+)
+def test_verify_incremental_from_env(
+    monkeypatch: Any, env: Optional[str], expected: bool
+) -> None:
+    if env is None:
+        monkeypatch.delenv("HYDRA_VERIFY_INCREMENTAL", raising=False)
+    else:
+        monkeypatch.setenv("HYDRA_VERIFY_INCREMENTAL", env)
+    config_loader = ConfigLoaderImpl(
+        config_search_path=create_config_search_path("hydra/test_utils/configs")
+    )
+    assert config_loader.verify_incremental == expected
+
+
+def test_load_history_timings(
+    tmpdir: Path, restore_singletons: Any  # noqa: F811
+) -> None:
+    (tmpdir / "db").mkdir()
+    OmegaConf.save(
+        OmegaConf.create({"defaults": [{"db": "mysql"}], "foo": 10}),
+        str(tmpdir / "config.yaml"),
+    )
+    OmegaConf.save(
+        OmegaConf.create({"db": {"driver": "mysql"}}), str(tmpdir / "db" / "mysql.yaml")
+    )
+    ConfigStore.instance().store(
+        group="db", name="mysql", node=MySQLConfig, path="db", provider="test"
+    )
+    config_loader = ConfigLoaderImpl(
+        config_search_path=create_config_search_path(str(tmpdir))
+    )
+    config_loader.load_configuration(config_name="config", overrides=[])
+    history = {trace.filename: trace for trace in config_loader.get_load_history()}
+
+    db = history["db/mysql"]
+    assert db.schema_provider == "test"
+    assert db.lookup_time > 0 and db.load_time > 0
+    assert db.schema_merge_time > 0 and db.merge_time > 0
+    primary = history["config"]
+    assert primary.load_time > 0 and primary.merge_time > 0
+    assert primary.schema_merge_time == 0
+
+
+def test_default_group_tree() -> None:
+    # loaders implementing the interface without get_group_tree() get one built from their group listings
+    assert not getattr(ConfigLoader.get_group_tree, "__isabstractmethod__", False)
+    config_loader = ConfigLoaderImpl(
+        config_search_path=create_config_search_path(
+            "hydra/test_utils/configs/completion_test"
+        )
+    )
+    tree = ConfigLoader.get_group_tree(config_loader)
+    assert tree == config_loader.get_group_tree()
+    assert "group" in tree.list_all_config_groups()
+    assert "test_hydra/launcher" in tree.list_all_config_groups()
@@ -1,11 +1,18 @@
 # Copyright (c) Facebook, Inc. and its affiliates. All Rights Reserved
+import copy
+import os
+from pathlib import Path
 from typing import List, Optional
 
 import pytest
+from omegaconf import DictConfig, OmegaConf
 
 from hydra._internal.config_repository import ConfigRepository
 from hydra._internal.config_search_path_impl import ConfigSearchPathImpl
-from hydra._internal.core_plugins.file_config_source import FileConfigSource
+from hydra._internal.core_plugins.file_config_source import (
+    FileConfigSource,
+    ParsedConfigCache,
+)
 from hydra._internal.core_plugins.package_config_source import PackageConfigSource
 from hydra._internal.core_plugins.structured_config_source import StructuredConfigSource
 from hydra.core.object_type import ObjectType
@@ -90,3 +97,165 @@ class TestConfigRepository:
             group_name=config_path, results_filter=results_filter
         )
         assert ret == expected
+
+    def test_config_repository_group_tree(self, path: str) -> None:
+        repo = ConfigRepository(config_search_path=create_config_search_path(path))
+        tree = repo.get_group_tree()
+        assert tree.list_all_config_groups() == [
+            "dataset",
+            "level1/level2",
+            "optimizer",
+        ]
+        assert tree.list_all_config_groups("level1") == ["level1/level2"]
+        assert tree.get_group_options("level1/level2") == ["nested1", "nested2"]
+        assert tree.get_group_options("not_found") == []
+        # the snapshot is shared until a source changes
+        assert repo.get_group_tree() is tree
+
+
+def test_config_repository_group_tree_walks_sources_once(tmpdir: Path) -> None:
+    for file in ["config.yaml", "a/a1.yaml", "a/b/b1.yaml", "a/b/b2.yaml"]:
+        Path(tmpdir / file).parent.mkdir(parents=True, exist_ok=True)
+        OmegaConf.save(OmegaConf.create({}), str(tmpdir / file))
+    repo = ConfigRepository(config_search_path=create_config_search_path(str(tmpdir)))
+    source = repo.get_sources()[0]
+    listed: List[str] = []
+    list_impl = source.list
+
+    def list_and_record(
+        config_path: str, results_filter: Optional[ObjectType]
+    ) -> List[str]:
+        listed.append(config_path)
+        return list_impl(config_path, results_filter)
+
+    source.list = list_and_record  # type: ignore
+    repo.refresh()
+    assert repo.get_group_options("") == ["config"]
+    assert repo.get_group_options("a", ObjectType.GROUP) == ["b"]
+    assert repo.get_group_tree().list_all_config_groups() == ["a", "a/b"]
+    # configs and child groups of each group
+    assert sorted(listed) == ["", "", "a", "a", "a/b", "a/b"]
+
+    # no change, the snapshot is kept
+    repo.refresh()
+    assert repo.get_group_options("a/b") == ["b1", "b2"]
+    assert len(listed) == 6
+
+    OmegaConf.save(OmegaConf.create({}), str(tmpdir / "a" / "b" / "b3.yaml"))
+    repo.refresh()
+    assert repo.get_group_options("a/b") == ["b1", "b2", "b3"]
+    assert len(listed) == 12
+
+
+def test_config_repository_group_options_without_fingerprint(tmpdir: Path) -> None:
+    for file in ["config.yaml", "a/a1.yaml", "a/b/b1.yaml"]:
+        Path(tmpdir / file).parent.mkdir(parents=True, exist_ok=True)
+        OmegaConf.save(OmegaConf.create({}), str(tmpdir / file))
+    repo = ConfigRepository(config_search_path=create_config_search_path(str(tmpdir)))
+    source = repo.get_sources()[0]
+    listed: List[str] = []
+    list_impl = source.list
+
+    def list_and_record(
+        config_path: str, results_filter: Optional[ObjectType]
+    ) -> List[str]:
+        listed.append(config_path)
+        return list_impl(config_path, results_filter)
+
+    source.list = list_and_record  # type: ignore
+    source.fingerprint = lambda: None  # type: ignore
+    assert repo.refresh() is None
+    # only the requested group is listed, the other groups are not walked
+    assert repo.get_group_options("a") == ["a1"]
+    assert listed == ["a"]
+    assert repo.get_group_tree().list_all_config_groups() == ["a", "a/b"]
+
+
+def test_file_config_source_parsed_cache(tmpdir: Path) -> None:
+    cache = ParsedConfigCache()
+    cfg_file = str(tmpdir / "config.yaml")
+    assert cache.load(cfg_file) is None
+
+    OmegaConf.save(OmegaConf.create({"foo": 10}), cfg_file)
+    cfg1 = cache.load(cfg_file)
+    assert cfg1 == {"foo": 10}
+    assert cache.info() == (0, 1, 1)
+
+    # callers get their own copy
+    assert isinstance(cfg1, DictConfig)
+    cfg1.foo = 20
+    assert cache.load(cfg_file) == {"foo": 10}
+    assert cache.info() == (1, 1, 1)
+
+    # modified files are parsed again
+    OmegaConf.save(OmegaConf.create({"foo": 100}), cfg_file)
+    assert cache.load(cfg_file) == {"foo": 100}
+    assert cache.info() == (1, 2, 1)
+
+
+@pytest.mark.parametrize("use_index", [True, False])  # type: ignore
+def test_file_config_source_refresh(tmpdir: Path, use_index: bool) -> None:
+    src = FileConfigSource(provider="test", path=str(tmpdir), use_index=use_index)
+    assert not src.is_config("config")
+    assert not src.is_group("group")
+    assert src.list("", results_filter=None) == []
+
+    OmegaConf.save(OmegaConf.create({"foo": 10}), str(tmpdir / "config.yaml"))
+    (tmpdir / "group").mkdir()
+    assert src.is_config("config")
+    assert not src.is_group("config")
+    assert src.is_group("group")
+    assert not src.is_config("group/opt")
+    assert src.list("", results_filter=None) == ["config", "group"]
+
+    OmegaConf.save(OmegaConf.create({}), str(tmpdir / "group" / "opt.yaml"))
+    assert src.is_config("group/opt")
+    assert src.list("group", results_filter=ObjectType.CONFIG) == ["opt"]
+
+    os.remove(str(tmpdir / "config.yaml"))
+    assert not src.is_config("config")
+    assert src.list("", results_filter=None) == ["group"]
+
+
+def test_package_config_source_index() -> None:
+    src = PackageConfigSource(
+        provider="test", path="pkg://tests.test_apps.config_source_test.dir"
+    )
+    assert src.is_config("dataset/imagenet")
+    # packages on the file system are served from a directory index
+    index = src._get_index("tests.test_apps.config_source_test.dir")
+    assert index is not None
+    assert index.get_type("dataset") == ObjectType.GROUP
+    assert src._get_index("not_a_module") is None
+
+
+def test_config_repository_refresh(tmpdir: Path) -> None:
+    repo = ConfigRepository(config_search_path=create_config_search_path(str(tmpdir)))
+    repo.refresh()
+    assert not repo.exists("config.yaml")
+    assert repo.get_group_options("") == []
+
+    OmegaConf.save(OmegaConf.create({}), str(tmpdir / "config.yaml"))
+    # resolutions are kept until the repository is refreshed
+    assert not repo.exists("config.yaml")
+    assert repo.get_group_options("") == []
+    repo.refresh()
+    assert repo.exists("config.yaml")
+    assert repo.get_group_options("") == ["config"]
+
+    # no change, the index is kept
+    fingerprint = repo.refresh()
+    assert repo.refresh() == fingerprint
+    assert "config.yaml" in repo._resolved
+
+
+def test_parsed_config_cache_pickle(tmpdir: Path) -> None:
+    cache = ParsedConfigCache(max_size=10)
+    cfg_file = str(tmpdir / "config.yaml")
+    OmegaConf.save(OmegaConf.create({"foo": 10}), cfg_file)
+    cache.load(cfg_file)
+    # entries are not part of the pickled state
+    cache2 = copy.copy(cache)
+    assert cache2.max_size == 10
+    assert cache2.info() == (0, 0, 0)
+    assert cache2.load(cfg_file) == {"foo": 10}
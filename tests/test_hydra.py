@@ -1,4 +1,5 @@
 # Copyright (c) Facebook, Inc. and its affiliates. All Rights Reserved
+import json
 import os
 import subprocess
 import sys
@@ -401,6 +402,7 @@ def test_sweep_complex_defaults(
 --cfg,-c : Show config instead of running [job|hydra|all]
 --run,-r : Run a job
 --multirun,-m : Run multiple jobs with the configured launcher
+--resume : Resume the multirun in SWEEP_DIR, launching only the jobs that did not complete
 --shell_completion,-sc : Install or Uninstall shell completion:
     Install:
     eval "$(python examples/tutorial/1_simple_cli_app/my_app.py -sc install=SHELL_NAME)"
@@ -435,6 +437,7 @@ Overrides : Any key=value arguments to override config values (use dots for.nest
 --cfg,-c : Show config instead of running [job|hydra|all]
 --run,-r : Run a job
 --multirun,-m : Run multiple jobs with the configured launcher
+--resume : Resume the multirun in SWEEP_DIR, launching only the jobs that did not complete
 --shell_completion,-sc : Install or Uninstall shell completion:
     Install:
     eval "$(python examples/tutorial/1_simple_cli_app/my_app.py -sc install=SHELL_NAME)"
@@ -490,3 +493,61 @@ def test_sys_exit(tmpdir: Path) -> None:
         "hydra.run.dir=" + str(tmpdir),
     ]
     assert subprocess.run(cmd).returncode == 42
+
+
+@pytest.mark.parametrize("multirun", [False, True])  # type: ignore
+def test_async_app(tmpdir: Path, multirun: bool) -> None:
+    cmd = [
+        sys.executable,
+        "tests/test_apps/async_app/my_app.py",
+        "hydra.run.dir=" + str(tmpdir),
+        "hydra.sweep.dir=" + str(tmpdir),
+        "x=1",
+    ]
+    if multirun:
+        cmd[2:2] = ["-m", "hydra/launcher=asyncio"]
+    result = subprocess.check_output(cmd).decode("utf-8")
+    assert "x: 1" in result.splitlines()
+
+
+def test_import_hydra_is_lazy() -> None:
+    # importing hydra does not import the modules only needed to run an app
+    cmd = [
+        sys.executable,
+        "-c",
+        "import sys; import hydra; print(' '.join(sorted(sys.modules)))",
+    ]
+    modules = set(subprocess.check_output(cmd).decode("utf-8").split())
+    for module in [
+        "argparse",
+        "asyncio",
+        "logging.config",
+        "multiprocessing",
+        "pkg_resources",
+        "hydra.conf",
+        "hydra.core.utils",
+        "hydra._internal.utils",
+        "hydra._internal.hydra",
+    ]:
+        assert module not in modules
+
+
+def test_timings_file(task_runner: TTaskRunner, tmpdir: Path) -> None:  # noqa: F811
+    timings_file = Path(tmpdir) / "timings.json"
+    with task_runner(
+        calling_file=None,
+        calling_module="hydra.test_utils.a_module",
+        config_path="configs",
+        config_name="compose",
+        overrides=["hydra.timings_file={}".format(timings_file)],
+    ) as task:
+        assert task.job_ret is not None
+        assert set(task.job_ret.timings.keys()) == {"setup", "save_config"}
+
+    timings = json.loads(timings_file.read_text())
+    for stage in ["load_configuration", "run_job.setup", "run_job.save_config"]:
+        assert timings["stages"][stage]["count"] >= 1
+        assert timings["stages"][stage]["total"] > 0
+    configs = {config["filename"]: config for config in timings["configs"]}
+    assert configs["compose"]["provider"] == "main"
+    assert configs["compose"]["load_time"] > 0
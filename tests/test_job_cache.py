@@ -0,0 +1,106 @@
+# Copyright (c) Facebook, Inc. and its affiliates. All Rights Reserved
+import os
+from pathlib import Path
+from typing import Any, List
+
+from omegaconf import DictConfig, OmegaConf
+
+from hydra.core.job_cache import JobCache
+
+# noinspection PyUnresolvedReferences
+from hydra.test_utils.test_utils import TSweepRunner, sweep_runner  # noqa: F401
+
+
+def _job_config(cfg: Any, job_name: str = "app") -> DictConfig:
+    config = OmegaConf.create(cfg)
+    config.hydra = {"job": {"name": job_name}}
+    assert isinstance(config, DictConfig)
+    return config
+
+
+def test_cache_key(tmpdir: Path) -> None:
+    cache = JobCache(str(tmpdir))
+    key = cache.compute_key(_job_config({"a": 1, "b": {"c": 2}}))
+    assert cache.compute_key(_job_config({"b": {"c": 2}, "a": 1})) == key
+    assert cache.compute_key(_job_config({"a": 1, "b": {"c": 3}})) != key
+    # interpolations are resolved
+    assert cache.compute_key(_job_config({"a": 1, "b": {"c": 2}, "x": 2})) == (
+        cache.compute_key(_job_config({"a": 1, "b": {"c": "${x}"}, "x": 2}))
+    )
+    assert cache.compute_key(_job_config({"a": 1, "b": {"c": 2}}, "other")) != key
+    assert (
+        JobCache(str(tmpdir), "v2").compute_key(_job_config({"a": 1, "b": {"c": 2}}))
+        != key
+    )
+
+
+def test_cache_get_put(tmpdir: Path) -> None:
+    cache = JobCache(str(tmpdir))
+    config = _job_config({"a": 1})
+    assert cache.get(config) is None
+    assert cache.put(config, {"loss": 0.1}, "outputs/0")
+    cached = cache.get(config)
+    assert cached is not None
+    assert cached.return_value == {"loss": 0.1}
+    assert cached.working_dir == os.path.abspath("outputs/0")
+    assert cache.get(_job_config({"a": 2})) is None
+
+
+def test_cached_sweep(tmpdir: Path, sweep_runner: TSweepRunner) -> None:  # noqa: F811
+    calls: List[int] = []
+
+    def task(cfg: DictConfig) -> Any:
+        calls.append(cfg.bar)
+        return cfg.bar * 10
+
+    def run(*overrides: str) -> List[Any]:
+        sweep = sweep_runner(
+            calling_file=None,
+            calling_module="hydra.test_utils.a_module",
+            task_function=task,
+            config_path="configs",
+            config_name="compose",
+            overrides=[
+                "hydra.job_cache.enabled=true",
+                f"hydra.job_cache.dir={tmpdir}",
+                *overrides,
+            ],
+        )
+        with sweep:
+            assert sweep.returns is not None
+            return list(sweep.returns[0])
+
+    job_returns = run("bar=1,2,1")
+    assert calls == [1, 2]
+    assert [ret.return_value for ret in job_returns] == [10, 20, 10]
+    # the cached result points to the output directory of the job that computed it
+    assert job_returns[2].working_dir == os.path.abspath(
+        str(job_returns[0].working_dir)
+    )
+
+    calls.clear()
+    assert [ret.return_value for ret in run("bar=1,2,3")] == [10, 20, 30]
+    assert calls == [3]
+
+    calls.clear()
+    run("bar=1,2", "hydra.job_cache.code_version=2")
+    assert calls == [1, 2]
+
+
+def test_cache_disabled(tmpdir: Path, sweep_runner: TSweepRunner) -> None:  # noqa: F811
+    calls: List[int] = []
+
+    def task(cfg: DictConfig) -> Any:
+        calls.append(cfg.bar)
+
+    sweep = sweep_runner(
+        calling_file=None,
+        calling_module="hydra.test_utils.a_module",
+        task_function=task,
+        config_path="configs",
+        config_name="compose",
+        overrides=[f"hydra.job_cache.dir={tmpdir}", "bar=1,1"],
+    )
+    with sweep:
+        assert calls == [1, 1]
+    assert not os.listdir(str(tmpdir))
@@ -0,0 +1,113 @@
+# Copyright (c) Facebook, Inc. and its affiliates. All Rights Reserved
+import time
+from typing import Any, List
+
+import pytest
+from omegaconf import DictConfig
+
+from hydra.core.utils import JobReturn, JobStatus
+from hydra.errors import JobTimeoutError
+
+# noinspection PyUnresolvedReferences
+from hydra.test_utils.test_utils import TSweepRunner, sweep_runner  # noqa: F401
+from hydra.types import TaskFunction
+
+
+def _sweep(
+    sweep_runner: TSweepRunner, task: TaskFunction, *overrides: str  # noqa: F811
+) -> List[JobReturn]:
+    sweep = sweep_runner(
+        calling_file=None,
+        calling_module="hydra.test_utils.a_module",
+        task_function=task,
+        config_path="configs",
+        config_name="compose",
+        overrides=list(overrides),
+    )
+    with sweep:
+        assert sweep.returns is not None
+        return list(sweep.returns[0])
+
+
+def test_failures_raise_by_default(sweep_runner: TSweepRunner) -> None:  # noqa: F811
+    def task(cfg: DictConfig) -> Any:
+        raise ValueError("failed")
+
+    with pytest.raises(ValueError, match="failed"):
+        _sweep(sweep_runner, task, "bar=1,2")
+
+
+def test_catch_failures(sweep_runner: TSweepRunner) -> None:  # noqa: F811
+    def task(cfg: DictConfig) -> Any:
+        if cfg.bar == 2:
+            raise ValueError("bar is 2")
+        return cfg.bar
+
+    job_returns = _sweep(
+        sweep_runner, task, "hydra.job_execution.catch_failures=true", "bar=1,2,3"
+    )
+    assert [ret.status for ret in job_returns] == [
+        JobStatus.COMPLETED,
+        JobStatus.FAILED,
+        JobStatus.COMPLETED,
+    ]
+    assert [ret.return_value for ret in job_returns] == [1, None, 3]
+    failed = job_returns[1]
+    assert isinstance(failed.exception, ValueError)
+    assert failed.traceback is not None and "bar is 2" in failed.traceback
+    assert failed.overrides == ["bar=2"]
+    assert failed.working_dir is not None
+    assert all(ret.duration is not None for ret in job_returns)
+    assert job_returns[0].exception is None
+
+
+def test_retries(sweep_runner: TSweepRunner) -> None:  # noqa: F811
+    calls: List[int] = []
+
+    def task(cfg: DictConfig) -> Any:
+        calls.append(cfg.bar)
+        if calls.count(cfg.bar) < 3:
+            raise ValueError("flaky")
+        return cfg.bar
+
+    job_returns = _sweep(
+        sweep_runner,
+        task,
+        "hydra.job_execution.retries=2",
+        "hydra.job_execution.retry_delay=0",
+        "bar=1,2",
+    )
+    assert calls == [1, 1, 1, 2, 2, 2]
+    assert [ret.return_value for ret in job_returns] == [1, 2]
+
+    calls.clear()
+    with pytest.raises(ValueError, match="flaky"):
+        _sweep(
+            sweep_runner,
+            task,
+            "hydra.job_execution.retries=1",
+            "hydra.job_execution.retry_delay=0",
+            "bar=1",
+        )
+    assert calls == [1, 1]
+
+
+def test_timeout(sweep_runner: TSweepRunner) -> None:  # noqa: F811
+    def task(cfg: DictConfig) -> Any:
+        if cfg.bar == 2:
+            time.sleep(60)
+        return cfg.bar
+
+    start = time.time()
+    job_returns = _sweep(
+        sweep_runner,
+        task,
+        "hydra.job_execution.timeout=1",
+        "hydra.job_execution.catch_failures=true",
+        "bar=1,2",
+    )
+    assert time.time() - start < 30
+    assert job_returns[0].status == JobStatus.COMPLETED
+    assert job_returns[0].return_value == 1
+    assert job_returns[1].status == JobStatus.FAILED
+    assert isinstance(job_returns[1].exception, JobTimeoutError)
@@ -1,8 +1,12 @@
 # Copyright (c) Facebook, Inc. and its affiliates. All Rights Reserved
-from typing import List, Type
+import json
+import os
+from pathlib import Path
+from typing import Any, List, Type
 
 import pytest
 
+from hydra._internal import plugins_manifest
 from hydra.core.plugins import Plugins
 from hydra.plugins.launcher import Launcher
 from hydra.plugins.plugin import Plugin
@@ -12,7 +16,12 @@ from hydra.utils import get_class
 
 # This only test core plugins.
 # Individual plugins are responsible to test that they are discoverable.
-launchers = ["hydra._internal.core_plugins.basic_launcher.BasicLauncher"]
+launchers = [
+    "hydra._internal.core_plugins.basic_launcher.BasicLauncher",
+    "hydra._internal.core_plugins.process_pool_launcher.ProcessPoolLauncher",
+    "hydra._internal.core_plugins.threads_launcher.ThreadsLauncher",
+    "hydra._internal.core_plugins.asyncio_launcher.AsyncioLauncher",
+]
 sweepers = ["hydra._internal.core_plugins.basic_sweeper.BasicSweeper"]
 search_path_plugins: List[str] = []
 
@@ -31,3 +40,79 @@ def test_discover(plugin_type: Type[Plugin], expected: List[str]) -> None:
     expected_classes = [get_class(c) for c in sorted(expected)]
     for ex in expected_classes:
         assert ex in plugins
+
+
+def test_discover_is_memoized() -> None:
+    assert Plugins.discover(Launcher) == Plugins.discover(Launcher)
+    assert Plugins.discover(Launcher) is not Plugins.discover(Launcher)
+
+
+def test_discover_with_manifest(tmpdir: Path, monkeypatch: Any) -> None:
+    manifest_file = str(tmpdir / "plugins.json")
+    monkeypatch.setenv("HYDRA_PLUGINS_MANIFEST", manifest_file)
+    monkeypatch.setattr(Plugins, "_discovered", {})
+    # full scan, writes the manifest
+    plugins = Plugins.discover(Launcher)
+    assert os.path.exists(manifest_file)
+
+    monkeypatch.setattr(Plugins, "_discovered", {})
+    with open(manifest_file) as f:
+        manifest = json.load(f)
+    assert Plugins.discover(Launcher) == plugins
+    assert Plugins.discover(Sweeper) == [
+        p for p in Plugins.discover(Plugin) if issubclass(p, Sweeper)
+    ]
+
+    # a manifest that cannot be resolved falls back to a full scan
+    manifest["plugins"].append(
+        {
+            "module": "not_a_module",
+            "name": "Foo",
+            "types": [f"{Launcher.__module__}.{Launcher.__qualname__}"],
+        }
+    )
+    with open(manifest_file, "w") as f:
+        json.dump(manifest, f)
+    monkeypatch.setattr(Plugins, "_discovered", {})
+    assert Plugins.discover(Launcher) == plugins
+
+
+def test_manifest_is_opt_in(monkeypatch: Any) -> None:
+    monkeypatch.delenv("HYDRA_PLUGINS_MANIFEST", raising=False)
+    assert plugins_manifest.get_manifest_file() is None
+    monkeypatch.setenv("HYDRA_PLUGINS_MANIFEST", "0")
+    assert plugins_manifest.get_manifest_file() is None
+    monkeypatch.setenv("HYDRA_PLUGINS_MANIFEST", "/tmp/plugins.json")
+    assert plugins_manifest.get_manifest_file() == "/tmp/plugins.json"
+    monkeypatch.setenv("HYDRA_PLUGINS_MANIFEST", "1")
+    monkeypatch.setenv("XDG_CACHE_HOME", "/tmp/cache")
+    manifest_file = plugins_manifest.get_manifest_file()
+    assert manifest_file is not None
+    assert os.path.dirname(manifest_file) == os.path.join("/tmp/cache", "hydra")
+
+
+def test_manifest_key(tmpdir: Path) -> None:
+    site_dir = Path(str(tmpdir))
+    hydra_plugins = site_dir / "hydra_plugins"
+    installed = hydra_plugins / "installed_plugin"
+    editable = hydra_plugins / "editable_plugin"
+    installed.mkdir(parents=True)
+    editable.mkdir()
+    (installed / "__init__.py").write_text("")
+    (editable / "__init__.py").write_text("")
+    dist_info = site_dir / "installed_plugin-1.0.0.dist-info"
+    dist_info.mkdir()
+    paths = [str(hydra_plugins)]
+    key = plugins_manifest.compute_key(paths)
+    assert plugins_manifest.compute_key(paths) == key
+
+    # modules of installed distributions are not checked, their version is
+    (installed / "plugin.py").write_text("")
+    assert plugins_manifest.compute_key(paths) == key
+    dist_info.rename(site_dir / "installed_plugin-1.0.1.dist-info")
+    upgraded_key = plugins_manifest.compute_key(paths)
+    assert upgraded_key != key
+
+    # modules of plugins without a distribution version are
+    (editable / "plugin.py").write_text("")
+    assert plugins_manifest.compute_key(paths) != upgraded_key
@@ -0,0 +1,77 @@
+# Copyright (c) Facebook, Inc. and its affiliates. All Rights Reserved
+import pytest
+
+from hydra.test_utils.launcher_common_tests import (
+    IntegrationTestSuite,
+    LauncherTestSuite,
+)
+
+# noinspection PyUnresolvedReferences
+from hydra.test_utils.test_utils import TSweepRunner, sweep_runner  # noqa: F401
+
+
+@pytest.mark.parametrize(
+    "launcher_name, overrides",
+    [
+        ("process_pool", ["hydra.launcher.params.max_workers=2"]),
+        (
+            "process_pool",
+            [
+                "hydra.launcher.params.max_workers=1",
+                "hydra.launcher.params.max_tasks_per_child=1",
+            ],
+        ),
+    ],
+)
+class TestProcessPoolLauncher(LauncherTestSuite):
+    pass
+
+
+@pytest.mark.parametrize(
+    "task_launcher_cfg, extra_flags, plugin_module",
+    [
+        (
+            {
+                "defaults": [
+                    {"hydra/launcher": "process_pool"},
+                    {"hydra/hydra_logging": "hydra_debug"},
+                    {"hydra/job_logging": "disabled"},
+                ]
+            },
+            ["-m"],
+            "hydra._internal.core_plugins.process_pool_launcher",
+        )
+    ],
+)
+class TestProcessPoolLauncherIntegration(IntegrationTestSuite):
+    """
+    Run this launcher through the integration test suite.
+    """
+
+    pass
+
+
+def test_submit_keeps_job_order(sweep_runner: TSweepRunner) -> None:  # noqa: F811
+    sweep = sweep_runner(
+        calling_file=None,
+        calling_module="hydra.test_utils.a_module",
+        task_function=None,
+        config_path="configs",
+        config_name="compose",
+        overrides=[
+            "hydra/launcher=process_pool",
+            "hydra.launcher.params.max_workers=2",
+            "hydra.sweeper.params.max_batch_size=2",
+            "bar=1,2,3",
+        ],
+    )
+    with sweep:
+        assert sweep.returns is not None
+        assert [len(batch) for batch in sweep.returns] == [2, 1]
+        job_returns = [ret for batch in sweep.returns for ret in batch]
+        assert [ret.hydra_cfg.hydra.job.num for ret in job_returns] == ["0", "1", "2"]
+        assert [ret.overrides for ret in job_returns] == [
+            ["bar=1"],
+            ["bar=2"],
+            ["bar=3"],
+        ]
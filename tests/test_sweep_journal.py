@@ -0,0 +1,112 @@
+# Copyright (c) Facebook, Inc. and its affiliates. All Rights Reserved
+import json
+import logging
+import os
+import subprocess
+import sys
+from pathlib import Path
+from typing import Any
+
+from omegaconf import OmegaConf
+
+from hydra._internal.core_plugins.basic_launcher import BasicLauncher
+from hydra._internal.core_plugins.basic_sweeper import BasicSweeper
+from hydra.core.sweep_journal import COMPLETED, FAILED, SweepJournal, job_key
+
+# noinspection PyUnresolvedReferences
+from hydra.test_utils.test_utils import restore_singletons  # noqa: F401
+
+
+def test_journal(tmpdir: Path, caplog: Any) -> None:
+    journal = SweepJournal(str(tmpdir / "sweep" / "journal.jsonl"))
+    assert journal.load().overrides is None
+
+    journal.record_sweep(["hydra.sweep.dir=sweep", "a=1,2,3"])
+    journal.record_sweep(["ignored=1"])
+    journal.record_job(["a=1"], "0", COMPLETED, "sweep/0", {"loss": 0.5})
+    journal.record_job(["a=2"], "1", FAILED, "sweep/1")
+    with caplog.at_level(logging.WARNING):
+        journal.record_job(["a=3"], "2", COMPLETED, "sweep/2", object())
+    # not serializable return values are common, they are skipped quietly
+    assert caplog.text == ""
+    journal.record_job(["a=2"], "1", COMPLETED, "sweep/1", 2)
+    # a line written partially while the sweep was killed
+    with open(journal.path, "a") as f:
+        f.write('{"type": "job", "key": ')
+
+    state = journal.load()
+    assert state.overrides == ["hydra.sweep.dir=sweep", "a=1,2,3"]
+    assert len(state.jobs) == 3
+    entry = state.completed(["a=1"])
+    assert entry is not None
+    assert entry["working_dir"] == "sweep/0"
+    assert entry["return_value"] == {"loss": 0.5}
+    entry = state.completed(["a=2"])
+    assert entry is not None and entry["return_value"] == 2
+    entry = state.completed(["a=3"])
+    assert entry is not None and "return_value" not in entry
+    assert state.completed(["a=4"]) is None
+
+
+def test_job_key() -> None:
+    assert job_key(["a=1", "b=2"]) == job_key(("a=1", "b=2"))
+    assert job_key(["a=1", "b=2"]) != job_key(["a=1", "b=3"])
+
+
+def test_resume_sweep(tmpdir: Path) -> None:
+    tmpdir = Path(str(tmpdir))
+    app = os.path.abspath("tests/test_apps/resumable_sweep/my_app.py")
+    sweep_dir = tmpdir / "sweep"
+    cmd = [sys.executable, app, "-m", f"hydra.sweep.dir={sweep_dir}", "x=1,2,3,4"]
+    env = dict(os.environ, FAIL_AT="3")
+    ret = subprocess.run(cmd, cwd=str(tmpdir), env=env, stderr=subprocess.PIPE)
+    assert ret.returncode != 0
+    assert (tmpdir / "runs.txt").read_text().split() == ["1", "2", "3"]
+
+    entries = [
+        json.loads(line)
+        for line in (sweep_dir / "journal.jsonl").read_text().splitlines()
+    ]
+    assert [(e.get("overrides"), e.get("status")) for e in entries] == [
+        ([f"hydra.sweep.dir={sweep_dir}", "x=1,2,3,4"], None),
+        (["x=1"], COMPLETED),
+        (["x=2"], COMPLETED),
+        (["x=3"], FAILED),
+    ]
+
+    cmd = [sys.executable, app, "--resume", str(sweep_dir)]
+    env = dict(os.environ, FAIL_AT="")
+    subprocess.check_call(cmd, cwd=str(tmpdir), env=env)
+    # only the failed and the pending jobs were launched again
+    assert (tmpdir / "runs.txt").read_text().split() == ["1", "2", "3", "3", "4"]
+    # the jobs kept their job numbers
+    for num, x in enumerate(["1", "2", "3", "4"]):
+        overrides = (sweep_dir / str(num) / ".hydra" / "overrides.yaml").read_text()
+        assert f"x={x}" in overrides
+
+    state = SweepJournal(str(sweep_dir / "journal.jsonl")).load()
+    for value in [1, 2, 3, 4]:
+        entry = state.completed([f"x={value}"])
+        assert entry is not None
+        assert entry["return_value"] == value * 10
+
+
+def test_resume_warns_once_about_missing_return_values(
+    tmpdir: Path, caplog: Any, restore_singletons: Any  # noqa: F811
+) -> None:
+    journal = SweepJournal(str(tmpdir / "journal.jsonl"))
+    for num, x in enumerate(["1", "2", "3"]):
+        journal.record_job([f"x={x}"], num, COMPLETED, f"sweep/{num}", object())
+
+    sweeper = BasicSweeper()
+    sweeper.config = OmegaConf.create(
+        {"hydra": {"sweep": {"journal": journal.path}, "overrides": {"hydra": []}}}
+    )
+    sweeper.launcher = BasicLauncher()
+    sweeper.resume = True
+    with caplog.at_level(logging.WARNING):
+        returns = sweeper.sweep(arguments=["x=1,2,3"])
+    assert [ret.return_value for ret in returns[0]] == [None, None, None]
+    warnings = [r for r in caplog.records if r.levelno == logging.WARNING]
+    assert len(warnings) == 1
+    assert "return values of 3 completed jobs were not recorded" in warnings[0].message
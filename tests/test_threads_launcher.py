@@ -0,0 +1,139 @@
+# Copyright (c) Facebook, Inc. and its affiliates. All Rights Reserved
+import logging
+import os
+import threading
+from pathlib import Path
+from typing import Any, List
+
+import pytest
+from omegaconf import DictConfig
+
+from hydra.core.hydra_config import HydraConfig
+from hydra.test_utils.launcher_common_tests import (
+    IntegrationTestSuite,
+    LauncherTestSuite,
+)
+
+# noinspection PyUnresolvedReferences
+from hydra.test_utils.test_utils import TSweepRunner, sweep_runner  # noqa: F401
+
+log = logging.getLogger(__name__)
+
+
+@pytest.mark.parametrize(
+    "launcher_name, overrides",
+    [("threads", []), ("threads", ["hydra.launcher.params.max_workers=1"])],
+)
+class TestThreadsLauncher(LauncherTestSuite):
+    pass
+
+
+@pytest.mark.parametrize(
+    "task_launcher_cfg, extra_flags, plugin_module",
+    [
+        (
+            {
+                "defaults": [
+                    {"hydra/launcher": "threads"},
+                    {"hydra/hydra_logging": "hydra_debug"},
+                    {"hydra/job_logging": "disabled"},
+                ]
+            },
+            ["-m"],
+            "hydra._internal.core_plugins.threads_launcher",
+        )
+    ],
+)
+class TestThreadsLauncherIntegration(IntegrationTestSuite):
+    """
+    Run this launcher through the integration test suite.
+    """
+
+    @pytest.mark.skip(  # type: ignore
+        reason="The threads launcher does not change the working directory of jobs"
+    )
+    def test_custom_sweeper_run_workdir(
+        self, task_launcher_cfg: DictConfig, extra_flags: List[str], plugin_module: str,
+    ) -> None:
+        ...
+
+
+def test_concurrent_jobs_are_isolated(sweep_runner: TSweepRunner) -> None:  # noqa: F811
+    barrier = threading.Barrier(2, timeout=10)
+
+    def task(cfg: DictConfig) -> Any:
+        # both jobs are running at the same time past this point
+        barrier.wait()
+        num = HydraConfig.instance().hydra.job.num
+        log.info(f"message from job {num}")
+        barrier.wait()
+        return num, HydraConfig.instance().hydra.job.num, os.getcwd()
+
+    cwd = os.getcwd()
+    sweep = sweep_runner(
+        calling_file=None,
+        calling_module="hydra.test_utils.a_module",
+        task_function=task,
+        config_path="configs",
+        config_name="compose",
+        overrides=[
+            "hydra/launcher=threads",
+            "hydra.launcher.params.max_workers=2",
+            "bar=1,2",
+        ],
+    )
+    with sweep:
+        assert sweep.returns is not None
+        job_returns = sweep.returns[0]
+        assert [ret.return_value for ret in job_returns] == [
+            ("0", "0", cwd),
+            ("1", "1", cwd),
+        ]
+        for ret in job_returns:
+            num = ret.hydra_cfg.hydra.job.num
+            assert ret.working_dir is not None
+            job_dir = Path(ret.working_dir)
+            assert (job_dir / ".hydra" / "config.yaml").exists()
+            lines: List[str] = (
+                (job_dir / f"{ret.hydra_cfg.hydra.job.name}.log")
+                .read_text()
+                .splitlines()
+            )
+            assert len(lines) == 1
+            assert lines[0].endswith(f"message from job {num}")
+
+
+def test_sweeper_launches_jobs_as_slots_free_up(
+    sweep_runner: TSweepRunner,  # noqa: F811
+) -> None:
+    third_job_started = threading.Event()
+
+    def task(cfg: DictConfig) -> Any:
+        if cfg.bar == 3:
+            third_job_started.set()
+        if cfg.bar == 1:
+            # a straggler, the third job starts as soon as the second job completes
+            return third_job_started.wait(timeout=10)
+        return True
+
+    sweep = sweep_runner(
+        calling_file=None,
+        calling_module="hydra.test_utils.a_module",
+        task_function=task,
+        config_path="configs",
+        config_name="compose",
+        overrides=[
+            "hydra/launcher=threads",
+            "hydra.launcher.params.max_workers=2",
+            "hydra.sweeper.params.max_batch_size=2",
+            "bar=1,2,3,4,5",
+        ],
+    )
+    with sweep:
+        assert sweep.returns is not None
+        assert [len(batch) for batch in sweep.returns] == [2, 2, 1]
+        job_returns = [ret for batch in sweep.returns for ret in batch]
+        assert [ret.overrides for ret in job_returns] == [
+            [f"bar={bar}"] for bar in range(1, 6)
+        ]
+        assert all(ret.return_value for ret in job_returns)
@@ -1,4 +1,7 @@
 # Copyright (c) Facebook, Inc. and its affiliates. All Rights Reserved
+import logging
+import logging.handlers
+import pickle
 from pathlib import Path
 from typing import Any, Dict, Optional
 
@@ -9,6 +12,11 @@ import hydra._internal.utils as internal_utils
 from hydra import utils
 from hydra.conf import PluginConf
 from hydra.core.hydra_config import HydraConfig
+from hydra.core import utils as core_utils
+from hydra.core.utils import StageTimings
+
+# noinspection PyUnresolvedReferences
+from hydra.test_utils.test_utils import restore_singletons  # noqa: F401
 
 
 def some_method() -> int:
@@ -220,3 +228,84 @@ def test_to_absolute_path(orig_cwd: str, path: str, expected: str) -> None:
 )
 def test_get_column_widths(matrix: Any, expected: Any) -> None:
     assert internal_utils.get_column_widths(matrix) == expected
+
+
+def test_stage_timings(restore_singletons: Any) -> None:  # noqa: F811
+    timings = StageTimings.instance()
+    timings.record("test_stage", 1.0)
+    timings.record("test_stage", 3.0)
+    with timings.measure("test_measured"):
+        pass
+    stats = timings.get()
+    assert stats["test_stage"] == {"count": 2, "total": 4.0, "max": 3.0}
+    assert stats["test_measured"]["count"] == 1
+
+    # sent to worker processes with the singletons state
+    copied = pickle.loads(pickle.dumps(timings))
+    copied.record("test_stage", 1.0)
+    assert copied.get()["test_stage"]["count"] == 3
+
+
+def test_hydra_config_setter(restore_singletons: Any) -> None:  # noqa: F811
+    cfg = OmegaConf.create({"hydra": {"job": {"name": "foo"}}})
+    HydraConfig.instance().hydra = cfg.hydra
+    assert HydraConfig.instance().hydra.job.name == "foo"
+
+
+def test_job_log_handlers_from_config(tmpdir: Path) -> None:
+    config = OmegaConf.create(
+        {
+            "hydra": {
+                "job_logging": {
+                    "version": 1,
+                    "formatters": {"simple": {"format": "%(levelname)s %(message)s"}},
+                    "filters": {"named": {"name": "test_job_log"}},
+                    "handlers": {
+                        "console": {"class": "logging.StreamHandler"},
+                        "file": {
+                            "class": "logging.handlers.RotatingFileHandler",
+                            "formatter": "simple",
+                            "filters": ["named"],
+                            "filename": "job.log",
+                            "encoding": "utf-8",
+                            "maxBytes": 1000,
+                            "level": "INFO",
+                        },
+                    },
+                }
+            }
+        }
+    )
+    job = object()
+    (handler,) = core_utils._add_job_log_handlers(config, Path(str(tmpdir)), job)
+    logging.getLogger().removeHandler(handler)
+
+    def emit(name: str) -> None:
+        handler.handle(
+            logging.makeLogRecord(
+                {
+                    "name": name,
+                    "levelno": logging.WARNING,
+                    "levelname": "WARNING",
+                    "msg": name,
+                }
+            )
+        )
+
+    try:
+        assert isinstance(handler, logging.handlers.RotatingFileHandler)
+        assert handler.encoding == "utf-8"
+        assert handler.level == logging.INFO
+        assert handler.baseFilename == str(tmpdir / "job.log")
+        token = core_utils._current_job.set(job)
+        try:
+            emit("test_job_log")
+            # filtered by name
+            emit("other")
+        finally:
+            core_utils._current_job.reset(token)
+        # filtered by job
+        emit("test_job_log.other_job")
+    finally:
+        handler.close()
+    assert (tmpdir / "job.log").read_text("utf-8") == "WARNING test_job_log\n"
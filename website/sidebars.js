@@ -47,6 +47,8 @@ module.exports = {
             'configure_hydra/intro',
             'configure_hydra/logging',
             'configure_hydra/workdir',
+            'configure_hydra/job_cache',
+            'configure_hydra/job_execution',
             'configure_hydra/app_help',
         ],
 